@@ -0,0 +1,101 @@
+"""
+AutoMod checks/sec against the local mock Helix server: producer threads check chat messages one
+check_automod_status call each, then queue them on an AutoModChecker that packs them into batches. Reports
+messages/sec, p50/p99 latency from check to result and the number of calls each run made. Batched producers do not
+pace themselves, so their latency includes the time messages queue behind a saturated checker.
+
+Run from the panda-twitch directory:
+
+    python -m benchmarks.bench_automod --messages 20000 --producers 16 --latency 0.02
+"""
+import argparse
+import threading
+import time
+from concurrent.futures import Future, wait
+
+from benchmarks.bench_suite import make_client, percentile
+from benchmarks.mock_server import MockHelixServer
+from helix.automod import AutoModChecker
+from helix.transport import HelixTransport
+
+BROADCASTER_ID = "141981764"
+
+
+def run_producers(messages, producers, check):
+    """
+    :param check: Called with (msg_id, msg_text, user_id). Returns is_permitted, or a Future of it so the producer
+                  moves on to its next message the way a chat pipeline does.
+    :return: (elapsed seconds until every result is in, latencies)
+    """
+    latencies = []
+    futures = []
+    lock = threading.Lock()
+
+    def producer(offset):
+        samples = []
+        pending = []
+        for message in messages[offset::producers]:
+            start = time.perf_counter()
+            result = check(*message)
+            if isinstance(result, Future):
+                result.add_done_callback(lambda _, start=start: samples.append(time.perf_counter() - start))
+                pending.append(result)
+            else:
+                samples.append(time.perf_counter() - start)
+        wait(pending)
+        with lock:
+            latencies.extend(samples)
+            futures.extend(pending)
+
+    threads = [threading.Thread(target=producer, args=(offset,)) for offset in range(producers)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    for future in futures:
+        future.result()
+    return elapsed, latencies
+
+
+def report(name, count, elapsed, latencies, calls):
+    print(f"{name:<10}: {count / elapsed:10.1f} messages/sec   p50 {percentile(latencies, 0.5) * 1000:7.2f}ms   "
+          f"p99 {percentile(latencies, 0.99) * 1000:7.2f}ms   {calls} calls")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--messages", type=int, default=20000)
+    parser.add_argument("--producers", type=int, default=16, help="threads checking messages")
+    parser.add_argument("--latency", type=float, default=0.02, help="seconds the mock server delays every response")
+    parser.add_argument("--batch-size", type=int, default=100)
+    parser.add_argument("--max-latency", type=float, default=0.01, help="seconds a message waits for its batch")
+    parser.add_argument("--workers", type=int, default=4, help="batches sent at once")
+    args = parser.parse_args()
+
+    messages = [(f"msg-{index}", f"chat message number {index}", str(80000 + index % 500))
+                for index in range(args.messages)]
+
+    with MockHelixServer(latency=args.latency) as server, HelixTransport(pool_maxsize=args.producers) as transport:
+        moderation = make_client(server, transport).moderation
+
+        # one call per message; a tenth of the messages is enough to measure the rate.
+        single = messages[:max(args.producers, args.messages // 10)]
+        requests_before = server.stats["requests"]
+        elapsed, latencies = run_producers(
+            single, args.producers,
+            lambda msg_id, msg_text, user_id: moderation.check_automod_status(BROADCASTER_ID, msg_id, msg_text,
+                                                                              user_id).json()["data"][0])
+        report("single", len(single), elapsed, latencies, server.stats["requests"] - requests_before)
+
+        requests_before = server.stats["requests"]
+        with AutoModChecker(moderation, BROADCASTER_ID, batch_size=args.batch_size, max_latency=args.max_latency,
+                            max_workers=args.workers) as checker:
+            elapsed, latencies = run_producers(messages, args.producers, checker.check)
+        report("batched", len(messages), elapsed, latencies, server.stats["requests"] - requests_before)
+        print(f"checker   : {checker.stats}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""
+Decode time of 100 item get_streams pages: json.loads(response.text), response.json(), the standard library parsing
+the bytes and the default helix.decoder backend (orjson when installed).
+
+Run from the panda-twitch directory:
+
+    python -m benchmarks.bench_decoder --pages 2000
+"""
+import argparse
+import json
+import time
+
+from benchmarks.bench_models import make_pages
+from helix import decoder
+
+
+def measure(pages, decode):
+    start = time.perf_counter()
+    for response in pages:
+        decode(response)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, default=2000)
+    args = parser.parse_args()
+
+    pages = make_pages(args.pages)
+    runs = {
+        "json.loads(text)": lambda response: json.loads(response.text),
+        "response.json()": lambda response: response.json(),
+        "json.loads(bytes)": lambda response: json.loads(response.content),
+        f"helix.decoder ({decoder.get_decoder().__module__})": decoder.decode_response,
+    }
+    baseline = None
+    for name, decode in runs.items():
+        elapsed = measure(pages, decode)
+        baseline = baseline or elapsed
+        print(f"{name:<26}: {elapsed:8.3f}s   {args.pages / elapsed:10.0f} pages/sec   {baseline / elapsed:6.2f}x")
+
+
+if __name__ == "__main__":
+    main()
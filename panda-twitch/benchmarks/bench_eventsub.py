@@ -0,0 +1,113 @@
+"""
+Load test of EventSubReceiver: client threads fire signed stream.online notifications at a local receiver, a share of
+them redelivered, and retry the ones refused with a 503 the way Twitch does. Reports deliveries/sec, p50/p99 response
+latency and the receiver counters.
+
+Run from the panda-twitch directory:
+
+    python -m benchmarks.bench_eventsub --events 20000 --clients 16 --handler-ms 1
+"""
+import argparse
+import json
+import random
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+
+import requests
+
+from benchmarks.bench_suite import percentile
+from helix.eventsub import EventSubReceiver, NOTIFICATION, sign
+
+SECRET = "benchmark-secret"
+
+
+def make_message(index: int):
+    body = json.dumps({
+        "subscription": {"id": str(uuid.uuid4()), "type": "stream.online", "version": "1", "status": "enabled",
+                         "condition": {"broadcaster_user_id": str(10000 + index)},
+                         "created_at": "2020-10-18T14:12:06.123Z"},
+        "event": {"id": str(40000000000 + index), "broadcaster_user_id": str(10000 + index),
+                  "broadcaster_user_login": f"streamer_{index}", "type": "live",
+                  "started_at": "2020-10-18T14:12:06Z"},
+    }).encode()
+    message_id = str(uuid.uuid4())
+    timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+    headers = {
+        "Content-Type": "application/json",
+        "Twitch-Eventsub-Message-Id": message_id,
+        "Twitch-Eventsub-Message-Timestamp": timestamp,
+        "Twitch-Eventsub-Message-Signature": sign(SECRET, message_id, timestamp, body),
+        "Twitch-Eventsub-Message-Type": NOTIFICATION,
+        "Twitch-Eventsub-Subscription-Type": "stream.online",
+    }
+    return headers, body
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--events", type=int, default=20000)
+    parser.add_argument("--clients", type=int, default=16)
+    parser.add_argument("--workers", type=int, default=4, help="handler threads of the receiver")
+    parser.add_argument("--queue-size", type=int, default=256)
+    parser.add_argument("--handler-ms", type=float, default=1.0, help="milliseconds every handler call takes")
+    parser.add_argument("--duplicates", type=float, default=0.05, help="share of messages delivered twice")
+    args = parser.parse_args()
+
+    messages = [make_message(index) for index in range(args.events)]
+    messages += random.sample(messages, int(len(messages) * args.duplicates))
+    random.shuffle(messages)
+
+    handled = []
+    handler_seconds = args.handler_ms / 1000
+
+    def handler(notification):
+        time.sleep(handler_seconds)
+        handled.append(notification.message_id)
+
+    latencies = []
+    retries = [0]
+    lock = threading.Lock()
+
+    with EventSubReceiver(SECRET, port=0, workers=args.workers, queue_size=args.queue_size,
+                          enqueue_timeout=0.05) as receiver:
+        receiver.on("stream.online", handler)
+
+        def client(offset):
+            samples = []
+            refused = 0
+            with requests.Session() as session:
+                for headers, body in messages[offset::args.clients]:
+                    while True:
+                        start = time.perf_counter()
+                        status = session.post(receiver.url, data=body, headers=headers).status_code
+                        samples.append(time.perf_counter() - start)
+                        if status != 503:
+                            break
+                        refused += 1
+                        time.sleep(0.01)
+            with lock:
+                latencies.extend(samples)
+                retries[0] += refused
+
+        clients = [threading.Thread(target=client, args=(offset,)) for offset in range(args.clients)]
+        start = time.perf_counter()
+        for thread in clients:
+            thread.start()
+        for thread in clients:
+            thread.join()
+        receiver.join()
+        elapsed = time.perf_counter() - start
+        stats = dict(receiver.stats)
+
+    print(f"deliveries           : {len(latencies)} ({len(messages)} messages, {retries[0]} redelivered after 503)")
+    print(f"deliveries/sec       : {len(latencies) / elapsed:10.1f}")
+    print(f"latency              : p50 {percentile(latencies, 0.5) * 1000:.2f}ms   "
+          f"p99 {percentile(latencies, 0.99) * 1000:.2f}ms")
+    print(f"handled              : {len(handled)} of {args.events} unique events")
+    print(f"receiver             : {stats}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Memory per record and decode time of raw JSON dicts versus the typed __slots__ models, on 100 item get_streams pages.
+
+Run from the panda-twitch directory:
+
+    python -m benchmarks.bench_models --pages 500
+"""
+import argparse
+import gc
+import json
+import time
+import tracemalloc
+
+import requests
+
+from benchmarks import payloads
+from helix.models import Page, Stream
+
+
+def make_pages(count):
+    pages = []
+    for page in range(count):
+        body = {"data": [payloads.stream(page * 100 + index) for index in range(100)],
+                "pagination": {"cursor": f"cursor-{page}"}}
+        response = requests.Response()
+        response.status_code = 200
+        response.encoding = "utf-8"
+        response._content = json.dumps(body).encode()
+        pages.append(response)
+    return pages
+
+
+def measure(pages, keep):
+    """
+    :return: (bytes held per record, seconds spent decoding)
+    """
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    records = [record for response in pages for record in keep(response)]
+    elapsed = time.perf_counter() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current / len(records), elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, default=500)
+    args = parser.parse_args()
+
+    pages = make_pages(args.pages)
+    dict_bytes, dict_time = measure(pages, lambda response: response.json()["data"])
+    model_bytes, model_time = measure(pages, lambda response: Page(response, Stream).data)
+
+    print(f"records               : {args.pages * 100}")
+    print(f"dict    bytes/record  : {dict_bytes:10.0f}   decode {dict_time:.3f}s")
+    print(f"Stream  bytes/record  : {model_bytes:10.0f}   decode {model_time:.3f}s")
+    print(f"memory saved          : {1 - model_bytes / dict_bytes:10.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+"""
+Regression benchmarks of the resource call path against the local mock Helix server: calls/sec and p50/p99 latency of
+get_streams, memory held per page of records, full-crawl time of the paginated endpoints, and a crawl with injected
+429s. Results are printed and written as JSON so runs can be compared.
+
+Run from the panda-twitch directory:
+
+    python -m benchmarks.bench_suite --calls 2000 --pages 50 --output results.json
+"""
+import argparse
+import gc
+import json
+import platform
+import statistics
+import sys
+import threading
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+from benchmarks.mock_server import MockHelixServer
+from helix.client import TwitchClient
+from helix.coalesce import SingleFlight
+from helix.ratelimit import RateLimiter
+from helix.retry import RetryPolicy
+from helix.scopes import MODERATION_READ
+from helix.transport import HelixTransport
+
+
+def make_client(server, transport):
+    # the scopes are the client's own, the process wide used_scopes stay untouched.
+    client = TwitchClient("client-id", "secret", token="token", transport=transport,
+                          rate_limiter=RateLimiter(limit=1000000), single_flight=SingleFlight(),
+                          retry=RetryPolicy(max_attempts=10, base_delay=0.001), scopes=[MODERATION_READ])
+    for name in ("streams", "users", "clips", "moderation", "entitlements"):
+        getattr(client, name).base_url = server.base_url
+    return client
+
+
+def percentile(samples, fraction):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def bench_throughput(client, calls, threads):
+    """
+    get_streams calls spread over threads. Every call asks for a different user so none of them are coalesced.
+    """
+    latencies = []
+    lock = threading.Lock()
+
+    def worker(offset):
+        samples = []
+        for index in range(offset, calls, threads):
+            start = time.perf_counter()
+            client.streams.get_streams(user_id=str(index), first=100).raise_for_status()
+            samples.append(time.perf_counter() - start)
+        with lock:
+            latencies.extend(samples)
+
+    workers = [threading.Thread(target=worker, args=(offset,)) for offset in range(threads)]
+    start = time.perf_counter()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    return {
+        "calls": calls,
+        "threads": threads,
+        "calls_per_sec": calls / elapsed,
+        "p50_ms": percentile(latencies, 0.50) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000,
+        "mean_ms": statistics.fmean(latencies) * 1000,
+    }
+
+
+def bench_memory(client, pages):
+    """
+    Bytes held per page of 100 Stream records, pages and records kept alive.
+    """
+    gc.collect()
+    tracemalloc.start()
+    held = list(client.streams._pages(client.streams.get_streams, first=100))
+    for page in held:
+        page.data
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"pages": len(held), "bytes_per_page": current / len(held), "peak_bytes": peak}
+
+
+def bench_crawls(client):
+    """
+    Time to walk every page of each paginated endpoint.
+    """
+    crawls = {
+        "streams": lambda: client.streams.iter_streams(),
+        "users_follows": lambda: client.users.iter_users_follows(to_id="10000"),
+        "clips": lambda: client.clips.iter_clips(broadcaster_id="10000"),
+        "banned_users": lambda: client.moderation.iter_banned_users(broadcaster_id="10000"),
+        "drops_entitlements": lambda: client.entitlements.iter_drops_entitlements(),
+    }
+    results = {}
+    for name, crawl in crawls.items():
+        start = time.perf_counter()
+        items = sum(1 for _ in crawl())
+        elapsed = time.perf_counter() - start
+        results[name] = {"items": items, "seconds": elapsed, "items_per_sec": items / elapsed}
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=2000, help="get_streams calls of the throughput run")
+    parser.add_argument("--threads", type=int, default=8, help="threads of the throughput run")
+    parser.add_argument("--pages", type=int, default=50, help="pagination depth of every endpoint")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds the mock server delays every response")
+    parser.add_argument("--throttle-every", type=int, default=10,
+                        help="every nth request of the 429 run is a 429, capped at --pages so every run sees one")
+    parser.add_argument("--output", help="write the results as JSON to this file")
+    args = parser.parse_args()
+
+    results = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "config": vars(args),
+    }
+
+    with MockHelixServer(latency=args.latency, pages=args.pages) as server, HelixTransport() as transport:
+        client = make_client(server, transport)
+        results["throughput"] = bench_throughput(client, args.calls, args.threads)
+        results["memory"] = bench_memory(client, args.pages)
+        results["crawl"] = bench_crawls(client)
+
+    # a crawl makes at least one request per page, so a 429 is injected however short it is.
+    pages = max(2, args.pages)
+    throttle_every = max(2, min(args.throttle_every, pages))
+    results["throttled_crawl_config"] = {"pages": pages, "throttle_every": throttle_every}
+    with MockHelixServer(latency=args.latency, pages=pages, throttle_every=throttle_every) as server, \
+            HelixTransport() as transport:
+        client = make_client(server, transport)
+        start = time.perf_counter()
+        items = sum(1 for _ in client.users.iter_users_follows(to_id="10000"))
+        results["throttled_crawl"] = {"items": items, "seconds": time.perf_counter() - start, **server.stats}
+
+    throughput = results["throughput"]
+    print(f"get_streams          : {throughput['calls_per_sec']:10.1f} calls/sec   "
+          f"p50 {throughput['p50_ms']:.2f}ms   p99 {throughput['p99_ms']:.2f}ms")
+    print(f"memory per page      : {results['memory']['bytes_per_page']:10.0f} bytes")
+    for name, crawl in results["crawl"].items():
+        print(f"crawl {name:<15.15}: {crawl['seconds']:10.3f}s   {crawl['items']} items")
+    throttled = results["throttled_crawl"]
+    print(f"crawl with 429s      : {throttled['seconds']:10.3f}s   {throttled['throttled']} of "
+          f"{throttled['requests']} requests throttled")
+
+    if args.output:
+        with open(args.output, "w") as output:
+            json.dump(results, output, indent=2)
+
+
+if __name__ == "__main__":
+    main()
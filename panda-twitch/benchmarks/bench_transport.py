@@ -0,0 +1,54 @@
+"""
+Calls/sec of TwitchStreams.get_streams with a fresh connection per call versus the pooled HelixTransport.
+
+Run from the panda-twitch directory:
+
+    python -m benchmarks.bench_transport --calls 2000
+"""
+import argparse
+import time
+
+import requests
+
+from benchmarks.mock_server import MockHelixServer
+from helix.resources.streams import TwitchStreams
+from helix.transport import HelixTransport
+
+
+class UnpooledTransport(HelixTransport):
+    """
+    Module level requests calls, which is what every resource did before the shared transport.
+    """
+
+    def request(self, method: str, url: str, **kwargs):
+        kwargs.setdefault("timeout", self.timeout)
+        return requests.request(method, url, **kwargs)
+
+
+def run(transport, base_url, calls):
+    streams = TwitchStreams("client-id", "secret", token="token", transport=transport)
+    streams.base_url = base_url
+
+    start = time.perf_counter()
+    for _ in range(calls):
+        streams.get_streams(first=100)
+    return calls / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=2000)
+    args = parser.parse_args()
+
+    with MockHelixServer() as server:
+        before = run(UnpooledTransport(), server.base_url, args.calls)
+        with HelixTransport() as transport:
+            after = run(transport, server.base_url, args.calls)
+
+    print(f"requests.get per call : {before:10.1f} calls/sec")
+    print(f"pooled HelixTransport : {after:10.1f} calls/sec")
+    print(f"speedup               : {after / before:10.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs
+
+from benchmarks import payloads
+
+# record generator of every mocked endpoint, keyed by path relative to /helix.
+ROUTES = {
+    "/streams": payloads.stream,
+    "/users": payloads.user,
+    "/users/follows": payloads.follow,
+    "/clips": payloads.clip,
+    "/videos": payloads.video,
+    "/moderation/banned": payloads.banned_user,
+    "/moderation/moderators": payloads.moderator,
+    "/entitlements/drops": payloads.entitlement,
+}
+
+# result generator of every mocked POST endpoint, called with each item of the data array of the request body.
+POST_ROUTES = {
+    "/moderation/enforcements/status": payloads.automod_status,
+}
+
+
+class MockHelixHandler(BaseHTTPRequestHandler):
+    # keep-alive needs HTTP/1.1, the default HTTP/1.0 closes the socket after every response.
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def _reply(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        request_body = self.rfile.read(length) if length else b""
+
+        server = self.server
+        if server.latency:
+            time.sleep(server.latency)
+
+        status, body = server.respond(self.command, self.path, request_body)
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in server.rate_limit_headers(status).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _reply
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _MockHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, latency, pages, page_size, throttle_every, rate_limit):
+        super().__init__(address, MockHelixHandler)
+        self.latency = latency
+        self.pages = pages
+        self.page_size = page_size
+        self.throttle_every = throttle_every
+        self.rate_limit = rate_limit
+        self.requests = 0
+        self.throttled = 0
+        self._bodies = {}
+        self._lock = threading.Lock()
+
+    def respond(self, method: str, target: str, request_body: bytes = b""):
+        """
+        :return: (status, encoded body) of a request.
+        """
+        with self._lock:
+            self.requests += 1
+            throttle = self.throttle_every and self.requests % self.throttle_every == 0
+            if throttle:
+                self.throttled += 1
+        if throttle:
+            return 429, b'{"error":"Too Many Requests","status":429,"message":"Request limit exceeded"}'
+
+        url = urlsplit(target)
+        path = url.path[len("/helix"):] if url.path.startswith("/helix") else url.path
+        if method == "POST" and path in POST_ROUTES:
+            items = json.loads(request_body or b"{}").get("data") or []
+            return 200, json.dumps({"data": [POST_ROUTES[path](item) for item in items]}).encode()
+
+        make = ROUTES.get(path)
+        if method != "GET" or make is None:
+            return 200, b'{"data":[],"pagination":{}}'
+
+        query = parse_qs(url.query)
+        cursor = (query.get("after") or query.get("cursor") or [""])[0]
+        page = int(cursor[len("cursor-"):]) if cursor.startswith("cursor-") else 0
+        key = (path, page)
+        body = self._bodies.get(key)
+        if body is None:
+            start = page * self.page_size
+            document = {"data": [make(index) for index in range(start, start + self.page_size)], "pagination": {}}
+            if page + 1 < self.pages:
+                document["pagination"]["cursor"] = f"cursor-{page + 1}"
+            body = self._bodies[key] = json.dumps(document).encode()
+        return 200, body
+
+    def rate_limit_headers(self, status: int):
+        reset = int(time.time()) + (0 if status == 429 else 60)
+        remaining = 0 if status == 429 else self.rate_limit - 1
+        return {"Ratelimit-Limit": str(self.rate_limit), "Ratelimit-Remaining": str(remaining),
+                "Ratelimit-Reset": str(reset)}
+
+
+class MockHelixServer(object):
+    """
+    Local in-process Helix stand in, served from a background thread. GETs of the endpoints in ROUTES return
+    page_size realistic records per page and follow after/cursor pagination for the given number of pages, POSTs of
+    the endpoints in POST_ROUTES answer every item of the request body, any other request gets an empty data array.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, latency: float = 0.0, pages: int = 1,
+                 page_size: int = 100, throttle_every: int = 0, rate_limit: int = 1000000):
+        """
+        :param latency: Seconds every response is delayed by.
+        :param pages: Pages of each paginated endpoint before the cursor runs out.
+        :param page_size: Records per page.
+        :param throttle_every: Answer every nth request with a 429. 0 never throttles.
+        :param rate_limit: Ratelimit-Limit reported to the client.
+        """
+        self.httpd = _MockHTTPServer((host, port), latency, pages, page_size, throttle_every, rate_limit)
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def base_url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/helix"
+
+    @property
+    def stats(self):
+        """
+        :return: requests served and how many of them were throttled.
+        """
+        return {"requests": self.httpd.requests, "throttled": self.httpd.throttled}
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.httpd.shutdown()
+        self.httpd.server_close()
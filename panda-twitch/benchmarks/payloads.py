@@ -0,0 +1,115 @@
+"""
+Realistic Helix records for the benchmarks and the mock server.
+"""
+import random
+
+LANGUAGES = ["en", "es", "de", "fr", "pt", "ru", "ko", "ja"]
+GAMES = [str(game_id) for game_id in (509658, 21779, 33214, 32982, 516575, 27471, 18122, 29595)]
+
+
+def stream(index: int):
+    return {
+        "id": str(40000000000 + index),
+        "user_id": str(10000 + index),
+        "user_name": f"streamer_{index}",
+        "game_id": GAMES[index % len(GAMES)],
+        "type": "live",
+        "title": f"Stream number {index} - come hang out, chill vibes and ranked games all night",
+        "viewer_count": random.randint(0, 50000),
+        "started_at": "2020-10-18T14:12:06Z",
+        "language": LANGUAGES[index % len(LANGUAGES)],
+        "thumbnail_url": f"https://static-cdn.jtvnw.net/previews-ttv/live_user_streamer_{index}-{{width}}x{{height}}.jpg",
+        "tag_ids": ["6ea6bca4-4712-4ab9-a906-e3336a9d8039"],
+    }
+
+
+def user(index: int):
+    return {
+        "id": str(10000 + index),
+        "login": f"user_{index}",
+        "display_name": f"User_{index}",
+        "type": "",
+        "broadcaster_type": "affiliate" if index % 3 else "",
+        "description": "Just a streamer streaming streams.",
+        "profile_image_url": f"https://static-cdn.jtvnw.net/jtv_user_pictures/user_{index}-profile_image-300x300.png",
+        "offline_image_url": "",
+        "view_count": random.randint(0, 1000000),
+        "created_at": "2016-12-14T20:32:28Z",
+    }
+
+
+def follow(index: int, to_id: str = "10000"):
+    return {
+        "from_id": str(20000 + index),
+        "from_name": f"follower_{index}",
+        "to_id": to_id,
+        "to_name": "streamer",
+        "followed_at": "2020-10-18T08:56:35Z",
+    }
+
+
+def clip(index: int, game_id: str = None, created_at: str = "2020-10-18T01:53:55Z"):
+    return {
+        "id": f"AwkwardHelplessSalamanderSwiftRage{index}",
+        "url": f"https://clips.twitch.tv/AwkwardHelplessSalamanderSwiftRage{index}",
+        "embed_url": f"https://clips.twitch.tv/embed?clip=AwkwardHelplessSalamanderSwiftRage{index}",
+        "broadcaster_id": str(10000 + index % 50),
+        "broadcaster_name": f"streamer_{index % 50}",
+        "creator_id": str(30000 + index),
+        "creator_name": f"clipper_{index}",
+        "video_id": "",
+        "game_id": game_id or GAMES[index % len(GAMES)],
+        "language": LANGUAGES[index % len(LANGUAGES)],
+        "title": f"unbelievable play #{index}",
+        "view_count": random.randint(0, 100000),
+        "created_at": created_at,
+        "thumbnail_url": f"https://clips-media-assets.twitch.tv/{index}-preview-480x272.jpg",
+    }
+
+
+def video(index: int):
+    return {
+        "id": str(700000000 + index),
+        "user_id": str(10000 + index % 50),
+        "user_name": f"streamer_{index % 50}",
+        "title": f"Past broadcast {index}",
+        "description": "",
+        "created_at": "2020-10-17T22:10:00Z",
+        "published_at": "2020-10-17T22:10:00Z",
+        "url": f"https://www.twitch.tv/videos/{700000000 + index}",
+        "thumbnail_url": "",
+        "viewable": "public",
+        "view_count": random.randint(0, 10000),
+        "language": LANGUAGES[index % len(LANGUAGES)],
+        "type": "archive",
+        "duration": "3h8m33s",
+    }
+
+
+def banned_user(index: int):
+    return {
+        "user_id": str(50000 + index),
+        "user_name": f"banned_{index}",
+        "expires_at": "" if index % 4 else "2020-10-19T10:00:00Z",
+    }
+
+
+def moderator(index: int):
+    return {
+        "user_id": str(60000 + index),
+        "user_name": f"moderator_{index}",
+    }
+
+
+def entitlement(index: int):
+    return {
+        "id": f"fb78259e-fb81-4d1b-8333-{index:012d}",
+        "timestamp": "2020-10-18T13:23:50.121Z",
+        "user_id": str(70000 + index),
+        "game_id": GAMES[index % len(GAMES)],
+    }
+
+
+def automod_status(message: dict):
+    # every seventh message is held back, the way AutoMod flags a share of real chat.
+    return {"msg_id": message.get("msg_id"), "is_permitted": len(message.get("msg_text") or "") % 7 != 0}
@@ -0,0 +1,469 @@
+import asyncio
+import time
+from urllib.parse import urlencode
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from helix.api import HelixApi, _lookup_chunks, _merge_responses
+from helix.client import TwitchClient, _Resource
+from helix.endpoints import Endpoint
+from helix.models import Page
+from helix.retry import raise_for_response
+from helix.tokens import TokenManager, REVOKE_URL
+from helix.resources.analytics import TwitchAnalytics
+from helix.resources.bits import TwitchBits
+from helix.resources.channels import TwitchChannels
+from helix.resources.clips import TwitchClips
+from helix.resources.entitlements import TwitchEntitlements
+from helix.resources.extensions import TwitchExtensions
+from helix.resources.games import TwitchGames
+from helix.resources.hypetrain import TwitchHypeTrain
+from helix.resources.moderation import TwitchModeration
+from helix.resources.search import TwitchSearch
+from helix.resources.streams import TwitchStreams
+from helix.resources.subscriptions import TwitchSubscriptions
+from helix.resources.users import TwitchUsers
+from helix.resources.videos import TwitchVideos
+from helix.resources.webhooks import TwitchWebHooks
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+# connection failures worth another attempt.
+_RETRY_ERRORS = (asyncio.TimeoutError,) if aiohttp is None else (asyncio.TimeoutError, aiohttp.ClientConnectionError)
+
+
+def _encode_pairs(values):
+    """
+    Flattens a params/data dict the same way requests does: None values are dropped and iterables become repeated keys.
+
+    :param values: dict or list of key/value pairs.
+    :return: list of (key, str) tuples.
+    """
+    pairs = []
+    items = values.items() if isinstance(values, dict) else values
+    for key, value in items:
+        if isinstance(value, (str, bytes)) or not hasattr(value, "__iter__"):
+            value = [value]
+        for item in value:
+            if item is not None:
+                pairs.append((key, item.decode() if isinstance(item, bytes) else str(item)))
+    return pairs
+
+
+class AsyncHelixTransport(object):
+    """
+    Pooled aiohttp transport for AsyncHelixApi. Responses are returned as requests.Response objects so the sync and
+    async clients hand back the same shapes. An aiohttp session only works on the loop it was created on, so every
+    event loop, e.g. each asyncio.run, gets its own session.
+    """
+    _default = None
+
+    def __init__(self, pool_size: int = 100, pool_size_per_host: int = 0, keepalive_timeout: float = 15.0,
+                 timeout: float = 10.0, connect_timeout: float = None):
+        """
+        :param pool_size: Maximum number of simultaneous connections across all hosts.
+        :param pool_size_per_host: Maximum number of simultaneous connections per host. 0 means no per host limit.
+        :param keepalive_timeout: Seconds an idle connection is kept open for reuse.
+        :param timeout: Read timeout in seconds.
+        :param connect_timeout: Connect timeout in seconds. Defaults to the read timeout.
+        """
+        if aiohttp is None:
+            raise ImportError("AsyncHelixTransport requires aiohttp. Install it with: pip install aiohttp")
+
+        self.pool_size = pool_size
+        self.pool_size_per_host = pool_size_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.timeout = aiohttp.ClientTimeout(sock_connect=connect_timeout or timeout, sock_read=timeout)
+        # sessions keyed by the loop they are bound to, created on the first request of each loop.
+        self._sessions = {}
+
+    @classmethod
+    def default(cls):
+        """
+        Returns the process wide transport used by every AsyncHelixApi that was not given one explicitly.
+
+        :return: AsyncHelixTransport
+        """
+        if cls._default is None:
+            cls._default = cls()
+        return cls._default
+
+    @property
+    def session(self):
+        """
+        Session of the running loop, or None if it has none yet.
+        """
+        try:
+            return self._sessions.get(asyncio.get_running_loop())
+        except RuntimeError:
+            return None
+
+    def _session(self):
+        loop = asyncio.get_running_loop()
+        session = self._sessions.get(loop)
+        if session is None or session.closed:
+            # sessions of loops that have been closed cannot be used or awaited any more, they are only dropped.
+            for stale in [other for other in self._sessions if other.is_closed()]:
+                self._sessions.pop(stale).detach()
+            connector = aiohttp.TCPConnector(limit=self.pool_size, limit_per_host=self.pool_size_per_host,
+                                             keepalive_timeout=self.keepalive_timeout)
+            session = self._sessions[loop] = aiohttp.ClientSession(connector=connector, timeout=self.timeout)
+        return session
+
+    async def request(self, method: str, url: str, params=None, data=None, headers=None, timeout=None, **kwargs):
+        """
+        Sends a request over the pooled session.
+
+        :param method: HTTP method.
+        :param url: Full URL of the request.
+        :param params: Query string parameters, encoded like requests does.
+        :param data: Form body, encoded like requests does.
+        :param headers: Request headers.
+        :param timeout: Total timeout in seconds for this request.
+        :param kwargs: Any other keyword argument accepted by aiohttp.ClientSession.request
+        :return: requests.Response
+        """
+        headers = dict(headers or {})
+        if params is not None:
+            params = _encode_pairs(params)
+        if isinstance(data, (dict, list, tuple)):
+            data = urlencode(_encode_pairs(data))
+            headers.setdefault("Content-Type", "application/x-www-form-urlencoded")
+        if timeout is not None:
+            kwargs["timeout"] = aiohttp.ClientTimeout(total=timeout)
+
+        async with self._session().request(method, url, params=params, data=data, headers=headers,
+                                           **kwargs) as resp:
+            content = await resp.read()
+
+        response = requests.Response()
+        response.status_code = resp.status
+        response.reason = resp.reason
+        response.headers = CaseInsensitiveDict(resp.headers)
+        response.url = str(resp.url)
+        response.encoding = resp.get_encoding() if content else None
+        response._content = content
+        return response
+
+    async def get(self, url: str, **kwargs):
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs):
+        return await self.request("POST", url, **kwargs)
+
+    async def put(self, url: str, **kwargs):
+        return await self.request("PUT", url, **kwargs)
+
+    async def patch(self, url: str, **kwargs):
+        return await self.request("PATCH", url, **kwargs)
+
+    async def delete(self, url: str, **kwargs):
+        return await self.request("DELETE", url, **kwargs)
+
+    async def close(self):
+        """
+        Closes every pooled connection of the running loop.
+
+        :return: None
+        """
+        session = self._sessions.pop(asyncio.get_running_loop(), None)
+        if session is not None:
+            await session.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+
+class AsyncHelixApi(HelixApi):
+    """
+    asyncio flavour of HelixApi. Resource methods take the same arguments as the sync client and return awaitables
+    that resolve to the same requests.Response and Page objects, and the iter_* methods return async generators.
+    """
+
+    def __init__(self, client_id, secret_id, token=None, transport: AsyncHelixTransport = None, **kwargs):
+        # the token manager refreshes from a background thread, so it keeps the sync transport.
+        kwargs.setdefault("token_manager", TokenManager(client_id, secret_id, token))
+        super().__init__(client_id, secret_id, token, transport=transport or AsyncHelixTransport.default(), **kwargs)
+
+    @property
+    def token(self):
+        # never refreshes on the event loop, _request refreshes an expired token in an executor first.
+        return self.token_manager.current
+
+    @token.setter
+    def token(self, token):
+        self.token_manager.set_token(token)
+
+    async def _refresh_token(self):
+        if self.token_manager.expired:
+            await asyncio.get_running_loop().run_in_executor(None, self.token_manager.refresh)
+
+    async def _request(self, method: str, url: str, pooled: bool = False, **kwargs):
+        await self._refresh_token()
+        if not pooled and "headers" in kwargs:
+            # the headers were laid out before the refresh.
+            kwargs["headers"] = self._auth_headers()
+        token = None if pooled else self.token
+        key = None
+        if self.cache is not None:
+            key, cached = self.cache.lookup(method, self._path(url), kwargs.get("params"), self._credentials(token),
+                                            self.base_url)
+            if cached is not None:
+                if self.metrics is not None:
+                    self.metrics.cache_hit(method, self._path(url))
+                return cached
+
+        if method == "GET" and self.single_flight is not None:
+            response = await self.single_flight.do_async(self._flight_key(url, kwargs, token),
+                                                          lambda: self._send_with_retry(method, url, pooled, **kwargs))
+        else:
+            response = await self._send_with_retry(method, url, pooled, **kwargs)
+
+        if key is not None:
+            self.cache.store(key, response)
+        return response
+
+    async def _send_with_retry(self, method: str, url: str, pooled: bool = False, **kwargs):
+        retry = self.retry
+        started = time.monotonic()
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                response = await self._send(method, url, pooled, **kwargs)
+            except _RETRY_ERRORS:
+                delay = retry.backoff(method, attempt, started)
+                if delay is None:
+                    raise
+            else:
+                delay = retry.backoff(method, attempt, started, response)
+                if delay is None:
+                    break
+            if self.metrics is not None:
+                self.metrics.retry(method, self._path(url))
+            await asyncio.sleep(delay)
+        return response
+
+    async def _send(self, method: str, url: str, pooled: bool = False, **kwargs):
+        credential = None
+        if pooled:
+            credential, kwargs["headers"], delay = await self.credential_pool.checkout_async()
+            limiter = credential.rate_limiter
+        else:
+            limiter = self.rate_limiter
+            delay = limiter.reserve()
+        if delay:
+            await asyncio.sleep(delay)
+
+        metrics = self.metrics
+        if metrics is not None:
+            sent = time.perf_counter()
+        try:
+            response = await self.transport.request(method, url, **kwargs)
+        except Exception:
+            limiter.update()
+            if credential is not None:
+                await self.credential_pool.release_async(credential)
+            if metrics is not None:
+                metrics.request(method, self._path(url), 0, time.perf_counter() - sent, 0)
+            raise
+        limiter.update(response)
+        if credential is not None:
+            await self.credential_pool.release_async(credential, response)
+        if metrics is not None:
+            metrics.request(method, self._path(url), response.status_code, time.perf_counter() - sent,
+                            len(response.content or b""))
+            metrics.rate_budget(limiter.budget)
+        return response
+
+    async def _call(self, endpoint: Endpoint, **arguments):
+        response = await self._request(endpoint.method, self.base_url + endpoint.path,
+                                       **self._prepare(endpoint, arguments))
+        return Page(response, endpoint.model) if endpoint.model is not None else response
+
+    async def _pages(self, method, cursor_param: str = "after", **kwargs):
+        while True:
+            page = await method(**kwargs)
+            if not isinstance(page, Page):
+                page = Page(page)
+            raise_for_response(page.response)
+            yield page
+
+            if not page.cursor or not page.data:
+                return
+            kwargs[cursor_param] = page.cursor
+
+    async def _paginate(self, method, max_items: int = None, cursor_param: str = "after", **kwargs):
+        if max_items is not None and max_items <= 0:
+            return
+        count = 0
+        async for page in self._pages(method, cursor_param, **kwargs):
+            for item in page.data:
+                yield item
+                count += 1
+                if count == max_items:
+                    return
+
+    async def _fan_out(self, method, lookups, **kwargs):
+        pairs, chunks = _lookup_chunks(lookups)
+        semaphore = asyncio.Semaphore(self.max_workers)
+
+        async def fetch(chunk):
+            async with semaphore:
+                return await method(**kwargs, **chunk)
+
+        responses = await asyncio.gather(*[fetch(chunk) for chunk in chunks])
+        return _merge_responses(lookups, pairs, responses)
+
+    async def get_oauth_token(self, scope_list=None):
+        # the token manager owns the token request and its bookkeeping, both clients fetch through it.
+        if scope_list is not None:
+            self.token_manager.scope_list = scope_list
+        return await asyncio.get_running_loop().run_in_executor(None, self.token_manager.fetch)
+
+    get_oauth_token.__doc__ = HelixApi.get_oauth_token.__doc__
+
+    async def revoke_oauth_token(self, current_oauth):
+        params = {
+            "client_id": self.client_id,
+            "token": current_oauth
+        }
+
+        await self.transport.post(REVOKE_URL, params=params)
+        if current_oauth == self.token_manager.current:
+            self.token_manager.set_token(None)
+
+    revoke_oauth_token.__doc__ = HelixApi.revoke_oauth_token.__doc__
+
+    async def generate_new_token(self, current_oauth=None):
+        return await asyncio.get_running_loop().run_in_executor(None, self.token_manager.refresh)
+
+    generate_new_token.__doc__ = HelixApi.generate_new_token.__doc__
+
+    async def validate_token(self, force: bool = False):
+        return await asyncio.get_running_loop().run_in_executor(None, self.token_manager.validate, force)
+
+    validate_token.__doc__ = HelixApi.validate_token.__doc__
+
+    async def close(self):
+        """
+        Closes the transport this client uses.
+
+        :return: None
+        """
+        await self.transport.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+
+class AsyncTwitchAnalytics(AsyncHelixApi, TwitchAnalytics):
+    pass
+
+
+class AsyncTwitchBits(AsyncHelixApi, TwitchBits):
+    pass
+
+
+class AsyncTwitchChannels(AsyncHelixApi, TwitchChannels):
+    pass
+
+
+class AsyncTwitchClips(AsyncHelixApi, TwitchClips):
+    pass
+
+
+class AsyncTwitchEntitlements(AsyncHelixApi, TwitchEntitlements):
+    pass
+
+
+class AsyncTwitchExtensions(AsyncHelixApi, TwitchExtensions):
+    pass
+
+
+class AsyncTwitchGames(AsyncHelixApi, TwitchGames):
+    pass
+
+
+class AsyncTwitchHypeTrain(AsyncHelixApi, TwitchHypeTrain):
+    pass
+
+
+class AsyncTwitchModeration(AsyncHelixApi, TwitchModeration):
+    pass
+
+
+class AsyncTwitchSearch(AsyncHelixApi, TwitchSearch):
+    pass
+
+
+class AsyncTwitchStreams(AsyncHelixApi, TwitchStreams):
+    pass
+
+
+class AsyncTwitchSubscriptions(AsyncHelixApi, TwitchSubscriptions):
+    pass
+
+
+class AsyncTwitchUsers(AsyncHelixApi, TwitchUsers):
+    pass
+
+
+class AsyncTwitchVideos(AsyncHelixApi, TwitchVideos):
+    pass
+
+
+class AsyncTwitchWebHooks(AsyncHelixApi, TwitchWebHooks):
+    pass
+
+
+class AsyncTwitchClient(TwitchClient):
+    """
+    asyncio flavour of TwitchClient, exposing the AsyncTwitch* resources over one shared AsyncHelixTransport.
+    """
+    analytics = _Resource(AsyncTwitchAnalytics)
+    bits = _Resource(AsyncTwitchBits)
+    channels = _Resource(AsyncTwitchChannels)
+    clips = _Resource(AsyncTwitchClips)
+    entitlements = _Resource(AsyncTwitchEntitlements)
+    extensions = _Resource(AsyncTwitchExtensions)
+    games = _Resource(AsyncTwitchGames)
+    hype_train = _Resource(AsyncTwitchHypeTrain)
+    moderation = _Resource(AsyncTwitchModeration)
+    search = _Resource(AsyncTwitchSearch)
+    streams = _Resource(AsyncTwitchStreams)
+    subscriptions = _Resource(AsyncTwitchSubscriptions)
+    users = _Resource(AsyncTwitchUsers)
+    videos = _Resource(AsyncTwitchVideos)
+    webhooks = _Resource(AsyncTwitchWebHooks)
+
+    def _default_transport(self):
+        return AsyncHelixTransport.default()
+
+    def _default_token_manager(self, client_id, secret_id, token):
+        # the token manager refreshes from a background thread, so it keeps the sync transport.
+        return TokenManager(client_id, secret_id, token)
+
+    async def close(self):
+        """
+        Closes the transport shared by the resources.
+
+        :return: None
+        """
+        await self.transport.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
@@ -1,35 +1,407 @@
-import requests
 import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from helix.cache import ResponseCache, _normalize
+from helix.coalesce import SingleFlight
+from helix.decoder import decode_response
+from helix.credentials import CredentialPool
+from helix.endpoints import Endpoint, AUTH_MESSAGES, OAUTH
+from helix.metrics import Metrics
+from helix.exceptions import TwitchAuthenticationException, TwitchScopeMissingException
+from helix.models import Page
+from helix.ratelimit import RateLimiter
+from helix.retry import RetryPolicy, DEFAULT_RETRY, raise_for_response
+from helix.scopes import used_scopes
+from helix.tokens import TokenManager, REVOKE_URL
+from helix.transport import HelixTransport
+
+# most Helix lookups accept at most 100 ids or logins per request.
+MAX_IDS_PER_REQUEST = 100
+
+
+def _as_list(values):
+    if values is None:
+        return []
+    if isinstance(values, (str, bytes, int)):
+        return [values]
+    return list(values)
+
+
+def _lookup_values(values):
+    """
+    Materializes an id/login argument once, so generators survive being counted and sent, and drops repeated values.
+    Logins are case-insensitive, so values are compared lowercased.
+
+    :return: None, a single value as is, or a deduped list in input order.
+    """
+    if values is None or isinstance(values, (str, bytes, int)):
+        return values
+    unique = []
+    seen = set()
+    for value in values:
+        key = str(value).lower()
+        if key not in seen:
+            seen.add(key)
+            unique.append(value)
+    return unique
+
+
+def _exceeds_batch(*values):
+    """
+    :return: True if the combined id/login arguments are more than a single request accepts.
+    """
+    return sum(len(_as_list(value)) for value in values) > MAX_IDS_PER_REQUEST
+
+
+def _lookup_chunks(lookups):
+    """
+    Dedupes the values of every lookup and splits them into request sized chunks.
+
+    :param lookups: (param, response_key, values) tuples, e.g. ("user_id", "id", ids)
+    :return: (ordered list of (param, value) pairs, list of chunk kwargs)
+    """
+    pairs = []
+    seen = set()
+    for param, _, values in lookups:
+        for value in _as_list(values):
+            value = str(value)
+            if (param, value.lower()) not in seen:
+                seen.add((param, value.lower()))
+                pairs.append((param, value))
+
+    chunks = []
+    for start in range(0, len(pairs), MAX_IDS_PER_REQUEST):
+        chunk = {}
+        for param, value in pairs[start:start + MAX_IDS_PER_REQUEST]:
+            chunk.setdefault(param, []).append(value)
+        chunks.append(chunk)
+    return pairs, chunks
+
+
+def _merge_responses(lookups, pairs, responses):
+    """
+    Merges the data arrays of chunked responses into a single response, ordered like the input values.
+
+    :return: requests.Response, or a Page if the chunks were pages. The first failed chunk response is returned as is.
+    """
+    for response in responses:
+        if not response.ok:
+            return response
+
+    keys = {param: key for param, key, _ in lookups}
+    found = {}
+    for response in responses:
+        for item in (response.body if isinstance(response, Page) else decode_response(response))["data"]:
+            for param, key in keys.items():
+                if item.get(key) is not None:
+                    found.setdefault((param, str(item[key]).lower()), []).append(item)
+
+    data = []
+    used = set()
+    for param, value in pairs:
+        for item in found.get((param, value.lower()), ()):
+            if id(item) not in used:
+                used.add(id(item))
+                data.append(item)
+
+    merged = requests.Response()
+    merged.status_code = responses[0].status_code
+    merged.reason = responses[0].reason
+    merged.headers = responses[-1].headers
+    merged.url = responses[0].url
+    merged.encoding = "utf-8"
+    merged._content = json.dumps({"data": data}).encode()
+    if isinstance(responses[0], Page):
+        return Page(merged, responses[0].model)
+    return merged
 
 
 class HelixApi(object):
-    def __init__(self, client_id, secret_id, token=None):
+    def __init__(self, client_id, secret_id, token=None, transport: HelixTransport = None, max_workers: int = 8,
+                 rate_limiter: RateLimiter = None, cache: ResponseCache = None, token_manager: TokenManager = None,
+                 retry: RetryPolicy = None, single_flight: SingleFlight = None, metrics: Metrics = None,
+                 credential_pool: CredentialPool = None, scopes=None):
         # sets the base url for the api
         self.base_url = "https://api.twitch.tv/helix"
         # set the applications client_id
         self.client_id = client_id
         # set the application secrete id.
         self.secret_id = secret_id
-        # Set the oauth token if it is already in out config file.
-        self.token = token
+        # pooled keep-alive transport, shared by every resource unless one is given.
+        self.transport = transport or HelixTransport.default()
+        # Set the oauth token if it is already in out config file. The manager keeps it fresh.
+        self.token_manager = token_manager or TokenManager(client_id, secret_id, token, transport=self.transport)
+        # maximum number of chunks of a large id lookup that are requested at once.
+        self.max_workers = max_workers
+        # token bucket throttling our calls, shared by every resource with the same credentials unless one is given.
+        self._rate_limiter = rate_limiter
+        # opt-in response cache for slow changing endpoints.
+        self.cache = cache
+        # backoff and time budget for transient failures. RetryPolicy(max_attempts=1) turns retries off.
+        self.retry = retry or DEFAULT_RETRY
+        # identical GETs in flight at the same time share one call. Set to None to send every call.
+        self.single_flight = single_flight or SingleFlight.default()
+        # opt-in instrumentation of the request path.
+        self.metrics = metrics
+        # optional pool of app credentials that app token requests are spread over.
+        self.credential_pool = credential_pool
+        # scopes the token was granted, checked before a call is sent. Defaults to the process wide used_scopes.
+        self.scopes = used_scopes if scopes is None else scopes
+        # auth headers are rebuilt only when the token changes.
+        self._headers_token = None
+        self._headers = None
+
+    @property
+    def token(self):
+        return self.token_manager.token
+
+    @token.setter
+    def token(self, token):
+        self.token_manager.set_token(token)
+
+    @property
+    def rate_limiter(self):
+        # a user token counts against the application's bucket until validate() learns whose it is.
+        return self._rate_limiter or RateLimiter.for_credentials(self.client_id, self.token_manager.user_id)
+
+    @property
+    def rate_limit_budget(self):
+        """
+        Current rate limit budget of these credentials, for planning bulk work.
+
+        :return: RateLimitBudget(limit, remaining, reset)
+        """
+        return self.rate_limiter.budget
+
+    def _auth_headers(self):
+        token = self.token
+        if self._headers is None or token != self._headers_token:
+            self._headers = {
+                "Authorization": f"Bearer {token}",
+                "Client-Id": f"{self.client_id}",
+            }
+            self._headers_token = token
+        return self._headers
+
+    def _pooled(self, endpoint: Endpoint):
+        """
+        :return: True if calls to the endpoint are sent with a credential of the pool: it needs no user token or scope.
+        """
+        return self.credential_pool is not None and endpoint.auth != OAUTH and endpoint.scope is None
+
+    def _authorize(self, endpoint: Endpoint):
+        """
+        Checks the token and scope an endpoint needs before anything is sent.
+
+        :param endpoint: Endpoint being called.
+        :return: None
+        """
+        if endpoint.auth is not None and self.token is None and not self._pooled(endpoint):
+            raise TwitchAuthenticationException(AUTH_MESSAGES[endpoint.auth])
+        if endpoint.scope is not None and endpoint.scope not in self.scopes:
+            raise TwitchScopeMissingException(f"You are missing the required scope for this function. "
+                                              f"Scope Needed: {endpoint.scope}")
+
+    def _prepare(self, endpoint: Endpoint, arguments: dict):
+        """
+        Checks auth and scope, then lays the method arguments out as query string and JSON body the way the endpoint
+        describes them.
+
+        :return: keyword arguments for _request
+        """
+        self._authorize(endpoint)
+        # pooled calls get the headers of the credential picked for each attempt.
+        kwargs = {"pooled": True} if self._pooled(endpoint) else {"headers": self._auth_headers()}
+        if endpoint.params:
+            kwargs["params"] = endpoint.query(arguments)
+        if endpoint.body:
+            kwargs["json"] = endpoint.json(arguments)
+        return kwargs
+
+    def _call(self, endpoint: Endpoint, **arguments):
+        """
+        Dispatches a call to a declared endpoint.
+
+        :param endpoint: Endpoint from helix.endpoints
+        :param arguments: Method arguments, keyed by argument name. None values are left out of the request.
+        :return: requests.Response, or a Page of model records if the endpoint declares a model.
+        """
+        response = self._request(endpoint.method, self.base_url + endpoint.path, **self._prepare(endpoint, arguments))
+        return Page(response, endpoint.model) if endpoint.model is not None else response
+
+    def _request(self, method: str, url: str, pooled: bool = False, **kwargs):
+        """
+        Sends a request through the shared transport. Every resource call goes through here. Identical GETs in flight
+        at the same time share one call, and transient failures are retried as the retry policy allows; if they
+        persist the last response is returned, or the connection error raised.
+
+        :param method: HTTP method.
+        :param url: Full URL of the request.
+        :param pooled: Send it with a credential of the credential pool instead of this client's token.
+        :return: requests.Response
+        """
+        # pooled requests are keyed by the pool: public data is the same whichever of its credentials fetched it.
+        token = None if pooled else self.token
+        key = None
+        if self.cache is not None:
+            key, cached = self.cache.lookup(method, self._path(url), kwargs.get("params"), self._credentials(token),
+                                            self.base_url)
+            if cached is not None:
+                if self.metrics is not None:
+                    self.metrics.cache_hit(method, self._path(url))
+                return cached
+
+        if method == "GET" and self.single_flight is not None:
+            response = self.single_flight.do(self._flight_key(url, kwargs, token),
+                                             lambda: self._send_with_retry(method, url, pooled, **kwargs))
+        else:
+            response = self._send_with_retry(method, url, pooled, **kwargs)
+
+        if key is not None:
+            self.cache.store(key, response)
+        return response
+
+    def _credentials(self, token):
+        # whose credentials send a request: the token, or the credential pool for pooled requests.
+        return self.client_id, token if token is not None else id(self.credential_pool)
+
+    def _flight_key(self, url: str, kwargs: dict, token):
+        # the coalescer can be process wide, so the key holds the full url and the credentials.
+        return (url, _normalize(kwargs.get("params"))) + self._credentials(token)
+
+    def _send_with_retry(self, method: str, url: str, pooled: bool = False, **kwargs):
+        """
+        Sends a request, retrying transient failures as the retry policy allows.
+
+        :return: requests.Response
+        """
+        retry = self.retry
+        started = time.monotonic()
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                response = self._send(method, url, pooled, **kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                delay = retry.backoff(method, attempt, started)
+                if delay is None:
+                    raise
+            else:
+                delay = retry.backoff(method, attempt, started, response)
+                if delay is None:
+                    break
+            if self.metrics is not None:
+                self.metrics.retry(method, self._path(url))
+            time.sleep(delay)
+        return response
+
+    def _send(self, method: str, url: str, pooled: bool = False, **kwargs):
+        """
+        Sends a single attempt, throttled by the rate limiter of the credential it is sent with.
+
+        :return: requests.Response
+        """
+        credential = None
+        if pooled:
+            credential, kwargs["headers"], delay = self.credential_pool.checkout()
+            limiter = credential.rate_limiter
+        else:
+            limiter = self.rate_limiter
+            delay = limiter.reserve()
+        if delay:
+            time.sleep(delay)
+
+        metrics = self.metrics
+        if metrics is not None:
+            sent = time.perf_counter()
+        try:
+            response = self.transport.request(method, url, **kwargs)
+        except Exception:
+            limiter.update()
+            if credential is not None:
+                self.credential_pool.release(credential)
+            if metrics is not None:
+                metrics.request(method, self._path(url), 0, time.perf_counter() - sent, 0)
+            raise
+        limiter.update(response)
+        if credential is not None:
+            self.credential_pool.release(credential, response)
+        if metrics is not None:
+            metrics.request(method, self._path(url), response.status_code, time.perf_counter() - sent,
+                            len(response.content or b""))
+            metrics.rate_budget(limiter.budget)
+        return response
+
+    def _path(self, url: str):
+        return url[len(self.base_url):] if url.startswith(self.base_url) else url
+
+    def _pages(self, method, cursor_param: str = "after", **kwargs):
+        """
+        Calls a cursor based resource method until Twitch stops returning a cursor.
+
+        :param method: Bound resource method, e.g. self.get_streams
+        :param cursor_param: Name of the method's forward cursor argument.
+        :param kwargs: Arguments passed to every call of the method.
+        :return: Generator of Page objects.
+        """
+        while True:
+            page = method(**kwargs)
+            if not isinstance(page, Page):
+                page = Page(page)
+            raise_for_response(page.response)
+            yield page
+
+            if not page.cursor or not page.data:
+                return
+            kwargs[cursor_param] = page.cursor
+
+    def _paginate(self, method, max_items: int = None, cursor_param: str = "after", **kwargs):
+        """
+        Lazily yields every item of a cursor based resource method, one page in memory at a time.
+
+        :param method: Bound resource method, e.g. self.get_streams
+        :param max_items: Stop after this many items. Default: every item.
+        :param cursor_param: Name of the method's forward cursor argument.
+        :param kwargs: Arguments passed to every call of the method.
+        :return: Generator of items from the data array of each page, as model records where the endpoint has one.
+        """
+        if max_items is not None and max_items <= 0:
+            return
+        count = 0
+        for page in self._pages(method, cursor_param, **kwargs):
+            for item in page.data:
+                yield item
+                count += 1
+                if count == max_items:
+                    return
+
+    def _fan_out(self, method, lookups, **kwargs):
+        """
+        Splits an id/login lookup that is larger than one request into deduped 100 value chunks and requests them
+        concurrently.
+
+        :param method: Bound resource method, called once per chunk.
+        :param lookups: (param, response_key, values) tuples, e.g. ("user_id", "id", ids)
+        :param kwargs: Arguments passed to every call of the method.
+        :return: requests.Response with the merged data array, ordered like the input values.
+        """
+        pairs, chunks = _lookup_chunks(lookups)
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(chunks)) or 1) as executor:
+            responses = list(executor.map(lambda chunk: method(**kwargs, **chunk), chunks))
+        return _merge_responses(lookups, pairs, responses)
 
     def get_oauth_token(self, scope_list=None):
         """
-        Generate OAuth token for twitch.
+        Generate OAuth token for twitch. Its expiry is recorded and it is refreshed in the background before it expires.
 
         :return: OAuth token to the app. It is saved into the Applications config file.
         """
-        params = {
-            "client_id": self.client_id,
-            "client_secret": self.secret_id,
-            "grant_type": "client_credentials",
-            "scope": scope_list
-        }
-
-        oauth_response = requests.post("https://id.twitch.tv/oauth2/token", params)
-        jd = json.loads(oauth_response.text)
-        self.token = jd["access_token"]
-        return self.token
+        if scope_list is not None:
+            self.token_manager.scope_list = scope_list
+        return self.token_manager.fetch()
 
     def revoke_oauth_token(self, current_oauth):
         """
@@ -44,14 +416,24 @@ class HelixApi(object):
             "token": current_oauth
         }
         
-        revoke = requests.post("https://id.twitch.tv/oauth2/revoke", params=params)
+        self.transport.post(REVOKE_URL, params=params)
+        if current_oauth == self.token_manager.current:
+            self.token_manager.set_token(None)
 
-    def generate_new_token(self, current_oauth):
+    def generate_new_token(self, current_oauth=None):
         """
-        Generates new OAuth token after it expires after 60 days.
+        Generates new OAuth token after it expires. Concurrent callers share a single refresh.
 
-        :param current_oauth: OAuth token to refresh.
+        :param current_oauth: OAuth token to refresh. Default: the current token.
         :return: New OAuth token.
         """
-        # TODO: Should the main app check the days or should we store information via this library?
-        pass
+        return self.token_manager.refresh()
+
+    def validate_token(self, force: bool = False):
+        """
+        Validates the current token. The result is cached, so this is cheap to call on hot paths.
+
+        :param force: Ask Twitch even if a cached result is still fresh.
+        :return: client_id, login, scopes, user_id, expires_in
+        """
+        return self.token_manager.validate(force)
@@ -0,0 +1,152 @@
+import queue
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from helix.decoder import decode_response
+from helix.exceptions import PandaTwitchException
+from helix.retry import raise_for_response
+
+MAX_AUTOMOD_BATCH = 100
+
+
+class AutoModChecker(object):
+    """
+    Checks chat messages against a channel's AutoMod settings in batches. Producers on any thread queue single
+    messages and get a Future back; a dispatcher thread packs them into one check_automod_statuses call as soon as a
+    batch is full or the oldest queued message has waited max_latency, and the results are routed back by msg_id.
+    """
+
+    def __init__(self, moderation, broadcaster_id: str, batch_size: int = MAX_AUTOMOD_BATCH,
+                 max_latency: float = 0.05, max_workers: int = 4, queue_size: int = 10000):
+        """
+        :param moderation: TwitchModeration authorized as the broadcaster, with the moderation:read scope.
+        :param broadcaster_id: Channel the messages are checked for.
+        :param batch_size: Messages per call. Helix takes at most MAX_AUTOMOD_BATCH.
+        :param max_latency: Seconds a message may wait for its batch to fill up.
+        :param max_workers: Batches sent at once.
+        :param queue_size: Messages waiting for a batch before check blocks.
+        """
+        if not 0 < batch_size <= MAX_AUTOMOD_BATCH:
+            raise ValueError(f"batch_size must be between 1 and {MAX_AUTOMOD_BATCH}.")
+        self.moderation = moderation
+        self.broadcaster_id = broadcaster_id
+        self.batch_size = batch_size
+        self.max_latency = max_latency
+        self.stats = {"messages": 0, "batches": 0, "errors": 0}
+
+        # the queue itself is unbounded: check waits for a free slot before taking the lock, so the lock is never
+        # held while blocked, and the dispatcher waits for a free worker before it takes the next batch.
+        self._queue = queue.Queue()
+        self._slots = threading.BoundedSemaphore(queue_size)
+        self._workers = threading.BoundedSemaphore(max_workers)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._lock = threading.Lock()
+        self._closed = False
+        self._thread = threading.Thread(target=self._dispatch, daemon=True)
+        self._thread.start()
+
+    def check(self, msg_id: str, msg_text: str, user_id: str, callback=None):
+        """
+        Queues one message.
+
+        :param msg_id: Caller generated id the result is mapped back by.
+        :param msg_text: Message text.
+        :param user_id: User id of the sender.
+        :param callback: Called with the Future once the result is in.
+        :return: Future of is_permitted.
+        """
+        future = Future()
+        if callback is not None:
+            future.add_done_callback(callback)
+        self._slots.acquire()
+        # checked and queued under the lock close() takes, so nothing is queued behind the stop marker.
+        with self._lock:
+            if self._closed:
+                self._slots.release()
+                raise RuntimeError("The checker is closed.")
+            self._queue.put_nowait((msg_id, msg_text, user_id, future))
+        return future
+
+    def _take(self, timeout=None):
+        message = self._queue.get(timeout=timeout)
+        if message is not None:
+            self._slots.release()
+        return message
+
+    def _dispatch(self):
+        while True:
+            self._workers.acquire()
+            message = self._take()
+            if message is None:
+                self._workers.release()
+                return
+            batch = [message]
+            deadline = time.monotonic() + self.max_latency
+            closing = False
+            while len(batch) < self.batch_size:
+                try:
+                    message = self._take(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+                if message is None:
+                    closing = True
+                    break
+                batch.append(message)
+            self._executor.submit(self._send, batch)
+            if closing:
+                return
+
+    def _send(self, batch):
+        try:
+            self._check(batch)
+        finally:
+            self._workers.release()
+
+    def _check(self, batch):
+        futures = {}
+        for msg_id, _, _, future in batch:
+            futures.setdefault(msg_id, []).append(future)
+        try:
+            response = self.moderation.check_automod_statuses(
+                self.broadcaster_id, [(msg_id, msg_text, user_id) for msg_id, msg_text, user_id, _ in batch])
+            raise_for_response(response)
+            results = decode_response(response).get("data") or []
+        except Exception as e:
+            with self._lock:
+                self.stats["batches"] += 1
+                self.stats["errors"] += 1
+            for msg_id, _, _, future in batch:
+                future.set_exception(e)
+            return
+
+        with self._lock:
+            self.stats["batches"] += 1
+            self.stats["messages"] += len(batch)
+        for result in results:
+            for future in futures.pop(result.get("msg_id"), ()):
+                future.set_result(result.get("is_permitted"))
+        for msg_id, waiting in futures.items():
+            for future in waiting:
+                future.set_exception(PandaTwitchException(f"AutoMod returned no result for {msg_id}."))
+
+    def close(self):
+        """
+        Sends the queued messages and waits for their results.
+
+        :return: None
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(None)
+        self._thread.join()
+        self._executor.shutdown(wait=True)
+        self._thread = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
@@ -0,0 +1,129 @@
+import threading
+import time
+from collections import OrderedDict
+
+# seconds a response of each slow changing endpoint stays fresh.
+DEFAULT_TTLS = {
+    "/games": 3600,
+    "/tags/streams": 3600,
+    "/bits/cheermotes": 3600,
+    "/channels": 60,
+    "/users": 300,
+}
+
+
+def _normalize(params):
+    """
+    Turns params, a dict or a list of pairs, into a hashable, order independent key. None values are dropped like
+    requests drops them.
+    """
+    grouped = {}
+    items = params.items() if isinstance(params, dict) else params or ()
+    for key, value in items:
+        if value is None:
+            continue
+        if isinstance(value, (str, bytes)) or not hasattr(value, "__iter__"):
+            value = (value,)
+        grouped.setdefault(key, []).extend(str(item) for item in value if item is not None)
+    return tuple(sorted((key, tuple(sorted(values))) for key, values in grouped.items()))
+
+
+class ResponseCache(object):
+    """
+    Opt-in in-memory TTL/LRU cache for idempotent Helix GETs.
+
+    Only endpoints with a TTL are cached. A write (POST/PUT/PATCH/DELETE) to an endpoint evicts the cached GETs of the
+    same endpoint that it could have changed.
+    """
+
+    def __init__(self, max_size: int = 1024, ttls: dict = None):
+        """
+        :param max_size: Maximum number of cached responses. The least recently used one is dropped first.
+        :param ttls: Seconds to cache each endpoint for, keyed by path e.g. {"/games": 3600}. Default: DEFAULT_TTLS
+        """
+        self.max_size = max_size
+        self.ttls = DEFAULT_TTLS.copy() if ttls is None else dict(ttls)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def lookup(self, method: str, path: str, params: dict = None, credentials=None, base_url: str = None):
+        """
+        Looks a request up in the cache. Writes invalidate the matching entries instead.
+
+        :param method: HTTP method.
+        :param path: Endpoint path relative to the Helix base url, e.g. /games
+        :param params: Query string parameters of the request.
+        :param credentials: Hashable identity of whoever sends the request, see HelixApi._credentials. Responses are
+                            never shared between credentials.
+        :param base_url: Base url the path is relative to. Responses are never shared between hosts.
+        :return: (key to store the response under or None, cached requests.Response or None)
+        """
+        if method != "GET":
+            self.invalidate(path, params)
+            return None, None
+        if path not in self.ttls:
+            return None, None
+
+        key = (path, _normalize(params), base_url, credentials)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return key, entry[1]
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+        return key, None
+
+    def store(self, key, response):
+        """
+        Caches a successful response under the key returned by lookup.
+
+        :param key: Key returned by lookup.
+        :param response: requests.Response
+        :return: None
+        """
+        if key is None or response.status_code != 200:
+            return
+
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttls[key[0]], response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, path: str, params: dict = None):
+        """
+        Evicts the cached GETs of an endpoint that overlap with the given params, e.g. a PATCH /channels for one
+        broadcaster_id evicts the GET /channels entries that include that broadcaster_id.
+
+        :param path: Endpoint path relative to the Helix base url.
+        :param params: Params of the write. Without params every entry of the endpoint is evicted.
+        :return: None
+        """
+        written = dict(_normalize(params))
+        with self._lock:
+            for key in list(self._entries):
+                if key[0] != path:
+                    continue
+                cached = dict(key[1])
+                shared = set(written) & set(cached)
+                if all(set(written[name]) & set(cached[name]) for name in shared):
+                    del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    @property
+    def stats(self):
+        """
+        :return: hits, misses, evictions and current size of the cache.
+        """
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions, "size": len(self._entries)}
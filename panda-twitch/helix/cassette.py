@@ -0,0 +1,238 @@
+import base64
+import gzip
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from urllib.parse import urlsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from helix.cache import _normalize
+
+CASSETTE_VERSION = 1
+
+
+def _key(method: str, url: str, params):
+    """
+    Matches a request to its recording: method, URL path and normalized query string. The host is left out so a
+    cassette recorded against Twitch replays against any base url.
+    """
+    return method.upper(), urlsplit(url).path, _normalize(params)
+
+
+def _pairs(params):
+    """
+    :return: params, a dict or a list of pairs, as a JSON friendly list of [key, value] pairs.
+    """
+    pairs = []
+    items = params.items() if isinstance(params, dict) else params or ()
+    for key, value in items:
+        if value is None:
+            continue
+        if isinstance(value, (str, bytes)) or not hasattr(value, "__iter__"):
+            value = (value,)
+        pairs.extend([key, str(item)] for item in value if item is not None)
+    return pairs
+
+
+class _CassetteTransport(object):
+    def get(self, url: str, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs):
+        return self.request("POST", url, **kwargs)
+
+    def put(self, url: str, **kwargs):
+        return self.request("PUT", url, **kwargs)
+
+    def patch(self, url: str, **kwargs):
+        return self.request("PATCH", url, **kwargs)
+
+    def delete(self, url: str, **kwargs):
+        return self.request("DELETE", url, **kwargs)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class RecordingTransport(_CassetteTransport):
+    """
+    Wraps a transport and writes every request/response pair to a cassette: gzip compressed JSON lines with the
+    request, the response status, headers and body, the offset of the request from the start of the recording and its
+    latency. Request headers are not recorded, so tokens never end up on disk.
+    """
+
+    def __init__(self, transport, path: str):
+        """
+        :param transport: Transport that sends the requests, e.g. HelixTransport()
+        :param path: Cassette file to write.
+        """
+        self.transport = transport
+        self.path = path
+        self.recorded = 0
+        self._file = gzip.open(path, "wt", encoding="utf-8")
+        self._file.write(json.dumps({"version": CASSETTE_VERSION, "created": time.time()}) + "\n")
+        self._started = time.monotonic()
+        self._lock = threading.Lock()
+
+    def request(self, method: str, url: str, **kwargs):
+        offset = time.monotonic() - self._started
+        start = time.perf_counter()
+        response = self.transport.request(method, url, **kwargs)
+        elapsed = time.perf_counter() - start
+
+        entry = {
+            "offset": round(offset, 6),
+            "elapsed": round(elapsed, 6),
+            "method": method.upper(),
+            "url": url.split("?", 1)[0],
+            "params": _pairs(kwargs.get("params")),
+            "json": kwargs.get("json"),
+            "status": response.status_code,
+            "reason": response.reason,
+            "headers": dict(response.headers),
+        }
+        content = response.content or b""
+        try:
+            entry["body"] = content.decode("utf-8")
+        except UnicodeDecodeError:
+            entry["body_b64"] = base64.b64encode(content).decode("ascii")
+
+        line = json.dumps(entry, separators=(",", ":")) + "\n"
+        with self._lock:
+            self._file.write(line)
+            self.recorded += 1
+        return response
+
+    def close(self):
+        """
+        Flushes and closes the cassette. The wrapped transport is left open.
+
+        :return: None
+        """
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+
+def load_cassette(path: str):
+    """
+    :param path: Cassette written by RecordingTransport.
+    :return: list of recorded entries, in recording order.
+    """
+    with gzip.open(path, "rt", encoding="utf-8") as cassette:
+        header = json.loads(cassette.readline())
+        if header.get("version") != CASSETTE_VERSION:
+            raise ValueError(f"Unsupported cassette version: {header.get('version')}")
+        return [json.loads(line) for line in cassette if line.strip()]
+
+
+class ReplayTransport(_CassetteTransport):
+    """
+    Answers requests from a cassette instead of the network. Recordings of the same request are returned in the order
+    they were recorded and start over once used up. Requests that were never recorded get a 404.
+    """
+
+    def __init__(self, path: str, speed: float = None):
+        """
+        :param path: Cassette written by RecordingTransport.
+        :param speed: 1.0 replays every response with its recorded latency, 2.0 twice as fast and so on. None answers
+                      as fast as possible.
+        """
+        self.entries = load_cassette(path)
+        self.speed = speed
+        self.replayed = 0
+        self.misses = 0
+        self._recordings = {}
+        for entry in self.entries:
+            self._recordings.setdefault(_key(entry["method"], entry["url"], entry["params"]), []).append(entry)
+        self._positions = {}
+        self._lock = threading.Lock()
+
+    def _response(self, entry, url):
+        response = requests.Response()
+        response.status_code = entry["status"]
+        response.reason = entry.get("reason")
+        response.headers = CaseInsensitiveDict(entry["headers"])
+        response.url = url
+        response.encoding = "utf-8"
+        response.elapsed = timedelta(seconds=entry["elapsed"])
+        if "body_b64" in entry:
+            response._content = base64.b64decode(entry["body_b64"])
+        else:
+            response._content = entry["body"].encode("utf-8")
+        return response
+
+    def request(self, method: str, url: str, params=None, **kwargs):
+        key = _key(method, url, params)
+        with self._lock:
+            recordings = self._recordings.get(key)
+            if not recordings:
+                self.misses += 1
+                entry = None
+            else:
+                position = self._positions.get(key, 0)
+                self._positions[key] = position + 1
+                entry = recordings[position % len(recordings)]
+                self.replayed += 1
+
+        if entry is None:
+            response = requests.Response()
+            response.status_code = 404
+            response.reason = "Not Found"
+            response.url = url
+            response.encoding = "utf-8"
+            response._content = b'{"error":"Not Found","status":404,"message":"Request is not in the cassette"}'
+            return response
+
+        if self.speed:
+            time.sleep(entry["elapsed"] / self.speed)
+        return self._response(entry, url)
+
+    def close(self):
+        pass
+
+
+def replay(api, path: str, speed: float = None, max_workers: int = 8):
+    """
+    Sends the requests of a cassette again through api, e.g. one using a ReplayTransport of the same cassette, to
+    compare the throughput of client versions on real traffic.
+
+    :param api: HelixApi the requests are sent through.
+    :param path: Cassette written by RecordingTransport.
+    :param speed: 1.0 keeps the recorded spacing between requests, 2.0 halves it. None sends them as fast as possible.
+    :param max_workers: Requests in flight at once.
+    :return: dict with the number of calls, failed calls, seconds taken and calls per second.
+    """
+    entries = load_cassette(path)
+    failed = 0
+
+    def send(entry):
+        url = api.base_url + urlsplit(entry["url"]).path[len(urlsplit(api.base_url).path):]
+        kwargs = {"headers": api._auth_headers(), "params": [tuple(pair) for pair in entry["params"]]}
+        if entry.get("json") is not None:
+            kwargs["json"] = entry["json"]
+        return api._request(entry["method"], url, **kwargs).ok
+
+    start = time.monotonic()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = []
+        for entry in entries:
+            if speed:
+                wait = start + entry["offset"] / speed - time.monotonic()
+                if wait > 0:
+                    time.sleep(wait)
+            futures.append(executor.submit(send, entry))
+        for future in futures:
+            if not future.result():
+                failed += 1
+
+    elapsed = time.monotonic() - start
+    return {"calls": len(entries), "failed": failed, "seconds": elapsed,
+            "calls_per_sec": len(entries) / elapsed if elapsed else float("inf")}
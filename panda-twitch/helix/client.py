@@ -0,0 +1,156 @@
+import threading
+
+from helix.cache import ResponseCache
+from helix.coalesce import SingleFlight
+from helix.credentials import CredentialPool
+from helix.metrics import Metrics
+from helix.ratelimit import RateLimiter
+from helix.retry import RetryPolicy
+from helix.resources.analytics import TwitchAnalytics
+from helix.resources.bits import TwitchBits
+from helix.resources.channels import TwitchChannels
+from helix.resources.clips import TwitchClips
+from helix.resources.entitlements import TwitchEntitlements
+from helix.resources.extensions import TwitchExtensions
+from helix.resources.games import TwitchGames
+from helix.resources.hypetrain import TwitchHypeTrain
+from helix.resources.moderation import TwitchModeration
+from helix.resources.search import TwitchSearch
+from helix.resources.streams import TwitchStreams
+from helix.resources.subscriptions import TwitchSubscriptions
+from helix.resources.users import TwitchUsers
+from helix.resources.videos import TwitchVideos
+from helix.resources.webhooks import TwitchWebHooks
+from helix.tokens import TokenManager
+from helix.transport import HelixTransport
+
+
+class _Resource(object):
+    """
+    Resource attribute of a client. The resource is built on first access and then stored on the instance, so later
+    lookups are plain attribute reads.
+    """
+
+    def __init__(self, resource_class):
+        self.resource_class = resource_class
+        self.name = None
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, client, owner):
+        if client is None:
+            return self
+        with client._lock:
+            resource = client.__dict__.get(self.name)
+            if resource is None:
+                resource = client._create(self.resource_class)
+                client.__dict__[self.name] = resource
+        return resource
+
+
+class TwitchClient(object):
+    """
+    Single entry point to every Helix resource, e.g. client.streams.get_streams(...). Resources are created on first
+    use and all of them share one transport, token manager and cache. Rate limiters and the coalescer of in-flight
+    GETs are shared by the whole process unless given explicitly, so clients with the same credentials do not each
+    assume the full Twitch budget.
+    """
+    analytics = _Resource(TwitchAnalytics)
+    bits = _Resource(TwitchBits)
+    channels = _Resource(TwitchChannels)
+    clips = _Resource(TwitchClips)
+    entitlements = _Resource(TwitchEntitlements)
+    extensions = _Resource(TwitchExtensions)
+    games = _Resource(TwitchGames)
+    hype_train = _Resource(TwitchHypeTrain)
+    moderation = _Resource(TwitchModeration)
+    search = _Resource(TwitchSearch)
+    streams = _Resource(TwitchStreams)
+    subscriptions = _Resource(TwitchSubscriptions)
+    users = _Resource(TwitchUsers)
+    videos = _Resource(TwitchVideos)
+    webhooks = _Resource(TwitchWebHooks)
+
+    def __init__(self, client_id, secret_id, token=None, transport: HelixTransport = None, max_workers: int = 8,
+                 rate_limiter: RateLimiter = None, cache: ResponseCache = None, token_manager: TokenManager = None,
+                 retry: RetryPolicy = None, single_flight: SingleFlight = None, metrics: Metrics = None,
+                 credential_pool: CredentialPool = None, scopes=None):
+        """
+        :param client_id: Application client id.
+        :param secret_id: Application secret.
+        :param token: OAuth or app access token, if one is already known.
+        :param transport: Transport shared by every resource. Defaults to the process wide one.
+        :param max_workers: Maximum number of chunks of a large id lookup that are requested at once.
+        :param rate_limiter: Limiter shared by every resource. Defaults to the one of these credentials, see
+                             RateLimiter.for_credentials.
+        :param cache: Optional response cache shared by every resource.
+        :param token_manager: Token manager shared by every resource. Defaults to one built from the credentials.
+        :param retry: Retry policy of every resource. Defaults to helix.retry.DEFAULT_RETRY.
+        :param single_flight: Coalescer of identical in-flight GETs shared by every resource. Defaults to the process
+                              wide one, see SingleFlight.default.
+        :param metrics: Optional instrumentation shared by every resource.
+        :param credential_pool: Optional app credentials that calls needing no user token are spread over.
+        :param scopes: Scopes the token was granted, checked by every resource. Defaults to helix.scopes.used_scopes.
+        """
+        self.client_id = client_id
+        self.secret_id = secret_id
+        self.transport = transport or self._default_transport()
+        self.token_manager = token_manager or self._default_token_manager(client_id, secret_id, token)
+        self.max_workers = max_workers
+        self._rate_limiter = rate_limiter
+        self.cache = cache
+        self.retry = retry
+        self.single_flight = single_flight or SingleFlight.default()
+        self.metrics = metrics
+        self.credential_pool = credential_pool
+        self.scopes = scopes
+        self._lock = threading.Lock()
+
+    def _default_transport(self):
+        return HelixTransport.default()
+
+    def _default_token_manager(self, client_id, secret_id, token):
+        return TokenManager(client_id, secret_id, token, transport=self.transport)
+
+    def _create(self, resource_class):
+        return resource_class(self.client_id, self.secret_id, transport=self.transport, max_workers=self.max_workers,
+                              rate_limiter=self._rate_limiter, cache=self.cache, token_manager=self.token_manager,
+                              retry=self.retry, single_flight=self.single_flight,
+                              metrics=self.metrics, credential_pool=self.credential_pool,
+                              scopes=self.scopes)
+
+    @property
+    def token(self):
+        return self.token_manager.token
+
+    @token.setter
+    def token(self, token):
+        self.token_manager.set_token(token)
+
+    @property
+    def rate_limiter(self):
+        return self._rate_limiter or RateLimiter.for_credentials(self.client_id, self.token_manager.user_id)
+
+    @property
+    def rate_limit_budget(self):
+        """
+        Current rate limit budget shared by every resource of this client.
+
+        :return: RateLimitBudget(limit, remaining, reset)
+        """
+        return self.rate_limiter.budget
+
+    def close(self):
+        """
+        Closes the transport shared by the resources.
+
+        :return: None
+        """
+        self.transport.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
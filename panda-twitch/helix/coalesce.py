@@ -0,0 +1,122 @@
+import asyncio
+import threading
+
+
+class _Flight(object):
+    __slots__ = ("done", "response", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.response = None
+        self.error = None
+
+
+class SingleFlight(object):
+    """
+    Coalesces identical GETs that are in flight at the same time: the first caller sends the request and every caller
+    that asks for the same endpoint, params and token before it returns gets the same response instead of spending
+    another call of the rate limit budget. Works for threads and, separately per event loop, for asyncio tasks.
+    """
+    _default = None
+    _default_lock = threading.Lock()
+
+    def __init__(self):
+        self.calls = 0
+        self.coalesced = 0
+        self._flights = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def default(cls):
+        """
+        Returns the process wide instance used by every HelixApi that was not given one explicitly.
+
+        :return: SingleFlight
+        """
+        if cls._default is None:
+            with cls._default_lock:
+                if cls._default is None:
+                    cls._default = cls()
+        return cls._default
+
+    def do(self, key, send):
+        """
+        Calls send() unless a call with the same key is already running, in which case its outcome is shared.
+
+        :param key: Hashable key of the request, see HelixApi._flight_key
+        :param send: Callable sending the request.
+        :return: requests.Response
+        """
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is None:
+                flight = self._flights[key] = _Flight()
+                self.calls += 1
+                leader = True
+            else:
+                self.coalesced += 1
+                leader = False
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.response
+
+        try:
+            flight.response = send()
+            return flight.response
+        except BaseException as error:
+            flight.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+
+    async def do_async(self, key, send):
+        """
+        asyncio flavour of do. Only tasks of the same event loop are coalesced.
+
+        :param key: Hashable key of the request, see HelixApi._flight_key
+        :param send: Coroutine function sending the request.
+        :return: requests.Response
+        """
+        key = (asyncio.get_running_loop(), key)
+        with self._lock:
+            future = self._flights.get(key)
+            if future is None:
+                future = self._flights[key] = asyncio.get_running_loop().create_future()
+                self.calls += 1
+                leader = True
+            else:
+                self.coalesced += 1
+                leader = False
+
+        if not leader:
+            # shielded so a cancelled follower does not cancel the request of everyone else.
+            return await asyncio.shield(future)
+
+        try:
+            response = await send()
+            future.set_result(response)
+            return response
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as error:
+            future.set_exception(error)
+            # retrieved here so a flight nobody else waited on does not log an unretrieved exception.
+            future.exception()
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+
+    @property
+    def stats(self):
+        """
+        :return: calls sent, calls saved by coalescing and requests currently in flight.
+        """
+        with self._lock:
+            return {"calls": self.calls, "coalesced": self.coalesced, "in_flight": len(self._flights)}
@@ -0,0 +1,191 @@
+import asyncio
+import itertools
+import threading
+import time
+
+from helix.exceptions import TwitchAuthenticationException
+from helix.ratelimit import RateLimiter
+from helix.tokens import TokenManager
+from helix.transport import HelixTransport
+
+ROUND_ROBIN = "round_robin"
+LEAST_LOADED = "least_loaded"
+
+
+class Credential(object):
+    """
+    One registered application of a CredentialPool, with its own app access token and rate limit bucket.
+    """
+
+    def __init__(self, client_id, secret_id, token=None, transport: HelixTransport = None):
+        self.client_id = client_id
+        self.secret_id = secret_id
+        self.token_manager = TokenManager(client_id, secret_id, token, transport=transport)
+        self.rate_limiter = RateLimiter()
+        self.in_flight = 0
+        self.failures = 0
+        self.disabled_until = 0.0
+
+    @property
+    def healthy(self):
+        return time.monotonic() >= self.disabled_until
+
+    @property
+    def needs_token(self):
+        """
+        True if headers() would first have to fetch a token from Twitch.
+        """
+        return self.token_manager.current is None or self.token_manager.expired
+
+    def headers(self):
+        """
+        :return: Authorization and Client-Id headers of this credential, fetching an app access token if needed.
+        """
+        token = self.token_manager.token or self.token_manager.refresh()
+        return {"Authorization": f"Bearer {token}", "Client-Id": f"{self.client_id}"}
+
+    def __repr__(self):
+        return f"Credential({self.client_id}, healthy={self.healthy}, failures={self.failures})"
+
+
+class CredentialPool(object):
+    """
+    Spreads app token requests over several registered applications, multiplying the rate limit budget of bulk
+    public data crawls. Every credential refreshes its own token and throttles on its own bucket. A credential that
+    keeps getting 401s, even after a token refresh, is taken out of rotation for a cooldown. Only 401s count against
+    a credential: 429s are handled by its rate limit bucket and other errors by the retry policy.
+    """
+
+    def __init__(self, credentials, strategy: str = LEAST_LOADED, transport: HelixTransport = None,
+                 max_failures: int = 3, cooldown: float = 300.0):
+        """
+        :param credentials: (client_id, secret_id) or (client_id, secret_id, token) tuples.
+        :param strategy: LEAST_LOADED sends each request with the credential with the most budget left, ROUND_ROBIN
+                         takes turns.
+        :param transport: Transport used for the token calls.
+        :param max_failures: Consecutive authentication failures before a credential is taken out of rotation.
+        :param cooldown: Seconds a failed credential stays out of rotation.
+        """
+        self.credentials = [Credential(*credential, transport=transport) for credential in credentials]
+        if not self.credentials:
+            raise ValueError("A credential pool needs at least one credential.")
+        self.strategy = strategy
+        self.max_failures = max_failures
+        self.cooldown = cooldown
+        self._turns = itertools.cycle(self.credentials)
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """
+        Picks the credential for one request.
+
+        :return: Credential
+        """
+        with self._lock:
+            if self.strategy == ROUND_ROBIN:
+                for _ in range(len(self.credentials)):
+                    credential = next(self._turns)
+                    if credential.healthy:
+                        break
+                else:
+                    credential = None
+            else:
+                healthy = [credential for credential in self.credentials if credential.healthy]
+                credential = min(healthy, default=None,
+                                 key=lambda c: (c.rate_limiter.time_until(1), c.in_flight - c.rate_limiter.tokens))
+
+            if credential is None:
+                raise TwitchAuthenticationException("Every credential of the pool is out of rotation.")
+            credential.in_flight += 1
+            return credential
+
+    def checkout(self):
+        """
+        Picks the credential for one attempt and takes a point from its bucket.
+
+        :return: (Credential, its auth headers, seconds to wait before sending)
+        """
+        credential = self.acquire()
+        try:
+            return credential, credential.headers(), credential.rate_limiter.reserve()
+        except Exception:
+            self.release(credential)
+            raise
+
+    async def checkout_async(self):
+        """
+        checkout for asyncio callers: a token fetch runs in the default executor instead of blocking the loop.
+
+        :return: (Credential, its auth headers, seconds to wait before sending)
+        """
+        credential = self.acquire()
+        try:
+            if credential.needs_token:
+                await asyncio.get_running_loop().run_in_executor(None, credential.headers)
+            return credential, credential.headers(), credential.rate_limiter.reserve()
+        except Exception:
+            self._record(credential, None)
+            raise
+
+    def _record(self, credential: Credential, response):
+        """
+        :return: True if the token of the credential has to be refreshed.
+        """
+        with self._lock:
+            credential.in_flight -= 1
+            if response is None:
+                return False
+            if response.status_code != 401:
+                if response.ok:
+                    credential.failures = 0
+                return False
+
+            credential.failures += 1
+            if credential.failures >= self.max_failures:
+                credential.disabled_until = time.monotonic() + self.cooldown
+                credential.failures = 0
+                return False
+            return True
+
+    def _refresh(self, credential: Credential):
+        try:
+            credential.token_manager.refresh()
+        except TwitchAuthenticationException:
+            with self._lock:
+                credential.disabled_until = time.monotonic() + self.cooldown
+
+    def release(self, credential: Credential, response=None):
+        """
+        Records the outcome of a request sent with a credential.
+
+        :param credential: Credential returned by acquire.
+        :param response: requests.Response, or None if the request failed without one.
+        :return: None
+        """
+        if self._record(credential, response):
+            self._refresh(credential)
+
+    async def release_async(self, credential: Credential, response=None):
+        """
+        release for asyncio callers: the token refresh after a 401 runs in the default executor.
+
+        :param credential: Credential returned by checkout_async.
+        :param response: requests.Response, or None if the request failed without one.
+        :return: None
+        """
+        if self._record(credential, response):
+            await asyncio.get_running_loop().run_in_executor(None, self._refresh, credential)
+
+    @property
+    def healthy(self):
+        """
+        :return: Credentials currently in rotation.
+        """
+        return [credential for credential in self.credentials if credential.healthy]
+
+    @property
+    def rate_limit_budget(self):
+        """
+        :return: Points left across every healthy credential.
+        """
+        return sum(credential.rate_limiter.budget.remaining for credential in self.healthy)
@@ -0,0 +1,53 @@
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _stdlib_loads(data):
+    # json.loads detects the encoding of bytes itself, so the body is never decoded to a str first.
+    return json.loads(data)
+
+
+# decoder every response body goes through: orjson when it is installed, the standard library otherwise.
+_decoder = orjson.loads if orjson is not None else _stdlib_loads
+
+
+def set_decoder(loads=None):
+    """
+    Replaces the JSON decoder used for every Helix response, e.g. with ujson.loads or simdjson.
+
+    :param loads: Callable parsing bytes into Python objects. None restores the default.
+    :return: None
+    """
+    global _decoder
+    if loads is None:
+        loads = orjson.loads if orjson is not None else _stdlib_loads
+    _decoder = loads
+
+
+def get_decoder():
+    """
+    :return: The JSON decoder in use.
+    """
+    return _decoder
+
+
+def loads(data):
+    """
+    Parses JSON from bytes (or str) with the configured decoder.
+    """
+    return _decoder(data)
+
+
+def decode_response(response):
+    """
+    Parses the body of a response straight from its bytes.
+
+    :param response: requests.Response
+    :return: Decoded body, or {} for an empty body.
+    """
+    content = response.content
+    return _decoder(content) if content else {}
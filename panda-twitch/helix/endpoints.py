@@ -0,0 +1,194 @@
+from helix.models import Stream, User, Follow, Clip, Video
+from helix.scopes import ANALYTICS_READ_EXTENSIONS, ANALYTICS_READ_GAMES, BITS_READ, CHANNEL_EDIT_COMMERCIAL, \
+    CHANNEL_READ_HYPE_TRAIN, CHANNEL_READ_STREAM_KEY, CHANNEL_READ_SUBSCRIPTIONS, CLIPS_EDIT, MODERATION_READ, \
+    USER_EDIT, USER_EDIT_BROADCAST, USER_EDIT_FOLLOWS, USER_READ_BROADCAST, USER_READ_EMAIL
+
+# kinds of token an endpoint needs.
+OAUTH = "oauth"
+APP = "app"
+OAUTH_OR_APP = "oauth_or_app"
+
+AUTH_MESSAGES = {
+    OAUTH: "An OAuth Token is required.",
+    APP: "An App Access Token is required.",
+    OAUTH_OR_APP: "Either an OAuth or an App Access Token is required.",
+}
+
+
+def _fields(names):
+    """
+    Turns a params/body description into (api name, argument name) pairs. A plain string is used for both, a tuple
+    maps an api name to a differently named method argument, e.g. ("type", "analytics_type").
+    """
+    return tuple((name, name) if isinstance(name, str) else tuple(name) for name in names)
+
+
+def _encode(value):
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return value if isinstance(value, str) else str(value)
+
+
+class Endpoint(object):
+    """
+    Declarative description of one Helix endpoint. HelixApi._call turns it and the method arguments into a request.
+    """
+    __slots__ = ("method", "path", "params", "body", "auth", "scope", "paging", "envelope", "model")
+
+    def __init__(self, method: str, path: str, params=(), body=(), auth: str = None, scope: str = None,
+                 paging: str = None, envelope: bool = False, model=None):
+        """
+        :param method: HTTP method.
+        :param path: Path relative to the Helix base url.
+        :param params: Query string parameters, see _fields.
+        :param body: JSON body fields, see _fields.
+        :param auth: Kind of token required: OAUTH, APP, OAUTH_OR_APP or None.
+        :param scope: Scope required, if any.
+        :param paging: Name of the forward cursor parameter of paginated endpoints.
+        :param envelope: Send the body wrapped as {"data": [body]}.
+        :param model: Model class of the data items. Calls to the endpoint then return a Page of them.
+        """
+        self.method = method
+        self.path = path
+        self.params = _fields(params)
+        self.body = _fields(body)
+        self.auth = auth
+        self.scope = scope
+        self.paging = paging
+        self.envelope = envelope
+        self.model = model
+
+    def query(self, arguments: dict):
+        """
+        :return: Query string as a list of pairs, without unset values and with multi valued params as repeated keys.
+        """
+        pairs = []
+        for name, argument in self.params:
+            value = arguments.get(argument)
+            if value is None:
+                continue
+            if isinstance(value, (str, bytes, int, bool)):
+                pairs.append((name, _encode(value)))
+            else:
+                pairs.extend((name, _encode(item)) for item in value if item is not None)
+        return pairs
+
+    def json(self, arguments: dict):
+        """
+        :return: JSON body without unset values, or None if the endpoint has no body.
+        """
+        if not self.body:
+            return None
+        body = {name: arguments[argument] for name, argument in self.body if arguments.get(argument) is not None}
+        return {"data": [body]} if self.envelope else body
+
+    def __repr__(self):
+        return f"Endpoint({self.method} {self.path})"
+
+
+# Analytics
+GET_EXTENSION_ANALYTICS = Endpoint("GET", "/analytics/extensions", scope=ANALYTICS_READ_EXTENSIONS, paging="after",
+                                   params=("after", "ended_at", "extension_id", "first", "started_at",
+                                           ("type", "analytics_type")))
+GET_GAME_ANALYTICS = Endpoint("GET", "/analytics/games", auth=OAUTH, scope=ANALYTICS_READ_GAMES, paging="after",
+                              params=("after", "ended_at", "first", "game_id", "started_at",
+                                      ("type", "analytics_type")))
+
+# Bits
+GET_CHEERMOTES = Endpoint("GET", "/bits/cheermotes", auth=OAUTH_OR_APP, params=("broadcaster_id",))
+GET_BITS_LEADERBOARD = Endpoint("GET", "/bits/leaderboard", auth=OAUTH, scope=BITS_READ,
+                                params=("count", "period", "started_at", "user_id"))
+
+# Channels
+START_COMMERCIAL = Endpoint("POST", "/channels/commercial", scope=CHANNEL_EDIT_COMMERCIAL,
+                            body=("broadcaster_id", ("length", "commercials_length")))
+GET_CHANNEL_INFORMATION = Endpoint("GET", "/channels", auth=OAUTH_OR_APP, params=("broadcaster_id",))
+MODIFY_CHANNEL_INFORMATION = Endpoint("PATCH", "/channels", auth=OAUTH, scope=USER_READ_BROADCAST,
+                                      params=("broadcaster_id",),
+                                      body=("game_id", "broadcaster_language", "title"))
+
+# Clips
+CREATE_CLIP = Endpoint("POST", "/clips", auth=OAUTH, scope=CLIPS_EDIT, params=("broadcaster_id", "has_delay"))
+GET_CLIPS = Endpoint("GET", "/clips", paging="after", model=Clip,
+                     params=("broadcaster_id", "game_id", ("id", "clip_id"), "after", "before", "ended_at", "first",
+                             "started_at"))
+
+# Entitlements
+CREATE_ENTITLEMENT_GRANTS_UPLOAD_URL = Endpoint("POST", "/entitlements/upload", auth=APP,
+                                                params=("manifest_id", ("type", "entitlement_type")))
+GET_CODE_STATUS = Endpoint("GET", "/entitlements/codes", params=("code", "user_id"))
+GET_DROPS_ENTITLEMENTS = Endpoint("GET", "/entitlements/drops", auth=OAUTH, paging="after",
+                                  params=(("id", "entitlement_id"), "user_id", "game_id", "after", "first"))
+REDEEM_CODE = Endpoint("POST", "/entitlements/codes", auth=APP, params=("code", "user_id"))
+
+# Extensions
+GET_EXTENSION_TRANSACTIONS = Endpoint("GET", "/extensions/transactions", auth=OAUTH_OR_APP, paging="after",
+                                      params=("extension_id", ("id", "transaction_id"), "after", "first"))
+
+# Games
+GET_TOP_GAMES = Endpoint("GET", "/games/top", paging="after", params=("after", "before", "first"))
+GET_GAMES = Endpoint("GET", "/games", params=(("id", "game_id"), "name"))
+
+# Hype Train
+GET_HYPE_TRAIN_EVENTS = Endpoint("GET", "/hypetrain/events", auth=OAUTH_OR_APP, scope=CHANNEL_READ_HYPE_TRAIN,
+                                 paging="cursor", params=("broadcaster_id", "first", ("id", "event_id"), "cursor"))
+
+# Moderation
+CHECK_AUTOMOD_STATUS = Endpoint("POST", "/moderation/enforcements/status", auth=OAUTH, scope=MODERATION_READ,
+                                params=("broadcaster_id",), body=("msg_id", "msg_text", "user_id"), envelope=True)
+GET_BANNED_USERS = Endpoint("GET", "/moderation/banned", auth=OAUTH, scope=MODERATION_READ, paging="after",
+                            params=("broadcaster_id", "user_id", "after", "before"))
+GET_BANNED_EVENTS = Endpoint("GET", "/moderation/banned/events", auth=OAUTH, scope=MODERATION_READ, paging="after",
+                             params=("broadcaster_id", "user_id", "after", "first"))
+GET_MODERATORS = Endpoint("GET", "/moderation/moderators", auth=OAUTH, scope=MODERATION_READ, paging="after",
+                          params=("broadcaster_id", "user_id", "after"))
+GET_MODERATOR_EVENTS = Endpoint("GET", "/moderation/moderators/events", auth=OAUTH, scope=MODERATION_READ,
+                                paging="after", params=("broadcaster_id", "user_id", "after", "first"))
+
+# Search
+SEARCH_CATEGORIES = Endpoint("GET", "/search/categories", auth=OAUTH_OR_APP, paging="after",
+                             params=("query", "first", "after"))
+SEARCH_CHANNELS = Endpoint("GET", "/search/channels", auth=OAUTH_OR_APP, paging="after",
+                           params=("query", "first", "after", "live_only"))
+
+# Streams
+GET_STREAM_KEY = Endpoint("GET", "/streams/key", auth=OAUTH, scope=CHANNEL_READ_STREAM_KEY,
+                          params=("broadcaster_id",))
+GET_STREAMS = Endpoint("GET", "/streams", auth=OAUTH_OR_APP, paging="after", model=Stream,
+                       params=("after", "before", "first", "game_id", "language", "user_id", "user_login"))
+CREATE_STREAM_MARKER = Endpoint("POST", "/streams/markers", auth=OAUTH, scope=USER_EDIT_BROADCAST,
+                                body=("user_id", "description"))
+GET_STREAM_MARKERS = Endpoint("GET", "/streams/markers", auth=OAUTH, scope=USER_EDIT_BROADCAST, paging="after",
+                              params=("user_id", "video_id", "after", "before", "first"))
+GET_ALL_STREAM_TAGS = Endpoint("GET", "/tags/streams", auth=APP, paging="after", params=("after", "first", "tag_id"))
+GET_STREAM_TAGS = Endpoint("GET", "/streams/tags", auth=APP, params=("broadcaster_id",))
+REPLACE_STREAM_TAGS = Endpoint("PUT", "/streams/tags", auth=OAUTH, scope=USER_EDIT_BROADCAST,
+                               params=("broadcaster_id",), body=("tag_ids",))
+
+# Subscriptions
+GET_BROADCASTER_SUBSCRIPTIONS = Endpoint("GET", "/subscriptions", auth=OAUTH, scope=CHANNEL_READ_SUBSCRIPTIONS,
+                                         params=("broadcaster_id", "user_id"))
+
+# Users
+CREATE_USER_FOLLOWS = Endpoint("POST", "/users/follows", auth=OAUTH, scope=USER_EDIT_FOLLOWS,
+                               body=("from_id", "to_id", "allow_notifications"))
+DELETE_USER_FOLLOWS = Endpoint("DELETE", "/users/follows", auth=OAUTH, scope=USER_EDIT_FOLLOWS,
+                               params=("from_id", "to_id"))
+GET_USERS = Endpoint("GET", "/users", auth=OAUTH, scope=USER_READ_EMAIL, model=User,
+                     params=(("id", "user_id"), "login"))
+GET_USERS_FOLLOWS = Endpoint("GET", "/users/follows", auth=OAUTH_OR_APP, paging="after", model=Follow,
+                             params=("after", "first", "from_id", "to_id"))
+UPDATE_USER = Endpoint("PUT", "/users", auth=OAUTH, scope=USER_EDIT, params=("description",))
+GET_USER_EXTENSIONS = Endpoint("GET", "/users/extensions/list", auth=OAUTH, scope=USER_READ_BROADCAST)
+GET_USER_ACTIVE_EXTENSIONS = Endpoint("GET", "/users/extensions", auth=OAUTH, scope=USER_EDIT_BROADCAST,
+                                      params=("user_id",))
+UPDATE_USER_EXTENSIONS = Endpoint("PUT", "/users/extensions", body=("data",), auth=OAUTH, scope=USER_EDIT_BROADCAST)
+
+# Videos
+GET_VIDEOS = Endpoint("GET", "/videos", auth=OAUTH_OR_APP, paging="after", model=Video,
+                      params=(("id", "video_id"), "user_id", "game_id", "after", "before", "first", "language",
+                              "period", "sort", ("type", "video_type")))
+
+# Webhooks
+GET_WEBHOOK_SUBSCRIPTIONS = Endpoint("GET", "/webhooks/subscriptions", auth=APP, paging="after",
+                                     params=("first", "after"))
@@ -0,0 +1,235 @@
+import hashlib
+import hmac
+import queue
+import threading
+import time
+from collections import OrderedDict, namedtuple
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from helix.decoder import loads
+
+# Twitch-Eventsub-Message-Type values.
+VERIFICATION = "webhook_callback_verification"
+NOTIFICATION = "notification"
+REVOCATION = "revocation"
+
+# notifications older than this are rejected as replays.
+MAX_MESSAGE_AGE = 600
+
+Notification = namedtuple("Notification", ["message_id", "type", "timestamp", "subscription", "event"])
+
+
+def sign(secret: str, message_id: str, timestamp: str, body: bytes):
+    """
+    :return: Value of the Twitch-Eventsub-Message-Signature header of a message.
+    """
+    digest = hmac.new(secret.encode(), message_id.encode() + timestamp.encode() + body, hashlib.sha256)
+    return "sha256=" + digest.hexdigest()
+
+
+def _parse_timestamp(timestamp: str):
+    # RFC3339 with nanoseconds, e.g. 2020-10-18T14:12:06.123456789Z; fromisoformat takes at most microseconds.
+    main, _, fraction = timestamp.rstrip("Z").partition(".")
+    parsed = datetime.fromisoformat(main).replace(tzinfo=timezone.utc)
+    return parsed.timestamp() + (float(f"0.{fraction}") if fraction else 0.0)
+
+
+class _EventSubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def _send(self, status: int, body: bytes = b"", content_type: str = "text/plain"):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        receiver = self.server.receiver
+        if self.path.split("?", 1)[0] != receiver.path:
+            self._send(404)
+            return
+        status, reply = receiver.receive(self.headers, body)
+        self._send(status, reply)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class EventSubReceiver(object):
+    """
+    Local EventSub webhook callback, meant to sit behind a TLS terminating proxy. Messages are checked against the
+    HMAC signature and timestamp, challenges are answered, redeliveries are dropped by message id, and notifications
+    are handed to a bounded worker pool. When the pool is saturated the receiver answers 503, so Twitch redelivers the
+    message later instead of it piling up in memory.
+    """
+
+    def __init__(self, secret: str, host: str = "127.0.0.1", port: int = 8080, path: str = "/eventsub",
+                 workers: int = 4, queue_size: int = 1000, enqueue_timeout: float = 1.0, dedupe_size: int = 100000):
+        """
+        :param secret: Secret the subscriptions were created with.
+        :param host: Interface to listen on.
+        :param port: Port to listen on. 0 picks a free one.
+        :param path: Callback path the proxy forwards.
+        :param workers: Threads running the handlers.
+        :param queue_size: Notifications waiting for a worker before new ones are refused.
+        :param enqueue_timeout: Seconds a request waits for room in the queue before it is refused with a 503.
+        :param dedupe_size: Message ids remembered for deduplication.
+        """
+        self.secret = secret
+        self.path = path
+        self.workers = workers
+        self.enqueue_timeout = enqueue_timeout
+        self.dedupe_size = dedupe_size
+        self.handlers = {}
+        self.stats = {"received": 0, "challenges": 0, "rejected": 0, "duplicates": 0, "refused": 0, "handled": 0,
+                      "errors": 0}
+
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._seen = OrderedDict()
+        self._lock = threading.Lock()
+        self._threads = []
+        self.httpd = ThreadingHTTPServer((host, port), _EventSubHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.receiver = self
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}{self.path}"
+
+    def on(self, subscription_type: str, handler):
+        """
+        Registers a handler for a subscription type, e.g. "stream.online", or REVOCATION for revoked subscriptions.
+
+        :param handler: Called from a worker thread with a Notification.
+        :return: The handler.
+        """
+        self.handlers.setdefault(subscription_type, []).append(handler)
+        return handler
+
+    def _count(self, name):
+        with self._lock:
+            self.stats[name] += 1
+
+    def _verify(self, headers, body):
+        message_id = headers.get("Twitch-Eventsub-Message-Id")
+        timestamp = headers.get("Twitch-Eventsub-Message-Timestamp")
+        signature = headers.get("Twitch-Eventsub-Message-Signature")
+        if not message_id or not timestamp or not signature:
+            return False
+        if not hmac.compare_digest(sign(self.secret, message_id, timestamp, body), signature):
+            return False
+        try:
+            return time.time() - _parse_timestamp(timestamp) <= MAX_MESSAGE_AGE
+        except ValueError:
+            return False
+
+    def receive(self, headers, body: bytes):
+        """
+        Handles one delivery.
+
+        :param headers: Request headers.
+        :param body: Raw request body.
+        :return: (status, response body)
+        """
+        self._count("received")
+        if not self._verify(headers, body):
+            self._count("rejected")
+            return 403, b""
+
+        message_id = headers["Twitch-Eventsub-Message-Id"]
+        message_type = headers.get("Twitch-Eventsub-Message-Type")
+        try:
+            payload = loads(body)
+        except ValueError:
+            self._count("rejected")
+            return 400, b""
+
+        if message_type == VERIFICATION:
+            self._count("challenges")
+            return 200, str(payload.get("challenge", "")).encode()
+
+        with self._lock:
+            if message_id in self._seen:
+                self.stats["duplicates"] += 1
+                return 204, b""
+            self._seen[message_id] = None
+            if len(self._seen) > self.dedupe_size:
+                self._seen.popitem(last=False)
+
+        subscription = payload.get("subscription") or {}
+        kind = REVOCATION if message_type == REVOCATION else subscription.get("type")
+        notification = Notification(message_id, kind, headers["Twitch-Eventsub-Message-Timestamp"], subscription,
+                                    payload.get("event"))
+        try:
+            self._queue.put(notification, timeout=self.enqueue_timeout)
+        except queue.Full:
+            # forgotten again, so the message is handled when Twitch redelivers it.
+            with self._lock:
+                self._seen.pop(message_id, None)
+                self.stats["refused"] += 1
+            return 503, b""
+        return 204, b""
+
+    def _work(self):
+        while True:
+            notification = self._queue.get()
+            if notification is None:
+                self._queue.task_done()
+                return
+            try:
+                for handler in self.handlers.get(notification.type, ()):
+                    handler(notification)
+                self._count("handled")
+            except Exception:
+                self._count("errors")
+            finally:
+                self._queue.task_done()
+
+    def start(self):
+        """
+        Starts the workers and the HTTP server in background threads.
+
+        :return: None
+        """
+        self._threads = [threading.Thread(target=self._work, daemon=True) for _ in range(self.workers)]
+        self._threads.append(threading.Thread(target=self.httpd.serve_forever, daemon=True))
+        for thread in self._threads:
+            thread.start()
+
+    def join(self):
+        """
+        Waits until every accepted notification has been handled.
+
+        :return: None
+        """
+        self._queue.join()
+
+    def stop(self):
+        """
+        Stops accepting deliveries, lets the workers finish the queued notifications and closes the socket.
+
+        :return: None
+        """
+        if not self._threads:
+            # not started: shutdown() would wait forever for a serve_forever loop that never ran.
+            self.httpd.server_close()
+            return
+        self.httpd.shutdown()
+        for _ in range(self.workers):
+            self._queue.put(None)
+        for thread in self._threads:
+            thread.join()
+        self.httpd.server_close()
+        self._threads = []
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
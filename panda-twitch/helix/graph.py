@@ -0,0 +1,364 @@
+import json
+import os
+import threading
+from array import array
+from collections import deque
+
+from helix.retry import raise_for_response
+
+FOLLOWING = "from"
+FOLLOWERS = "to"
+
+CHECKPOINT_VERSION = 1
+
+
+class IdTable(object):
+    """
+    Interns Twitch user ids into dense integer indexes. Ids are kept as one 8 byte machine integer each instead of a
+    str per edge.
+    """
+    __slots__ = ("ids", "_index")
+
+    def __init__(self):
+        self.ids = array("Q")
+        self._index = {}
+
+    def intern(self, user_id):
+        """
+        :param user_id: Twitch user id, str or int.
+        :return: Index of the id, added if it was not known yet.
+        """
+        user_id = int(user_id)
+        index = self._index.get(user_id)
+        if index is None:
+            index = self._index[user_id] = len(self.ids)
+            self.ids.append(user_id)
+        return index
+
+    def get(self, user_id):
+        """
+        :return: Index of the id, or None if it is not known.
+        """
+        return self._index.get(int(user_id))
+
+    def _rebuild(self):
+        self._index = {user_id: index for index, user_id in enumerate(self.ids)}
+
+    def __getitem__(self, index):
+        return str(self.ids[index])
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __contains__(self, user_id):
+        return int(user_id) in self._index
+
+
+class FollowGraph(object):
+    """
+    Directed follow graph, follower -> followed. Edges are appended to two parallel arrays of interned ids and turned
+    into CSR (offsets, neighbors) arrays on demand, so memory grows by 8 bytes per edge rather than per Python object.
+    """
+
+    def __init__(self):
+        self.ids = IdTable()
+        self.sources = array("I")
+        self.targets = array("I")
+        self._csr = {}
+        self._lock = threading.Lock()
+
+    def add(self, from_id, to_id):
+        with self._lock:
+            self.sources.append(self.ids.intern(from_id))
+            self.targets.append(self.ids.intern(to_id))
+            self._csr.clear()
+
+    def add_follows(self, follows):
+        """
+        :param follows: Items of a get_users_follows data array.
+        :return: None
+        """
+        with self._lock:
+            intern = self.ids.intern
+            for follow in follows:
+                self.sources.append(intern(follow["from_id"]))
+                self.targets.append(intern(follow["to_id"]))
+            self._csr.clear()
+
+    def csr(self, reverse: bool = False):
+        """
+        Compressed sparse row adjacency, duplicates removed and neighbors sorted. Row i lists the indexes in
+        neighbors[offsets[i]:offsets[i + 1]].
+
+        :param reverse: Rows of followers instead of followed channels.
+        :return: (offsets array, neighbors array)
+        """
+        with self._lock:
+            cached = self._csr.get(reverse)
+            if cached is not None:
+                return cached
+
+            rows, columns = (self.targets, self.sources) if reverse else (self.sources, self.targets)
+            nodes = len(self.ids)
+            counts = array("Q", bytes(8 * (nodes + 1)))
+            for row in rows:
+                counts[row + 1] += 1
+            for node in range(nodes):
+                counts[node + 1] += counts[node]
+
+            # counting sort of the edges into their rows.
+            scattered = array("I", bytes(4 * len(rows)))
+            positions = counts[:-1]
+            for row, column in zip(rows, columns):
+                scattered[positions[row]] = column
+                positions[row] += 1
+
+            offsets = array("Q", [0])
+            neighbors = array("I")
+            for node in range(nodes):
+                neighbors.extend(sorted(set(scattered[counts[node]:counts[node + 1]])))
+                offsets.append(len(neighbors))
+
+            self._csr[reverse] = offsets, neighbors
+            return offsets, neighbors
+
+    def _neighbors(self, user_id, reverse):
+        index = self.ids.get(user_id)
+        if index is None:
+            return []
+        offsets, neighbors = self.csr(reverse)
+        return [self.ids[neighbor] for neighbor in neighbors[offsets[index]:offsets[index + 1]]]
+
+    def following(self, user_id):
+        """
+        :return: ids of the channels a user follows.
+        """
+        return self._neighbors(user_id, False)
+
+    def followers(self, user_id):
+        """
+        :return: ids of the users that follow a channel.
+        """
+        return self._neighbors(user_id, True)
+
+    @property
+    def edges(self):
+        return len(self.sources)
+
+    def __len__(self):
+        return len(self.ids)
+
+
+class FollowCrawler(object):
+    """
+    Walks get_users_follows for a set of seed users, following from_id (who they follow), to_id (who follows them) or
+    both, optionally expanding to the users it discovers. Progress, the cursor of every walk in progress and the
+    edges found so far are checkpointed, so an interrupted crawl resumes where it stopped.
+    """
+
+    def __init__(self, users, checkpoint: str = None, directions=(FOLLOWING, FOLLOWERS), depth: int = 0,
+                 max_workers: int = 4, checkpoint_every: int = 50):
+        """
+        :param users: TwitchUsers used for the crawl.
+        :param checkpoint: Path prefix of the checkpoint files. None keeps the crawl in memory only.
+        :param directions: FOLLOWING, FOLLOWERS or both.
+        :param depth: How many hops past the seeds to expand. 0 only walks the seeds.
+        :param max_workers: Walks run at once.
+        :param checkpoint_every: Pages fetched between two checkpoints.
+        """
+        self.users = users
+        self.checkpoint = checkpoint
+        self.directions = tuple(directions)
+        self.depth = depth
+        self.max_workers = max_workers
+        self.checkpoint_every = checkpoint_every
+        self.graph = FollowGraph()
+        self.pages = 0
+
+        # (user_id, direction, level) walks not started yet, walks being fetched and the cursor of every walk in
+        # progress.
+        self._pending = deque()
+        self._active = set()
+        self._cursors = {}
+        self._seen = set()
+        self._saved_ids = 0
+        self._saved_edges = 0
+        self._error = None
+        self._stop = threading.Event()
+        self._condition = threading.Condition()
+
+        if checkpoint is not None and os.path.exists(checkpoint + ".json"):
+            self._load()
+
+    def _enqueue(self, user_id, level):
+        for direction in self.directions:
+            key = f"{direction}:{user_id}"
+            if key not in self._seen:
+                self._seen.add(key)
+                self._pending.append((str(user_id), direction, level))
+
+    def crawl(self, seeds=()):
+        """
+        Runs the crawl until every walk is done or stop() is called. Seeds already crawled or queued are skipped, so
+        calling this again with the same seeds after an interruption only resumes.
+
+        :param seeds: ids of the users to start from.
+        :return: FollowGraph
+        """
+        with self._condition:
+            for user_id in seeds:
+                self._enqueue(user_id, 0)
+
+        self._stop.clear()
+        workers = [threading.Thread(target=self._work, daemon=True) for _ in range(self.max_workers)]
+        try:
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+        finally:
+            self._stop.set()
+            for worker in workers:
+                worker.join()
+            self.save()
+
+        if self._error is not None:
+            raise self._error
+        return self.graph
+
+    def stop(self):
+        """
+        Stops the crawl after the pages in flight. Their progress is checkpointed.
+
+        :return: None
+        """
+        self._stop.set()
+        with self._condition:
+            self._condition.notify_all()
+
+    def _work(self):
+        while not self._stop.is_set():
+            with self._condition:
+                while not self._pending and self._active and not self._stop.is_set():
+                    self._condition.wait()
+                if not self._pending or self._stop.is_set():
+                    self._condition.notify_all()
+                    return
+                walk = self._pending.popleft()
+                self._active.add(walk)
+
+            try:
+                finished = self._walk(*walk)
+            except Exception as error:
+                self._error = error
+                self.stop()
+                finished = False
+
+            with self._condition:
+                self._active.discard(walk)
+                if not finished:
+                    # interrupted walks go back to the queue with their cursor, for the checkpoint.
+                    self._pending.appendleft(walk)
+                self._condition.notify_all()
+
+    def _walk(self, user_id, direction, level):
+        """
+        Pages through one user's follows in one direction.
+
+        :return: True if the walk reached its last page, False if it was stopped.
+        """
+        key = f"{direction}:{user_id}"
+        arguments = {"from_id" if direction == FOLLOWING else "to_id": user_id}
+        while not self._stop.is_set():
+            cursor = self._cursors.get(key)
+            page = self.users.get_users_follows(after=cursor, first=100, **arguments)
+            raise_for_response(page.response)
+            follows = page.body.get("data") or []
+            self.graph.add_follows(follows)
+            cursor = page.cursor if follows else None
+
+            with self._condition:
+                self.pages += 1
+                if cursor:
+                    self._cursors[key] = cursor
+                else:
+                    self._cursors.pop(key, None)
+                if level < self.depth:
+                    other = "to_id" if direction == FOLLOWING else "from_id"
+                    for follow in follows:
+                        self._enqueue(follow[other], level + 1)
+                    self._condition.notify_all()
+                checkpoint = self.checkpoint is not None and self.pages % self.checkpoint_every == 0
+
+            if checkpoint:
+                self.save()
+            if not cursor:
+                return True
+        return False
+
+    def save(self):
+        """
+        Writes the checkpoint: new ids and edges are appended to the binary files, the queue and cursors are
+        replaced atomically.
+
+        :return: None
+        """
+        if self.checkpoint is None:
+            return
+        graph = self.graph
+        with self._condition, graph._lock:
+            with open(self.checkpoint + ".ids", "ab") as ids:
+                graph.ids.ids[self._saved_ids:].tofile(ids)
+            with open(self.checkpoint + ".sources", "ab") as sources:
+                graph.sources[self._saved_edges:].tofile(sources)
+            with open(self.checkpoint + ".targets", "ab") as targets:
+                graph.targets[self._saved_edges:].tofile(targets)
+            self._saved_ids = len(graph.ids)
+            self._saved_edges = graph.edges
+
+            state = {
+                "version": CHECKPOINT_VERSION,
+                "ids": self._saved_ids,
+                "edges": self._saved_edges,
+                "pages": self.pages,
+                # walks in flight are saved too, a crash after this checkpoint would otherwise lose them for good.
+                "pending": list(self._active) + list(self._pending),
+                "cursors": self._cursors,
+                "seen": sorted(self._seen),
+            }
+            with open(self.checkpoint + ".json.tmp", "w") as output:
+                json.dump(state, output)
+            os.replace(self.checkpoint + ".json.tmp", self.checkpoint + ".json")
+
+    def _load(self):
+        with open(self.checkpoint + ".json") as checkpoint:
+            state = json.load(checkpoint)
+        if state.get("version") != CHECKPOINT_VERSION:
+            raise ValueError(f"Unsupported checkpoint version: {state.get('version')}")
+
+        graph = self.graph
+        # the binary files can be ahead of the state if the crawl died between the two writes, so they are cut back.
+        files = ((".ids", graph.ids.ids, state["ids"]), (".sources", graph.sources, state["edges"]),
+                 (".targets", graph.targets, state["edges"]))
+        for suffix, values, count in files:
+            path = self.checkpoint + suffix
+            with open(path, "rb") as data:
+                values.fromfile(data, count)
+            with open(path, "r+b") as data:
+                data.truncate(count * values.itemsize)
+        graph.ids._rebuild()
+
+        self._saved_ids = state["ids"]
+        self._saved_edges = state["edges"]
+        self.pages = state["pages"]
+        self._pending = deque(tuple(walk) for walk in state["pending"])
+        self._cursors = state["cursors"]
+        self._seen = set(state["seen"])
+
+    @property
+    def done(self):
+        """
+        True once every queued walk has finished.
+        """
+        with self._condition:
+            return not self._pending and not self._active
@@ -0,0 +1,115 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from datetime import datetime, timedelta, timezone
+
+from helix.retry import raise_for_response
+
+MAX_PAGE_SIZE = 100
+
+
+def _as_datetime(value):
+    if isinstance(value, datetime):
+        return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+    # RFC3339, e.g. 2020-10-01T00:00:00Z; fromisoformat does not take the Z suffix.
+    return datetime.fromisoformat(value.replace("Z", "+00:00")).astimezone(timezone.utc)
+
+
+def _rfc3339(value: datetime):
+    return value.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def split_window(started_at: datetime, ended_at: datetime, count: int):
+    """
+    :return: count contiguous (started_at, ended_at) windows covering the range.
+    """
+    step = (ended_at - started_at) / count
+    bounds = [started_at + step * index for index in range(count)] + [ended_at]
+    return list(zip(bounds, bounds[1:]))
+
+
+class ClipHarvester(object):
+    """
+    Collects every clip of a broadcaster or game over a time range. get_clips sorts by view count, so one cursor over
+    a month is a long sequential walk. The range is instead split into windows that are crawled in parallel; a window
+    whose first page comes back full is halved until windows are small enough to be walked in a few pages. Clips are
+    deduped by id and yielded as windows complete.
+    """
+
+    def __init__(self, clips, max_workers: int = 8, windows: int = None, min_window: float = 60.0):
+        """
+        :param clips: TwitchClips used for the crawl.
+        :param max_workers: Windows requested at once.
+        :param windows: Windows the range is split into before crawling. Default: max_workers.
+        :param min_window: Seconds below which a window is walked page by page instead of halved.
+        """
+        self.clips = clips
+        self.max_workers = max_workers
+        self.windows = windows or max_workers
+        self.min_window = timedelta(seconds=min_window)
+        self.stats = {"windows": 0, "splits": 0, "pages": 0, "clips": 0, "duplicates": 0}
+        self._lock = threading.Lock()
+
+    def _count(self, name, value=1):
+        with self._lock:
+            self.stats[name] += value
+
+    def _crawl(self, window, query):
+        """
+        Requests the first page of a window and, unless it is split, walks the rest of it.
+
+        :return: (window, clips, whether the window has to be split)
+        """
+        started_at, ended_at = window
+        query = dict(query, started_at=_rfc3339(started_at), ended_at=_rfc3339(ended_at), first=MAX_PAGE_SIZE)
+        page = self.clips.get_clips(**query)
+        raise_for_response(page.response)
+        self._count("pages")
+        clips = list(page.data)
+        if not page.cursor or not clips:
+            return window, clips, False
+        if len(clips) >= MAX_PAGE_SIZE and ended_at - started_at >= 2 * self.min_window:
+            return window, clips, True
+
+        for page in self.clips._pages(self.clips.get_clips, after=page.cursor, **query):
+            self._count("pages")
+            clips.extend(page.data)
+        return window, clips, False
+
+    def harvest(self, started_at, ended_at, broadcaster_id: str = None, game_id: str = None):
+        """
+        :param started_at: Start of the range, datetime or RFC3339 string.
+        :param ended_at: End of the range, datetime or RFC3339 string.
+        :param broadcaster_id: ID of the broadcaster for whom clips are returned.
+        :param game_id: ID of the game for which clips are returned.
+        :return: Generator of unique Clip records, window by window in completion order.
+        """
+        started_at, ended_at = _as_datetime(started_at), _as_datetime(ended_at)
+        if ended_at <= started_at:
+            raise ValueError("ended_at must be after started_at.")
+        query = {"broadcaster_id": broadcaster_id, "game_id": game_id, "clip_id": None}
+        seen = set()
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            pending = {executor.submit(self._crawl, window, query)
+                       for window in split_window(started_at, ended_at, self.windows)}
+            try:
+                while pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        window, clips, split = future.result()
+                        if split:
+                            self._count("splits")
+                            pending |= {executor.submit(self._crawl, half, query) for half in split_window(*window, 2)}
+                        else:
+                            self._count("windows")
+                        # the first page of a split window is yielded too, the halves return its clips again.
+                        for clip in clips:
+                            if clip.id in seen:
+                                self._count("duplicates")
+                                continue
+                            seen.add(clip.id)
+                            self._count("clips")
+                            yield clip
+            finally:
+                for future in pending:
+                    future.cancel()
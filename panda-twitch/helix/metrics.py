@@ -0,0 +1,193 @@
+import threading
+from bisect import bisect_left
+from collections import Counter
+
+# upper bounds in seconds of the latency histogram buckets, the last bucket is +Inf.
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class MetricsSink(object):
+    """
+    Receiver of the observations made on the request path. Subclasses override the hooks they care about.
+    """
+
+    def observe_request(self, method: str, path: str, status: int, seconds: float, size: int):
+        """
+        One attempt sent to Helix.
+
+        :param method: HTTP method.
+        :param path: Endpoint path, e.g. /streams
+        :param status: Response status, or 0 if the attempt failed without one.
+        :param seconds: Time from sending to the response, rate limiter wait excluded.
+        :param size: Bytes of the response body.
+        """
+
+    def observe_retry(self, method: str, path: str):
+        pass
+
+    def observe_cache_hit(self, method: str, path: str):
+        pass
+
+    def observe_rate_budget(self, budget):
+        """
+        :param budget: RateLimitBudget after a response.
+        """
+
+
+class _EndpointStats(object):
+    __slots__ = ("requests", "statuses", "buckets", "seconds", "bytes", "retries", "cache_hits")
+
+    def __init__(self):
+        self.requests = 0
+        self.statuses = Counter()
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.seconds = 0.0
+        self.bytes = 0
+        self.retries = 0
+        self.cache_hits = 0
+
+
+class InMemorySink(MetricsSink):
+    """
+    Aggregates the observations per endpoint in memory.
+    """
+
+    def __init__(self):
+        self.budget = None
+        self._endpoints = {}
+        self._lock = threading.Lock()
+
+    def _stats(self, method, path):
+        stats = self._endpoints.get((method, path))
+        if stats is None:
+            stats = self._endpoints[(method, path)] = _EndpointStats()
+        return stats
+
+    def observe_request(self, method: str, path: str, status: int, seconds: float, size: int):
+        with self._lock:
+            stats = self._stats(method, path)
+            stats.requests += 1
+            stats.statuses[status] += 1
+            stats.buckets[bisect_left(LATENCY_BUCKETS, seconds)] += 1
+            stats.seconds += seconds
+            stats.bytes += size
+
+    def observe_retry(self, method: str, path: str):
+        with self._lock:
+            self._stats(method, path).retries += 1
+
+    def observe_cache_hit(self, method: str, path: str):
+        with self._lock:
+            self._stats(method, path).cache_hits += 1
+
+    def observe_rate_budget(self, budget):
+        self.budget = budget
+
+    def snapshot(self):
+        """
+        :return: {"endpoints": {"GET /streams": {...}}, "rate_budget": {...}}, safe to serialize as JSON.
+        """
+        with self._lock:
+            endpoints = {}
+            for (method, path), stats in sorted(self._endpoints.items()):
+                endpoints[f"{method} {path}"] = {
+                    "requests": stats.requests,
+                    "statuses": {str(status): count for status, count in sorted(stats.statuses.items())},
+                    "latency_buckets": dict(zip([str(bound) for bound in LATENCY_BUCKETS] + ["+Inf"], stats.buckets)),
+                    "latency_seconds": stats.seconds,
+                    "bytes": stats.bytes,
+                    "retries": stats.retries,
+                    "cache_hits": stats.cache_hits,
+                }
+            budget = self.budget._asdict() if self.budget is not None else None
+        return {"endpoints": endpoints, "rate_budget": budget}
+
+    def reset(self):
+        with self._lock:
+            self._endpoints.clear()
+            self.budget = None
+
+
+class PrometheusSink(InMemorySink):
+    """
+    InMemorySink that renders its aggregates in the Prometheus text exposition format, e.g. for a /metrics handler.
+    """
+
+    def __init__(self, namespace: str = "helix"):
+        super().__init__()
+        self.namespace = namespace
+
+    def render(self):
+        """
+        :return: str in the Prometheus text exposition format, version 0.0.4
+        """
+        ns = self.namespace
+        lines = []
+        with self._lock:
+            endpoints = sorted(self._endpoints.items())
+            budget = self.budget
+
+            lines.append(f"# HELP {ns}_requests_total Helix requests sent, by endpoint and status.")
+            lines.append(f"# TYPE {ns}_requests_total counter")
+            for (method, path), stats in endpoints:
+                for status, count in sorted(stats.statuses.items()):
+                    lines.append(f'{ns}_requests_total{{method="{method}",path="{path}",status="{status}"}} {count}')
+
+            lines.append(f"# HELP {ns}_request_duration_seconds Helix request latency.")
+            lines.append(f"# TYPE {ns}_request_duration_seconds histogram")
+            for (method, path), stats in endpoints:
+                labels = f'method="{method}",path="{path}"'
+                cumulative = 0
+                for bound, count in zip(LATENCY_BUCKETS, stats.buckets):
+                    cumulative += count
+                    lines.append(f'{ns}_request_duration_seconds_bucket{{{labels},le="{bound}"}} {cumulative}')
+                lines.append(f'{ns}_request_duration_seconds_bucket{{{labels},le="+Inf"}} {stats.requests}')
+                lines.append(f"{ns}_request_duration_seconds_sum{{{labels}}} {stats.seconds}")
+                lines.append(f"{ns}_request_duration_seconds_count{{{labels}}} {stats.requests}")
+
+            for name, field, text in (("response_bytes_total", "bytes", "Bytes of Helix response bodies."),
+                                      ("retries_total", "retries", "Helix requests retried."),
+                                      ("cache_hits_total", "cache_hits", "Helix requests answered by the cache.")):
+                lines.append(f"# HELP {ns}_{name} {text}")
+                lines.append(f"# TYPE {ns}_{name} counter")
+                for (method, path), stats in endpoints:
+                    lines.append(f'{ns}_{name}{{method="{method}",path="{path}"}} {getattr(stats, field)}')
+
+            if budget is not None:
+                lines.append(f"# HELP {ns}_rate_limit_remaining Points left in the current rate limit window.")
+                lines.append(f"# TYPE {ns}_rate_limit_remaining gauge")
+                lines.append(f"{ns}_rate_limit_remaining {budget.remaining}")
+                lines.append(f"# HELP {ns}_rate_limit_limit Points of a full rate limit window.")
+                lines.append(f"# TYPE {ns}_rate_limit_limit gauge")
+                lines.append(f"{ns}_rate_limit_limit {budget.limit}")
+        return "\n".join(lines) + "\n"
+
+
+class Metrics(object):
+    """
+    Forwards the observations of the request path to every sink. HelixApi only builds observations when it has one,
+    so leaving it unset costs a single None check per call.
+    """
+
+    def __init__(self, *sinks: MetricsSink):
+        self.sinks = list(sinks)
+
+    def add_sink(self, sink: MetricsSink):
+        self.sinks.append(sink)
+        return sink
+
+    def request(self, method: str, path: str, status: int, seconds: float, size: int):
+        for sink in self.sinks:
+            sink.observe_request(method, path, status, seconds, size)
+
+    def retry(self, method: str, path: str):
+        for sink in self.sinks:
+            sink.observe_retry(method, path)
+
+    def cache_hit(self, method: str, path: str):
+        for sink in self.sinks:
+            sink.observe_cache_hit(method, path)
+
+    def rate_budget(self, budget):
+        for sink in self.sinks:
+            sink.observe_rate_budget(budget)
@@ -0,0 +1,149 @@
+from sys import intern
+
+from helix.decoder import decode_response
+
+
+class Model(object):
+    """
+    Base of the typed Helix records. Fields are __slots__, so a record costs a fraction of the dict it is built from.
+    Fields missing from the payload are None and fields the model does not know about are dropped; the raw payload is
+    still available from the Page the record came from.
+    """
+    __slots__ = ()
+    # low cardinality string fields, e.g. type, language or game_id, that are interned so every record shares one
+    # copy. ids of users or broadcasters are not: interning them would only grow the interpreter's intern table.
+    _interned = ()
+
+    def __init__(self, **fields):
+        for name in self.__slots__:
+            setattr(self, name, fields.get(name))
+
+    @classmethod
+    def from_json(cls, data: dict):
+        """
+        :param data: One item of a Helix data array.
+        :return: Model instance.
+        """
+        record = cls.__new__(cls)
+        interned = cls._interned
+        for name in cls.__slots__:
+            value = data.get(name)
+            if name in interned and value is not None:
+                value = intern(value)
+            setattr(record, name, value)
+        return record
+
+    def to_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __eq__(self, other):
+        return type(self) is type(other) and self.to_dict() == other.to_dict()
+
+    # records are mutable and hold lists such as tag_ids, so they compare by value but are not hashable; key sets and
+    # dicts by record.id instead.
+    __hash__ = None
+
+    def __repr__(self):
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__[:3])
+        return f"{type(self).__name__}({fields})"
+
+
+class Stream(Model):
+    __slots__ = ("id", "user_id", "user_name", "game_id", "type", "title", "viewer_count", "started_at", "language",
+                 "thumbnail_url", "tag_ids")
+    _interned = ("game_id", "type", "language")
+
+
+class User(Model):
+    __slots__ = ("id", "login", "display_name", "type", "broadcaster_type", "description", "profile_image_url",
+                 "offline_image_url", "view_count", "email", "created_at")
+    _interned = ("type", "broadcaster_type")
+
+
+class Follow(Model):
+    __slots__ = ("from_id", "from_name", "to_id", "to_name", "followed_at")
+
+
+class Clip(Model):
+    __slots__ = ("id", "url", "embed_url", "broadcaster_id", "broadcaster_name", "creator_id", "creator_name",
+                 "video_id", "game_id", "language", "title", "view_count", "created_at", "thumbnail_url")
+    _interned = ("game_id", "language")
+
+
+class Video(Model):
+    __slots__ = ("id", "user_id", "user_name", "title", "description", "created_at", "published_at", "url",
+                 "thumbnail_url", "viewable", "view_count", "language", "type", "duration")
+    _interned = ("viewable", "language", "type")
+
+
+class Page(object):
+    """
+    One page of a Helix response. The body is decoded on first access and its data array is turned into model records
+    lazily. Anything else, e.g. status_code, headers or json(), is answered by the raw requests.Response.
+    """
+    __slots__ = ("response", "model", "_body", "_data")
+
+    def __init__(self, response, model=None):
+        """
+        :param response: requests.Response
+        :param model: Model class for the items of the data array. None keeps them as dicts.
+        """
+        self.response = response
+        self.model = model
+        self._body = None
+        self._data = None
+
+    @property
+    def body(self):
+        """
+        Decoded response body.
+        """
+        if self._body is None:
+            self._body = decode_response(self.response)
+        return self._body
+
+    def json(self):
+        """
+        Decoded response body, parsed once from the response bytes by helix.decoder.
+        """
+        return self.body
+
+    @property
+    def data(self):
+        """
+        Items of the data array, as model records.
+        """
+        if self._data is None:
+            items = self.body.get("data") or []
+            self._data = [self.model.from_json(item) for item in items] if self.model is not None else items
+        return self._data
+
+    @property
+    def cursor(self):
+        """
+        Cursor of the next page, or None on the last page.
+        """
+        return (self.body.get("pagination") or {}).get("cursor")
+
+    @property
+    def total(self):
+        return self.body.get("total")
+
+    def __iter__(self):
+        return iter(self.data)
+
+    def __len__(self):
+        return len(self.data)
+
+    def __bool__(self):
+        # truthiness follows requests.Response, not the number of items.
+        return self.response.ok
+
+    def __getitem__(self, index):
+        return self.data[index]
+
+    def __getattr__(self, name):
+        return getattr(self.response, name)
+
+    def __repr__(self):
+        return f"<Page [{self.response.status_code}] {self.response.url}>"
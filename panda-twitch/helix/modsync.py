@@ -0,0 +1,196 @@
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from requests import RequestException
+
+from helix.exceptions import PandaTwitchException
+
+STATE_VERSION = 1
+
+BAN = "moderation.user.ban"
+UNBAN = "moderation.user.unban"
+MODERATOR_ADD = "moderation.moderator.add"
+MODERATOR_REMOVE = "moderation.moderator.remove"
+
+
+def _expiry(expires_at):
+    """
+    :return: expires_at of a ban as epoch seconds, 0 for a permanent ban.
+    """
+    if not expires_at:
+        return 0
+    return datetime.fromisoformat(expires_at.replace("Z", "+00:00")).timestamp()
+
+
+class ModerationIndex(object):
+    """
+    Ban and moderator state of many channels, answering lookups from memory. Bans map user_id to the expiry of a
+    timeout, 0 when permanent, and expired timeouts count as not banned.
+    """
+
+    def __init__(self):
+        self.bans = {}
+        self.moderators = {}
+
+    def is_banned(self, broadcaster_id: str, user_id: str, now: float = None):
+        expires = self.bans.get(broadcaster_id, {}).get(user_id)
+        if expires is None:
+            return False
+        return not expires or expires > (time.time() if now is None else now)
+
+    def is_moderator(self, broadcaster_id: str, user_id: str):
+        return user_id in self.moderators.get(broadcaster_id, ())
+
+    def banned(self, broadcaster_id: str, now: float = None):
+        """
+        :return: IDs of the users currently banned or timed out in a channel.
+        """
+        now = time.time() if now is None else now
+        return {user_id for user_id, expires in self.bans.get(broadcaster_id, {}).items()
+                if not expires or expires > now}
+
+    def apply(self, broadcaster_id: str, event: dict):
+        """
+        Applies one ban, un-ban, moderator add or remove event.
+
+        :param broadcaster_id: Channel of the event.
+        :param event: Item of get_banned_events or get_moderator_events.
+        :return: None
+        """
+        data = event.get("event_data") or {}
+        user_id = data.get("user_id")
+        kind = event.get("event_type")
+        if kind == BAN:
+            self.bans.setdefault(broadcaster_id, {})[user_id] = _expiry(data.get("expires_at"))
+        elif kind == UNBAN:
+            self.bans.get(broadcaster_id, {}).pop(user_id, None)
+        elif kind == MODERATOR_ADD:
+            self.moderators.setdefault(broadcaster_id, set()).add(user_id)
+        elif kind == MODERATOR_REMOVE:
+            self.moderators.get(broadcaster_id, set()).discard(user_id)
+
+
+class ModerationSync(object):
+    """
+    Keeps a ModerationIndex of many channels up to date with as few calls as possible. The first sync of a channel
+    loads its current bans and moderators; later syncs walk get_banned_events and get_moderator_events, which Twitch
+    returns newest first, only until the last event already applied, and apply the new ones oldest first. The index
+    and the last event id of every channel are persisted, so a restart picks up where the last run stopped.
+    """
+
+    def __init__(self, path: str = None, max_workers: int = 8):
+        """
+        :param path: JSON file the state is kept in. Default: memory only.
+        :param max_workers: Channels synced at once by sync_all.
+        """
+        self.path = path
+        self.max_workers = max_workers
+        self.index = ModerationIndex()
+        # broadcaster_id -> {"bans": last ban event id, "moderators": last moderator event id, "synced_at": epoch}
+        self.channels = {}
+        self._lock = threading.Lock()
+        if path is not None and os.path.exists(path):
+            self._load()
+
+    def _latest(self, events):
+        event = next(iter(events), None)
+        return event and event.get("id")
+
+    def _new_events(self, events, last_id):
+        fresh = []
+        for event in events:
+            if event.get("id") == last_id:
+                break
+            fresh.append(event)
+        # pages come newest first, the state has to be rebuilt oldest first.
+        fresh.reverse()
+        return fresh
+
+    def sync(self, broadcaster_id: str, moderation):
+        """
+        Brings the index of one channel up to date.
+
+        :param broadcaster_id: Channel to sync.
+        :param moderation: TwitchModeration authorized as the broadcaster, with the moderation:read scope.
+        :return: Number of events applied, or the number of bans and moderators loaded on the first sync.
+        """
+        channel = self.channels.get(broadcaster_id)
+        if channel is None:
+            # the newest event ids are taken before the lists, events in between are applied again on the next sync.
+            channel = {
+                "bans": self._latest(moderation.iter_banned_events(broadcaster_id, first=1, max_items=1)),
+                "moderators": self._latest(moderation.iter_moderator_events(broadcaster_id, first=1, max_items=1)),
+            }
+            bans = {ban["user_id"]: _expiry(ban.get("expires_at"))
+                    for ban in moderation.iter_banned_users(broadcaster_id)}
+            moderators = {moderator["user_id"] for moderator in moderation.iter_moderators(broadcaster_id)}
+            with self._lock:
+                self.index.bans[broadcaster_id] = bans
+                self.index.moderators[broadcaster_id] = moderators
+                channel["synced_at"] = time.time()
+                self.channels[broadcaster_id] = channel
+            return len(bans) + len(moderators)
+
+        bans = self._new_events(moderation.iter_banned_events(broadcaster_id), channel["bans"])
+        moderators = self._new_events(moderation.iter_moderator_events(broadcaster_id), channel["moderators"])
+        with self._lock:
+            for event in bans + moderators:
+                self.index.apply(broadcaster_id, event)
+            if bans:
+                channel["bans"] = bans[-1]["id"]
+            if moderators:
+                channel["moderators"] = moderators[-1]["id"]
+            channel["synced_at"] = time.time()
+        return len(bans) + len(moderators)
+
+    def sync_all(self, channels: dict):
+        """
+        Syncs many channels concurrently and saves the state once they are done. A channel whose calls fail keeps
+        its previous state and is retried on the next run.
+
+        :param channels: {broadcaster_id: TwitchModeration authorized as that broadcaster}
+        :return: {broadcaster_id: events applied, or the exception the sync failed with}
+        """
+        def run(item):
+            broadcaster_id, moderation = item
+            try:
+                return broadcaster_id, self.sync(broadcaster_id, moderation)
+            except (RequestException, PandaTwitchException) as e:
+                return broadcaster_id, e
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            results = dict(executor.map(run, channels.items()))
+        self.save()
+        return results
+
+    def save(self):
+        """
+        Writes the state, replacing the previous file atomically.
+
+        :return: None
+        """
+        if self.path is None:
+            return
+        with self._lock:
+            state = {
+                "version": STATE_VERSION,
+                "channels": self.channels,
+                "bans": self.index.bans,
+                "moderators": {channel: sorted(users) for channel, users in self.index.moderators.items()},
+            }
+            with open(self.path + ".tmp", "w") as output:
+                json.dump(state, output)
+            os.replace(self.path + ".tmp", self.path)
+
+    def _load(self):
+        with open(self.path) as checkpoint:
+            state = json.load(checkpoint)
+        if state.get("version") != STATE_VERSION:
+            raise ValueError(f"Unsupported moderation state version: {state.get('version')}")
+        self.channels = state["channels"]
+        self.index.bans = state["bans"]
+        self.index.moderators = {channel: set(users) for channel, users in state["moderators"].items()}
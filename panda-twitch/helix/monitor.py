@@ -0,0 +1,209 @@
+import math
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+from requests import RequestException
+
+from helix.api import MAX_IDS_PER_REQUEST
+from helix.exceptions import PandaTwitchException
+
+LIVE = "live"
+OFFLINE = "offline"
+TITLE_CHANGE = "title"
+GAME_CHANGE = "game"
+
+# kind, user_id of the channel, current Stream record (None when it went offline) and the previous (title, game_id).
+StreamEvent = namedtuple("StreamEvent", ["kind", "user_id", "stream", "previous"])
+
+
+class StreamMonitor(object):
+    """
+    Watches a large set of channels for go-live, offline, title and game changes by polling get_streams in 100 channel
+    batches. Sweeps are paced to fit the rate limit budget and each batch is diffed against the previous state, so
+    only transitions reach the callbacks.
+    """
+
+    def __init__(self, streams, user_ids, interval: float = 60.0, budget_share: float = 0.8, max_workers: int = 8):
+        """
+        :param streams: TwitchStreams used for the polling.
+        :param user_ids: IDs of the channels to watch.
+        :param interval: Target seconds between the start of two full sweeps.
+        :param budget_share: Share of the rate limit budget the monitor may use, the rest is left for other calls.
+        :param max_workers: Maximum number of batches requested at once.
+        """
+        self.streams = streams
+        self.interval = interval
+        self.budget_share = budget_share
+        self.max_workers = max_workers
+        self.callbacks = {LIVE: [], OFFLINE: [], TITLE_CHANGE: [], GAME_CHANGE: []}
+        self.sweeps = 0
+        self.last_sweep_time = None
+
+        self._batches = []
+        # ids of live channels and (title, game_id) of each of them.
+        self._live = set()
+        self._details = {}
+        self._watch(user_ids)
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _watch(self, user_ids):
+        ids = sorted({int(user_id) for user_id in user_ids})
+        self._batches = [ids[start:start + MAX_IDS_PER_REQUEST] for start in range(0, len(ids), MAX_IDS_PER_REQUEST)]
+
+    def watch(self, user_ids):
+        """
+        Replaces the watchlist. Channels that are no longer watched are dropped from the state without events.
+
+        :param user_ids: IDs of the channels to watch.
+        :return: None
+        """
+        self._watch(user_ids)
+        watched = {user_id for batch in self._batches for user_id in batch}
+        self._live &= watched
+        self._details = {user_id: details for user_id, details in self._details.items() if user_id in watched}
+
+    @property
+    def live(self):
+        """
+        IDs of the channels that were live on the last sweep.
+        """
+        return frozenset(self._live)
+
+    def on(self, kind: str, callback):
+        """
+        Registers a callback for one kind of event.
+
+        :param kind: LIVE, OFFLINE, TITLE_CHANGE or GAME_CHANGE
+        :param callback: Called with a StreamEvent.
+        :return: The callback, so this can be used as a decorator factory.
+        """
+        self.callbacks[kind].append(callback)
+        return callback
+
+    def _emit(self, kind, user_id, stream, previous):
+        callbacks = self.callbacks[kind]
+        if callbacks:
+            event = StreamEvent(kind, str(user_id), stream, previous)
+            for callback in callbacks:
+                callback(event)
+
+    def _fetch(self, batch):
+        try:
+            page = self.streams.get_streams(user_id=batch, first=MAX_IDS_PER_REQUEST)
+        except (RequestException, PandaTwitchException):
+            # e.g. a throttled or retried-out call; the batch keeps its state until the next sweep.
+            return batch, None
+        return batch, page if page.ok else None
+
+    def _diff(self, batch, page):
+        """
+        Applies one batch snapshot to the state and emits its transitions.
+        """
+        now_live = {}
+        for stream in page:
+            now_live[int(stream.user_id)] = stream
+
+        was_live = self._live.intersection(batch)
+        for user_id in was_live.difference(now_live):
+            self._live.discard(user_id)
+            self._emit(OFFLINE, user_id, None, self._details.pop(user_id, None))
+
+        for user_id, stream in now_live.items():
+            details = (stream.title, stream.game_id)
+            previous = self._details.get(user_id)
+            self._details[user_id] = details
+            if user_id not in was_live:
+                self._live.add(user_id)
+                self._emit(LIVE, user_id, stream, previous)
+                continue
+            if previous[0] != details[0]:
+                self._emit(TITLE_CHANGE, user_id, stream, previous)
+            if previous[1] != details[1]:
+                self._emit(GAME_CHANGE, user_id, stream, previous)
+
+    def sweep_interval(self):
+        """
+        Seconds the next sweep should take: the target interval, stretched if the batches would not fit into the share
+        of the rate limit budget the monitor may use.
+
+        :return: float
+        """
+        limiter = self.streams.rate_limiter
+        points_per_second = limiter.limit / limiter.period * self.budget_share
+        return max(self.interval, len(self._batches) / points_per_second)
+
+    def sweep(self, paced: bool = False):
+        """
+        Polls every batch once and emits the transitions. Failed batches keep their previous state.
+
+        :param paced: Spread the batches evenly over sweep_interval() instead of sending them as fast as possible.
+        :return: Number of batches that failed.
+        """
+        batches = list(self._batches)
+        if not batches:
+            return 0
+
+        spacing = self.sweep_interval() / len(batches) if paced else 0
+        failed = 0
+        start = time.monotonic()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = []
+            for index, batch in enumerate(batches):
+                if spacing and self._stop.wait(max(0.0, start + index * spacing - time.monotonic())):
+                    break
+                futures.append(executor.submit(self._fetch, batch))
+
+            for future in futures:
+                batch, page = future.result()
+                if page is None:
+                    failed += 1
+                    continue
+                self._diff(batch, page)
+
+        self.sweeps += 1
+        self.last_sweep_time = time.monotonic() - start
+        return failed
+
+    def run(self):
+        """
+        Sweeps until stop() is called, one sweep per sweep_interval().
+
+        :return: None
+        """
+        while not self._stop.is_set():
+            started = time.monotonic()
+            self.sweep(paced=True)
+            self._stop.wait(max(0.0, self.sweep_interval() - (time.monotonic() - started)))
+
+    def start(self):
+        """
+        Runs the monitor in a background thread.
+
+        :return: None
+        """
+        self._stop.clear()
+        self._thread = threading.Thread(target=self.run, name="StreamMonitor", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = None):
+        """
+        Stops the background thread after the batch in progress.
+
+        :return: None
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def __len__(self):
+        return sum(len(batch) for batch in self._batches)
+
+    def batches(self):
+        """
+        :return: Number of get_streams calls per full sweep.
+        """
+        return math.ceil(len(self) / MAX_IDS_PER_REQUEST)
@@ -0,0 +1,135 @@
+import threading
+import time
+from collections import namedtuple
+
+from helix.exceptions import TwitchRateLimitException
+
+# limit, remaining and reset (unix time the bucket is full again) of a rate limit bucket.
+RateLimitBudget = namedtuple("RateLimitBudget", ["limit", "remaining", "reset"])
+
+
+class RateLimiter(object):
+    """
+    Client side token bucket that mirrors Twitch's Ratelimit-Limit/Remaining/Reset headers.
+
+    Callers reserve a point before every request and the bucket is corrected from the headers of every response, so
+    requests are throttled before Twitch starts answering with 429s.
+    """
+    _shared = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, limit: int = 800, period: float = 60.0, max_wait: float = None):
+        """
+        :param limit: Bucket size until Twitch tells us otherwise. App access tokens get 800 points per minute.
+        :param period: Seconds it takes an empty bucket to refill.
+        :param max_wait: Longest a caller may be throttled before TwitchRateLimitException is raised. Default: no limit.
+        """
+        self.limit = limit
+        self.period = period
+        self.max_wait = max_wait
+        self.tokens = float(limit)
+        self.rate = limit / period
+        self.reset = None
+        self._updated = time.monotonic()
+        # requests that reserved a point but have not seen their response headers yet.
+        self._pending = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_credentials(cls, client_id, user_id=None):
+        """
+        Returns the limiter shared by every resource instance using the same Twitch bucket. Twitch meters app access
+        tokens per client id and user tokens per client id and user, so limiters are keyed the same way rather than
+        by token: refreshed tokens keep draining the same bucket, and one limiter per token would leak with every
+        refresh.
+
+        :param client_id: Application client id.
+        :param user_id: User the token belongs to, None for app access tokens.
+        :return: RateLimiter
+        """
+        key = (client_id, user_id or "app")
+        limiter = cls._shared.get(key)
+        if limiter is None:
+            with cls._shared_lock:
+                limiter = cls._shared.setdefault(key, cls())
+        return limiter
+
+    def _refill(self, now):
+        self.tokens = min(float(self.limit), self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self):
+        """
+        Takes one point from the bucket.
+
+        :return: Seconds the caller has to wait before sending the request.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.tokens -= 1
+            self._pending += 1
+            if self.tokens >= 0:
+                return 0.0
+
+            wait = -self.tokens / self.rate
+            if self.max_wait is not None and wait > self.max_wait:
+                self.tokens += 1
+                self._pending -= 1
+                raise TwitchRateLimitException(f"Rate limit budget exhausted, next point in {wait:.2f}s.")
+            return wait
+
+    def update(self, response=None):
+        """
+        Corrects the bucket from the rate limit headers of a response.
+
+        :param response: requests.Response of the reserved request, or None if it failed before getting one.
+        :return: None
+        """
+        with self._lock:
+            self._pending = max(0, self._pending - 1)
+            if response is None:
+                return
+
+            headers = response.headers
+            try:
+                limit = int(headers["Ratelimit-Limit"])
+                remaining = int(headers["Ratelimit-Remaining"])
+                reset = int(headers["Ratelimit-Reset"])
+            except (KeyError, TypeError, ValueError):
+                return
+
+            now = time.monotonic()
+            until_reset = reset - time.time()
+            if response.status_code == 429:
+                remaining = 0
+
+            self.limit = limit
+            self.reset = reset
+            if until_reset > 0 and remaining < limit:
+                self.rate = (limit - remaining) / until_reset
+            else:
+                self.rate = limit / self.period
+            self.tokens = float(remaining - self._pending)
+            self._updated = now
+
+    @property
+    def budget(self):
+        """
+        Current state of the bucket, for schedulers that plan bulk work.
+
+        :return: RateLimitBudget
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            return RateLimitBudget(self.limit, max(0, int(self.tokens)), self.reset)
+
+    def time_until(self, points: int = 1):
+        """
+        :param points: Number of requests the caller wants to make.
+        :return: Seconds until that many points are available.
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            missing = points - self.tokens
+            return max(0.0, missing / self.rate)
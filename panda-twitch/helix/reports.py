@@ -0,0 +1,213 @@
+import csv
+import io
+import math
+import tempfile
+from array import array
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+from helix.retry import raise_for_response
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+GAME = "game"
+EXTENSION = "extension"
+
+# one slice of a report: the report entry it came from, columns keyed by CSV header and the number of rows.
+ReportChunk = namedtuple("ReportChunk", ["report", "columns", "rows"])
+
+
+def _report_url(report):
+    return report.get("URL") or report.get("url")
+
+
+def _is_numeric(values):
+    try:
+        for value in values:
+            if value:
+                float(value)
+    except ValueError:
+        return False
+    return True
+
+
+def _float(value):
+    """
+    :return: value as a float, NaN for an empty cell or one that is not a number.
+    """
+    try:
+        return float(value) if value else math.nan
+    except ValueError:
+        return math.nan
+
+
+def _is_id(name: str):
+    # e.g. "Game Id" or "Extension Client ID": numeric looking, but keys rather than quantities.
+    return name.strip().lower().endswith("id")
+
+
+class AnalyticsReports(object):
+    """
+    Downloads every extension or game analytics report of a query and parses them into columnar chunks.
+
+    Report URLs expire after five minutes, so every report is downloaded in parallel as soon as its page is listed and
+    spooled to a temporary file. The files are then parsed in chunks of rows: numeric columns become NumPy float64
+    arrays (or array('d') without NumPy) and other columns lists of str, so memory is bounded by the chunk size no
+    matter how long the reports are. Column types are settled on the first chunk of a report and kept for the rest;
+    id columns always stay str.
+    """
+
+    def __init__(self, analytics, max_workers: int = 8, chunk_rows: int = 50000, use_numpy: bool = None,
+                 spool_dir: str = None):
+        """
+        :param analytics: TwitchAnalytics used to list the reports.
+        :param max_workers: Reports downloaded at once.
+        :param chunk_rows: Rows per chunk.
+        :param use_numpy: Build NumPy arrays. Default: when NumPy is installed.
+        :param spool_dir: Directory of the temporary files. Default: the system temp directory.
+        """
+        self.analytics = analytics
+        self.max_workers = max_workers
+        self.chunk_rows = chunk_rows
+        self.use_numpy = numpy is not None if use_numpy is None else use_numpy
+        if self.use_numpy and numpy is None:
+            raise ImportError("use_numpy needs NumPy to be installed.")
+        self.spool_dir = spool_dir
+
+    def reports(self, kind: str = GAME, **filters):
+        """
+        :param kind: GAME or EXTENSION.
+        :param filters: Arguments of iter_game_analytics or iter_extension_analytics, e.g. game_id, started_at.
+        :return: Generator of report entries.
+        """
+        if kind == GAME:
+            return self.analytics.iter_game_analytics(**filters)
+        if kind == EXTENSION:
+            return self.analytics.iter_extension_analytics(**filters)
+        raise ValueError(f"Unknown report kind: {kind}")
+
+    def _download(self, report):
+        """
+        Streams one report to a temporary file.
+
+        :return: (report entry, file positioned at its start)
+        """
+        response = self.analytics.transport.request("GET", _report_url(report), stream=True)
+        try:
+            raise_for_response(response)
+            spool = tempfile.TemporaryFile(dir=self.spool_dir)
+            for block in response.iter_content(chunk_size=64 * 1024):
+                spool.write(block)
+        finally:
+            response.close()
+        spool.seek(0)
+        return report, spool
+
+    def _numeric_columns(self, header, rows, strings):
+        """
+        :return: Names of the columns parsed as numbers: every cell of the first chunk is a number and it is not an id
+                 or one of the strings columns.
+        """
+        return {name for name, values in zip(header, zip(*rows))
+                if name not in strings and not _is_id(name) and _is_numeric(values)}
+
+    def _columns(self, header, rows, numeric):
+        columns = {}
+        for name, values in zip(header, zip(*rows)):
+            if name not in numeric:
+                columns[name] = list(values)
+            elif self.use_numpy:
+                columns[name] = numpy.array([_float(value) for value in values], dtype=numpy.float64)
+            else:
+                columns[name] = array("d", (_float(value) for value in values))
+        return columns
+
+    def parse(self, report, spool, strings=()):
+        """
+        Parses a downloaded report chunk by chunk.
+
+        :param report: Report entry.
+        :param spool: Binary file holding the CSV.
+        :param strings: Columns kept as str even if they hold numbers.
+        :return: Generator of ReportChunk.
+        """
+        text = io.TextIOWrapper(spool, encoding="utf-8-sig", newline="")
+        reader = csv.reader(text)
+        header = next(reader, None)
+        if header is None:
+            return
+        rows = []
+        numeric = None
+        for row in reader:
+            if not row:
+                continue
+            # short rows are padded so every column keeps the same length.
+            rows.append(row + [""] * (len(header) - len(row)) if len(row) < len(header) else row[:len(header)])
+            if len(rows) == self.chunk_rows:
+                if numeric is None:
+                    numeric = self._numeric_columns(header, rows, strings)
+                yield ReportChunk(report, self._columns(header, rows, numeric), len(rows))
+                rows = []
+        if rows:
+            if numeric is None:
+                numeric = self._numeric_columns(header, rows, strings)
+            yield ReportChunk(report, self._columns(header, rows, numeric), len(rows))
+
+    def chunks(self, kind: str = GAME, strings=(), **filters):
+        """
+        Lists, downloads and parses every report of a query.
+
+        :param kind: GAME or EXTENSION.
+        :param strings: Columns kept as str even if they hold numbers.
+        :param filters: Arguments of iter_game_analytics or iter_extension_analytics.
+        :return: Generator of ReportChunk, report by report in listing order.
+        """
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            downloads = [executor.submit(self._download, report) for report in self.reports(kind, **filters)]
+            try:
+                for download in downloads:
+                    report, spool = download.result()
+                    with spool:
+                        yield from self.parse(report, spool, strings)
+            finally:
+                for download in downloads:
+                    if download.cancel() or download.exception() is not None:
+                        continue
+                    download.result()[1].close()
+
+    def sum_by(self, key: str, columns, kind: str = GAME, **filters):
+        """
+        Sums numeric columns of every report per value of a key column, e.g. totals per game or per day.
+
+        :param key: Column to group by, e.g. "Game Id".
+        :param columns: Numeric columns to sum.
+        :param kind: GAME or EXTENSION.
+        :param filters: Arguments of iter_game_analytics or iter_extension_analytics.
+        :return: {key value: {column: sum}}
+        """
+        totals = {}
+        for chunk in self.chunks(kind, strings=(key,), **filters):
+            keys = chunk.columns[key]
+            for column in columns:
+                if isinstance(chunk.columns[column], list):
+                    raise ValueError(f"{column} is not a numeric column.")
+            if self.use_numpy:
+                groups, inverse = numpy.unique(numpy.asarray(keys), return_inverse=True)
+                sums = {column: numpy.bincount(inverse, weights=numpy.nan_to_num(chunk.columns[column]),
+                                               minlength=len(groups)) for column in columns}
+                for index, group in enumerate(groups.tolist()):
+                    total = totals.setdefault(group, dict.fromkeys(columns, 0.0))
+                    for column in columns:
+                        total[column] += float(sums[column][index])
+                continue
+
+            for column in columns:
+                for group, value in zip(keys, chunk.columns[column]):
+                    # NaN, an empty or unparsable cell, is the only value not equal to itself.
+                    if value == value:
+                        total = totals.setdefault(group, dict.fromkeys(columns, 0.0))
+                        total[column] += value
+        return totals
@@ -1,12 +1,8 @@
 from helix.api import HelixApi
-from helix.scopes import used_scopes, ANALYTICS_READ_GAMES, ANALYTICS_READ_EXTENSIONS
-from helix.decorators import oauth_required, required_scope
-
-import requests
+from helix.endpoints import GET_EXTENSION_ANALYTICS, GET_GAME_ANALYTICS
 
 
 class TwitchAnalytics(HelixApi):
-    @required_scope(ANALYTICS_READ_EXTENSIONS, used_scopes)
     def get_extension_analytics(self, after: str = None, ended_at: str = None, extension_id: str = None, first: int = 20,
                                 started_at: str = None, analytics_type: str = None):
         """
@@ -21,26 +17,27 @@ class TwitchAnalytics(HelixApi):
         :param analytics_type: The type of analytics report that is returned.
         :return: ended_at, extension_id, pagination, started_at, type, url
         """
-        headers = {
-            "Authorization": f"Bearer {self.token}",
-            "Client-Id": f"{self.client_id}",
-        }
-
-        params = {
-            "after": after,
-            "ended_at": ended_at,
-            "extension_id": extension_id,
-            "first": first,
-            "started_at": started_at,
-            "type": analytics_type
-        }
+        return self._call(GET_EXTENSION_ANALYTICS, after=after, ended_at=ended_at, extension_id=extension_id,
+                          first=first, started_at=started_at, analytics_type=analytics_type)
 
-        response = requests.get(f"{self.base_url}/analytics/extensions", headers=headers, params=params)
+    def iter_extension_analytics(self, ended_at: str = None, extension_id: str = None, started_at: str = None,
+                                 analytics_type: str = None, after: str = None, first: int = 100,
+                                 max_items: int = None):
+        """
+        Walks every page of get_extension_analytics lazily.
 
-        return response
+        :param ended_at: Ending date/time for returned reports.
+        :param extension_id: Client ID value assigned to the extension when it was created.
+        :param started_at: Starting date/time for returned reports in RFC3339 format.
+        :param analytics_type: The type of analytics report that is returned.
+        :param after: Cursor to start from. Default: the first page.
+        :param first: Page size. Maximum 100. Default 100.
+        :param max_items: Stop after this many reports. Default: every report.
+        :return: Generator of reports.
+        """
+        return self._paginate(self.get_extension_analytics, max_items, ended_at=ended_at, extension_id=extension_id,
+                              started_at=started_at, analytics_type=analytics_type, after=after, first=first)
 
-    @oauth_required
-    @required_scope(ANALYTICS_READ_GAMES, used_scopes)
     def get_game_analytics(self, after: str = None, ended_at: str = None, first: int = None, game_id: str = None,
                            started_at: str = None, analytics_type: str = None):
         """
@@ -54,19 +51,22 @@ class TwitchAnalytics(HelixApi):
         :param analytics_type: The type of analytics report that is returned.
         :return: ended_at, game_id, pagination, started_at, type, URL
         """
-        headers = {
-            "Authorization": F"Bearer {self.token}",
-            "Client-Id": f"{self.client_id}",
-        }
+        return self._call(GET_GAME_ANALYTICS, after=after, ended_at=ended_at, first=first, game_id=game_id,
+                          started_at=started_at, analytics_type=analytics_type)
 
-        params = {
-            "after": after,
-            "ended_at": ended_at,
-            "first": first,
-            "game_id": game_id,
-            "started_at": started_at,
-            "type": analytics_type
-        }
+    def iter_game_analytics(self, ended_at: str = None, game_id: str = None, started_at: str = None,
+                            analytics_type: str = None, after: str = None, first: int = 100, max_items: int = None):
+        """
+        Walks every page of get_game_analytics lazily.
 
-        response = requests.get(f"{self.base_url}/analytics/games", headers=headers, params=params)
-        return response
+        :param ended_at: Ending date/time for returned reports.
+        :param game_id: Game ID. IF this is specified, the returned URL points to an analytics report for the specified game.
+        :param started_at: Starting date/time for returned reports in RFC3339 format.
+        :param analytics_type: The type of analytics report that is returned.
+        :param after: Cursor to start from. Default: the first page.
+        :param first: Page size. Maximum 100. Default 100.
+        :param max_items: Stop after this many reports. Default: every report.
+        :return: Generator of reports.
+        """
+        return self._paginate(self.get_game_analytics, max_items, ended_at=ended_at, game_id=game_id,
+                              started_at=started_at, analytics_type=analytics_type, after=after, first=first)
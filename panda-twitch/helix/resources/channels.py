@@ -1,12 +1,8 @@
-from helix.api import HelixApi
-from helix.decorators import required_scope, oauth_or_app_access_required, oauth_required
-from helix.scopes import used_scopes, CHANNEL_EDIT_COMMERCIAL, USER_READ_BROADCAST
-
-import requests
+from helix.api import HelixApi, _exceeds_batch, _lookup_values
+from helix.endpoints import START_COMMERCIAL, GET_CHANNEL_INFORMATION, MODIFY_CHANNEL_INFORMATION
 
 
 class TwitchChannels(HelixApi):
-    @required_scope(CHANNEL_EDIT_COMMERCIAL, used_scopes)
     def start_commercial(self, broadcaster_id: str, commercials_length: int):
         """
         Starts a commercial on a specified channel.
@@ -16,42 +12,22 @@ class TwitchChannels(HelixApi):
         180
         :return: length of triggered commercial, message on why the request failed, and how long you may retry.
         """
-        headers = {
-            "Authorization": f"Bearer {self.token}",
-            "Client-Id": f"{self.client_id}",
-            "Content-Type": 'application/json',
-        }
-
-        data = {
-            "broadcaster_id": broadcaster_id,
-            "length": commercials_length
-        }
+        return self._call(START_COMMERCIAL, broadcaster_id=broadcaster_id, commercials_length=commercials_length)
 
-        response = requests.post(f"{self.base_url}/channels/commercial", headers=headers, data=data)
-        return response
-
-    @oauth_or_app_access_required
     def get_channel_information(self, broadcaster_id: str):
         """
         Gets Channel information for users.
 
-        :param broadcaster_id: ID of the channel to be updated
+        :param broadcaster_id: ID of the channel. Multiple IDs can be specified. More than 100 are requested in parallel
+        chunks.
         :return: broadcaster_id, game_name, game_id, broadcaster_language, title
         """
-        headers = {
-            "Authorization": f"Bearer {self.token}",
-            "Client-Id": f"{self.client_id}",
-        }
-
-        params = {
-            "broadcaster_id": broadcaster_id,
-        }
+        broadcaster_id = _lookup_values(broadcaster_id)
+        if _exceeds_batch(broadcaster_id):
+            return self._fan_out(self.get_channel_information, [("broadcaster_id", "broadcaster_id", broadcaster_id)])
 
-        response = requests.get(f"{self.base_url}/channels", headers=headers, params=params)
-        return response
+        return self._call(GET_CHANNEL_INFORMATION, broadcaster_id=broadcaster_id)
 
-    @oauth_required
-    @required_scope(USER_READ_BROADCAST, used_scopes)
     def modify_channel_information(self, broadcaster_id: str, game_id: str = None, broadcaster_language: str = None, title: str = None):
         """
         Modifies channel information for users.
@@ -62,22 +38,6 @@ class TwitchChannels(HelixApi):
         :param title: The title of the stream.
         :return: HTTP Codes 204/400/500
         """
-        headers = {
-            "Authorization": f"Bearer {self.token}",
-            "Client-Id": f"{self.client_id}",
-            "Content-Type": "application/json",
-        }
-
-        params = {
-            "broadcaster_id": broadcaster_id
-        }
-
-        data = {
-            "game_id": game_id,
-            "broadcaster_language": broadcaster_language,
-            "title": title
-        }
-
-        response = requests.patch(f"{self.base_url}/channels", headers=headers, params=params, data=data)
-        return response
+        return self._call(MODIFY_CHANNEL_INFORMATION, broadcaster_id=broadcaster_id, game_id=game_id,
+                          broadcaster_language=broadcaster_language, title=title)
 
@@ -1,11 +1,8 @@
 from helix.api import HelixApi
-from helix.decorators import app_access_required, oauth_required
-from helix.scopes import used_scopes
-import requests
+from helix.endpoints import CREATE_ENTITLEMENT_GRANTS_UPLOAD_URL, GET_CODE_STATUS, GET_DROPS_ENTITLEMENTS, REDEEM_CODE
 
 
 class TwitchEntitlements(HelixApi):
-    @app_access_required
     def create_entitlement_grants_upload_url(self, manifest_id: str, entitlement_type: str):
         """
         Creates a URL where you can upload a manifest file and notify users that they have an entitlement.
@@ -14,18 +11,8 @@ class TwitchEntitlements(HelixApi):
         :param entitlement_type: Type of an entitlement being granted. Only bulk_drops_grant is supported.
         :return:
         """
-        headers = {
-            "Authorization": f"Bearer {self.token}",
-            "Client-Id": f"{self.client_id}",
-        }
-
-        params = {
-            "manifest_id": manifest_id,
-            "type": entitlement_type
-        }
-
-        response = requests.post(f"{self.base_url}/entitlements/upload", headers=headers, params=params)
-        return response
+        return self._call(CREATE_ENTITLEMENT_GRANTS_UPLOAD_URL, manifest_id=manifest_id,
+                          entitlement_type=entitlement_type)
 
     def get_code_status(self, code: str, user_id: int):
         """
@@ -35,20 +22,8 @@ class TwitchEntitlements(HelixApi):
         :param user_id: Represents anumeric Twitch user ID. The user account which is going to receive the entitlement.
         :return: data array with code and status.
         """
-        headers = {
-            "Authorization": f"Bearer {self.token}",
-            "Client-Id": f"{self.client_id}",
-        }
-
-        params = {
-            "code": code,
-            "user_id": user_id,
-        }
+        return self._call(GET_CODE_STATUS, code=code, user_id=user_id)
 
-        response = requests.get(f"{self.base_url}/entitlements/codes", headers=headers, params=params)
-        return response
-
-    @oauth_required
     def get_drops_entitlements(self, entitlement_id: str = None, user_id: str = None, game_id: str = None, after: str = None, first: int = 20):
         """
         Gets a list of entitlements for a given organization that have been granted to a game, user or both.
@@ -60,23 +35,25 @@ class TwitchEntitlements(HelixApi):
         :param first: Maximum number of entitlements to return. Default:20 Maximum:100
         :return: pagination, data, id, benefit_id, timestamp, user_id, game_id
         """
-        headers = {
-            "Authorization": f"Bearer {self.token}",
-            "Client-Id": f"{self.client_id}",
-        }
+        return self._call(GET_DROPS_ENTITLEMENTS, entitlement_id=entitlement_id, user_id=user_id, game_id=game_id,
+                          after=after, first=first)
 
-        params = {
-            "entitlement_id": entitlement_id,
-            "user_id": user_id,
-            "game_id": game_id,
-            "after": after,
-            "first": first
-        }
+    def iter_drops_entitlements(self, entitlement_id: str = None, user_id: str = None, game_id: str = None,
+                                after: str = None, first: int = 100, max_items: int = None):
+        """
+        Walks every page of get_drops_entitlements lazily.
 
-        response = requests.get(f"{self.base_url}/entitlements/drops", headers=headers, params=params)
-        return response
+        :param entitlement_id: Unique identifier of the entitlement.
+        :param user_id: A Twitch User ID
+        :param game_id: A Twitch Game ID
+        :param after: Cursor to start from. Default: the first page.
+        :param first: Page size. Default:100 Maximum:100
+        :param max_items: Stop after this many entitlements. Default: every entitlement.
+        :return: Generator of entitlements.
+        """
+        return self._paginate(self.get_drops_entitlements, max_items, entitlement_id=entitlement_id, user_id=user_id,
+                              game_id=game_id, after=after, first=first)
 
-    @app_access_required
     def redeem_code(self, code: str, user_id: int):
         """
         Redeems one or more provided codes to the authenticated Twitch user.
@@ -86,15 +63,4 @@ class TwitchEntitlements(HelixApi):
         :param user_id: Represents a numeric Twitch user ID. The user account which is going to receive the entitlement.
         :return: Array of payloads each of which includes code(string) and status (string)
         """
-        headers = {
-            "Authorization": f"Bearer {self.token}",
-            "Client-Id": f"{self.client_id}",
-        }
-
-        params = {
-            "code": code,
-            "user_id": user_id
-        }
-
-        response = requests.post(f"{self.base_url}/entitlements/codes", headers=headers, params=params)
-        return response
+        return self._call(REDEEM_CODE, code=code, user_id=user_id)
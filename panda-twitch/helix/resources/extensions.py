@@ -1,10 +1,8 @@
 from helix.api import HelixApi
-from helix.decorators import oauth_or_app_access_required
-import requests
+from helix.endpoints import GET_EXTENSION_TRANSACTIONS
 
 
 class TwitchExtensions(HelixApi):
-    @oauth_or_app_access_required
     def get_extension_transactions(self, extension_id: str, transaction_id: str = None, after: str = None,
                                    first: int = 20):
         """
@@ -17,17 +15,20 @@ class TwitchExtensions(HelixApi):
         :param first: Maximum number of objects to return. Default: 100 Default: 20
         :return: pagination, data, id, timestamp, broadcaster_id, broadcaster_name, user_id, user_name, product_type, product_data, domain, broadcast, expiration, sku, cost, amount, type, "bits", displayName, inDevelopment
         """
-        headers = {
-            "Authorization": f"Bearer {self.token}",
-            "Client-Id": f"{self.client_id}",
-        }
+        return self._call(GET_EXTENSION_TRANSACTIONS, extension_id=extension_id, transaction_id=transaction_id,
+                          after=after, first=first)
 
-        params = {
-            "extension_id": extension_id,
-            "transaction_id": transaction_id,
-            "after": after,
-            "first": first
-        }
+    def iter_extension_transactions(self, extension_id: str, transaction_id: str = None, after: str = None,
+                                    first: int = 100, max_items: int = None):
+        """
+        Walks every page of get_extension_transactions lazily.
 
-        response = requests.get(f"{self.base_url}/extensions/transactions", headers=headers, params=params)
-        return response
+        :param extension_id: ID of the extension to list transaction for. Maximum = 1
+        :param transaction_id: Transaction IDs to loop up.
+        :param after: Cursor to start from. Default: the first page.
+        :param first: Page size. Maximum: 100 Default: 100
+        :param max_items: Stop after this many transactions. Default: every transaction.
+        :return: Generator of transactions.
+        """
+        return self._paginate(self.get_extension_transactions, max_items, extension_id=extension_id,
+                              transaction_id=transaction_id, after=after, first=first)
@@ -1,5 +1,5 @@
-from helix.api import HelixApi
-import requests
+from helix.api import HelixApi, _exceeds_batch, _lookup_values
+from helix.endpoints import GET_TOP_GAMES, GET_GAMES
 
 
 class TwitchGames(HelixApi):
@@ -12,37 +12,29 @@ class TwitchGames(HelixApi):
         :param first: Maximum number of objects to return. Default: 20 Maximum: 100
         :return: box_art_url, id, name, pagination
         """
-        headers = {
-            "Authorization": f"Bearer {self.token}",
-            "Client-Id": f"{self.client_id}",
-        }
+        return self._call(GET_TOP_GAMES, after=after, before=before, first=first)
 
-        params = {
-            "after": after,
-            "before": before,
-            "first": first
-        }
+    def iter_top_games(self, after: str = None, first: int = 100, max_items: int = None):
+        """
+        Walks every page of get_top_games lazily.
 
-        response = requests.get(f"{self.base_url}/games/top", headers=headers, params=params)
-        return response
+        :param after: Cursor to start from. Default: the first page.
+        :param first: Page size. Maximum: 100 Default: 100
+        :param max_items: Stop after this many games. Default: every game.
+        :return: Generator of games, most popular first.
+        """
+        return self._paginate(self.get_top_games, max_items, after=after, first=first)
 
-    def get_games(self, game_id: str, name: str):
+    def get_games(self, game_id: str = None, name: str = None):
         """
         Gets game information by the game ID or name
 
-        :param game_id: Game ID. At most 100 id values can be specified.
-        :param name: Game name. The name must be an exact match.
+        :param game_id: Game ID. Multiple IDs can be specified. More than 100 are requested in parallel chunks.
+        :param name: Game name. The name must be an exact match. More than 100 are requested in parallel chunks.
         :return: box_art_url, id, name
         """
-        headers = {
-            "Authorization": f"Bearer {self.token}",
-            "Client-Id": f"{self.client_id}",
-        }
-
-        params = {
-            "id": game_id,
-            "name": name
-        }
-
-        response = requests.get(f"{self.base_url}/games", headers=headers, params=params)
-        return response
+        game_id, name = _lookup_values(game_id), _lookup_values(name)
+        if _exceeds_batch(game_id, name):
+            return self._fan_out(self.get_games, [("game_id", "id", game_id), ("name", "name", name)])
+
+        return self._call(GET_GAMES, game_id=game_id, name=name)
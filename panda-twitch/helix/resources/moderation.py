@@ -1,12 +1,9 @@
 from helix.api import HelixApi
-from helix.decorators import oauth_required, required_scope
-from helix.scopes import used_scopes, MODERATION_READ
-import requests
+from helix.endpoints import CHECK_AUTOMOD_STATUS, GET_BANNED_USERS, GET_BANNED_EVENTS, GET_MODERATORS, \
+    GET_MODERATOR_EVENTS
 
 
 class TwitchModeration(HelixApi):
-    @oauth_required
-    @required_scope(MODERATION_READ, used_scopes)
     def check_automod_status(self, broadcaster_id: str, msg_id: str, msg_text: str, user_id: str):
         """
         Determines whether a string message meets the channel's Automod requirements.
@@ -17,21 +14,22 @@ class TwitchModeration(HelixApi):
         :param user_id: User id of the sender.
         :return: msg_id, is_permitted
         """
-        headers = {
-            "Authorization": f"Bearer {self.token}",
-            "Client-Id": f"{self.client_id}"
-        }
-        data = {
-            "broadcaster_id": broadcaster_id,
-            "msg_id": msg_id,
-            "msg_text": msg_text,
-            "user_id": user_id
-        }
-        response = requests.post(f"{self.base_url}/moderation/enforcements/status", headers=headers, data=data)
-        return response
-
-    @oauth_required
-    @required_scope(MODERATION_READ, used_scopes)
+        return self._call(CHECK_AUTOMOD_STATUS, broadcaster_id=broadcaster_id, msg_id=msg_id, msg_text=msg_text,
+                          user_id=user_id)
+
+    def check_automod_statuses(self, broadcaster_id: str, messages):
+        """
+        Determines for several messages in one call whether they meet the channel's Automod requirements.
+
+        :param broadcaster_id: Provided broadcaster_id must match the user_id in the auth token.
+        :param messages: (msg_id, msg_text, user_id) tuples.
+        :return: msg_id, is_permitted of every message
+        """
+        kwargs = self._prepare(CHECK_AUTOMOD_STATUS, {"broadcaster_id": broadcaster_id})
+        kwargs["json"] = {"data": [{"msg_id": msg_id, "msg_text": msg_text, "user_id": user_id}
+                                   for msg_id, msg_text, user_id in messages]}
+        return self._request(CHECK_AUTOMOD_STATUS.method, self.base_url + CHECK_AUTOMOD_STATUS.path, **kwargs)
+
     def get_banned_users(self, broadcaster_id: str, user_id: str = None, after: str = None, before: str = None):
         """
         Returns all banned and timed-out users in a channel.
@@ -42,23 +40,21 @@ class TwitchModeration(HelixApi):
         :param before: Cursor for backward pagination: tells the server where to start fetching the next set of results.
         :return: user_id, user_name, expires_as, pagination
         """
-        headers = {
-            "Authorization": f"Bearer {self.token}",
-            "Client-Id": f"{self.client_id}"
-        }
+        return self._call(GET_BANNED_USERS, broadcaster_id=broadcaster_id, user_id=user_id, after=after, before=before)
 
-        params = {
-            "broadcaster_id": broadcaster_id,
-            "user_id": user_id,
-            "after": after,
-            "before": before
-        }
+    def iter_banned_users(self, broadcaster_id: str, user_id: str = None, after: str = None, max_items: int = None):
+        """
+        Walks every page of get_banned_users lazily.
 
-        response = requests.get(f"{self.base_url}/moderation/banned", headers=headers, params=params)
-        return response
+        :param broadcaster_id: Provided broadcaster_id must match the user_id in the auth token.
+        :param user_id: Filters the results and only returns a status objects for user who are banned in this channel and have a matching user_id.
+        :param after: Cursor to start from. Default: the first page.
+        :param max_items: Stop after this many users. Default: every user.
+        :return: Generator of banned users.
+        """
+        return self._paginate(self.get_banned_users, max_items, broadcaster_id=broadcaster_id, user_id=user_id,
+                              after=after)
 
-    @oauth_required
-    @required_scope(MODERATION_READ, used_scopes)
     def get_banned_events(self, broadcaster_id: str, user_id: str = None, after: str = None, first: str = "20"):
         """
         Returns all user bans and un-bans in a channel.
@@ -69,23 +65,23 @@ class TwitchModeration(HelixApi):
         :param first: Maximum number of objects to return. Maximum:100 Default:20
         :return: id, event_type, event_timestamp, pagination, version, event_data
         """
-        headers = {
-            "Authorization": f"Bearer {self.token}",
-            "Client-Id": f"{self.client_id}"
-        }
+        return self._call(GET_BANNED_EVENTS, broadcaster_id=broadcaster_id, user_id=user_id, after=after, first=first)
 
-        params = {
-            "broadcaster_id": broadcaster_id,
-            "user_id": user_id,
-            "after": after,
-            "first": first
-        }
+    def iter_banned_events(self, broadcaster_id: str, user_id: str = None, after: str = None, first: int = 100,
+                           max_items: int = None):
+        """
+        Walks every page of get_banned_events lazily.
 
-        response = requests.get(f"{self.base_url}/moderation/banned/events", headers=headers, params=params)
-        return response
+        :param broadcaster_id: Provided broadcaster_id must match the user_id in the auth token.
+        :param user_id: Filters the results and only returns a status object for users who are banned in this channel and have a matching user_id
+        :param after: Cursor to start from. Default: the first page.
+        :param first: Page size. Maximum:100 Default:100
+        :param max_items: Stop after this many events. Default: every event.
+        :return: Generator of ban and un-ban events.
+        """
+        return self._paginate(self.get_banned_events, max_items, broadcaster_id=broadcaster_id, user_id=user_id,
+                              after=after, first=first)
 
-    @oauth_required
-    @required_scope(MODERATION_READ, used_scopes)
     def get_moderators(self, broadcaster_id: str, user_id: str = None, after: str = None):
         """
         Returns all moderators in a channel
@@ -95,39 +91,45 @@ class TwitchModeration(HelixApi):
         :param after: Cursor for forward pagination: tells the server where to start fetching the next set of results.
         :return: user_id, user_name, pagination
         """
-        headers = {
-            "Authorization": f"Bearer {self.token}",
-            "Client-Id": f"{self.client_id}"
-        }
+        return self._call(GET_MODERATORS, broadcaster_id=broadcaster_id, user_id=user_id, after=after)
 
-        params = {
-            "broadcaster_id": broadcaster_id,
-            "user_id": user_id,
-            "after": after
-        }
+    def iter_moderators(self, broadcaster_id: str, user_id: str = None, after: str = None, max_items: int = None):
+        """
+        Walks every page of get_moderators lazily.
 
-        response = requests.get(f"{self.base_url}/moderation/moderators", headers=headers, params=params)
-        return response
+        :param broadcaster_id: Provided broadcaster_id must match the user_id in the auth token.
+        :param user_id: Filters the results and only returns a status object for users who are moderators in this channel and have a matching user_id
+        :param after: Cursor to start from. Default: the first page.
+        :param max_items: Stop after this many moderators. Default: every moderator.
+        :return: Generator of moderators.
+        """
+        return self._paginate(self.get_moderators, max_items, broadcaster_id=broadcaster_id, user_id=user_id,
+                              after=after)
 
-    @oauth_required
-    @required_scope(MODERATION_READ, used_scopes)
-    def get_moderator_events(self, broadcaster_id: str, user_id: str = None):
+    def get_moderator_events(self, broadcaster_id: str, user_id: str = None, after: str = None, first: str = "20"):
         """
         Returns a list of moderators or users added and removed as moderators from a channel.
 
         :param broadcaster_id: Provided broadcaster_id must match the user_id in the auth token.
         :param user_id: Filters the results and only returns a status object for users who are banned in this channel and have a matching user_id
+        :param after: Cursor for forward pagination: tells the server where to start fetching the next set of results.
+        :param first: Maximum number of objects to return. Maximum:100 Default:20
         :return: id, event_type, event_timestamp, pagination, version
         """
-        headers = {
-            "Authorization": f"Bearer {self.token}",
-            "Client-Id": f"{self.client_id}"
-        }
+        return self._call(GET_MODERATOR_EVENTS, broadcaster_id=broadcaster_id, user_id=user_id, after=after,
+                          first=first)
 
-        params = {
-            "broadcaster_id": broadcaster_id,
-            "user_id": user_id
-        }
+    def iter_moderator_events(self, broadcaster_id: str, user_id: str = None, after: str = None, first: int = 100,
+                              max_items: int = None):
+        """
+        Walks every page of get_moderator_events lazily.
 
-        response = requests.get(f"{self.base_url}/moderation/moderators/events", headers=headers, params=params)
-        return response
+        :param broadcaster_id: Provided broadcaster_id must match the user_id in the auth token.
+        :param user_id: Filters the results and only returns a status object for users who are moderators in this channel and have a matching user_id
+        :param after: Cursor to start from. Default: the first page.
+        :param first: Page size. Maximum:100 Default:100
+        :param max_items: Stop after this many events. Default: every event.
+        :return: Generator of moderator add and remove events.
+        """
+        return self._paginate(self.get_moderator_events, max_items, broadcaster_id=broadcaster_id, user_id=user_id,
+                              after=after, first=first)
@@ -1,10 +1,8 @@
 from helix.api import HelixApi
-from helix.decorators import oauth_or_app_access_required
-import requests
+from helix.endpoints import SEARCH_CATEGORIES, SEARCH_CHANNELS
 
 
 class TwitchSearch(HelixApi):
-    @oauth_or_app_access_required
     def search_categories(self, query: str, first: int = 20, after: str = None):
         """
         Returns a list of games or categories that match the query via name either entirely or partially.
@@ -14,21 +12,20 @@ class TwitchSearch(HelixApi):
         :param after: Cursor for forward pagination: tells the server where to start fetching the next set of results.
         :return: box_art_url, name, id
         """
-        headers = {
-            "Authorization": f"Bearer {self.token}",
-            "Client-Id": f"{self.client_id}"
-        }
+        return self._call(SEARCH_CATEGORIES, query=query, first=first, after=after)
 
-        params = {
-            "query": query,
-            "first": first,
-            "after": after
-        }
+    def iter_search_categories(self, query: str, after: str = None, first: int = 100, max_items: int = None):
+        """
+        Walks every page of search_categories lazily.
 
-        response = requests.get(f"{self.base_url}/search/categories", headers=headers, params=params)
-        return response
+        :param query: URI encoded search query
+        :param after: Cursor to start from. Default: the first page.
+        :param first: Page size. Maximum: 100 Default: 100
+        :param max_items: Stop after this many categories. Default: every category.
+        :return: Generator of categories.
+        """
+        return self._paginate(self.search_categories, max_items, query=query, after=after, first=first)
 
-    @oauth_or_app_access_required
     def search_channels(self, query: str, first: int = 20, after: str = None, live_only: bool = False,):
         """
         Returns a list of channels (users who have streamed within the past 6 months) that match the query via channel
@@ -40,17 +37,19 @@ class TwitchSearch(HelixApi):
         :param live_only: Filter results for live streams only. Default: False
         :return: game_id, id, display_name, broadcaster_language, title, thumbnail_url, is_live, started_at, tags_ids
         """
-        headers = {
-            "Authorization": f"Bearer {self.token}",
-            "Client-Id": f"{self.client_id}"
-        }
+        return self._call(SEARCH_CHANNELS, query=query, first=first, after=after, live_only=live_only)
 
-        params = {
-            "query": query,
-            "first": first,
-            "after": after,
-            "live_only": live_only
-        }
+    def iter_search_channels(self, query: str, live_only: bool = False, after: str = None, first: int = 100,
+                             max_items: int = None):
+        """
+        Walks every page of search_channels lazily.
 
-        response = requests.get(f"{self.base_url}/search/channels", headers=headers, params=params)
-        return response
+        :param query: URI encoded search query.
+        :param live_only: Filter results for live streams only. Default: False
+        :param after: Cursor to start from. Default: the first page.
+        :param first: Page size. Maximum:100 Default:100
+        :param max_items: Stop after this many channels. Default: every channel.
+        :return: Generator of channels.
+        """
+        return self._paginate(self.search_channels, max_items, query=query, live_only=live_only, after=after,
+                              first=first)
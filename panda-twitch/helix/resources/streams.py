@@ -1,12 +1,9 @@
-from helix.api import HelixApi
-from helix.decorators import oauth_required, oauth_or_app_access_required, required_scope, app_access_required
-from helix.scopes import used_scopes, USER_EDIT_BROADCAST, CHANNEL_READ_STREAM_KEY
-import requests
+from helix.api import HelixApi, _exceeds_batch, _lookup_values
+from helix.endpoints import GET_STREAM_KEY, GET_STREAMS, CREATE_STREAM_MARKER, GET_STREAM_MARKERS, \
+    GET_ALL_STREAM_TAGS, GET_STREAM_TAGS, REPLACE_STREAM_TAGS
 
 
 class TwitchStreams(HelixApi):
-    @oauth_required
-    @required_scope(CHANNEL_READ_STREAM_KEY, used_scopes)
     def get_stream_key(self, broadcaster_id):
         """
         Gets the channel stream key for a user.
@@ -14,19 +11,8 @@ class TwitchStreams(HelixApi):
         :param broadcaster_id: User ID of the broadcaster.
         :return: stream_key
         """
-        headers = {
-            "Authorization": f"Bearer {self.token}",
-            "Client-Id": f"{self.client_id}"
-        }
+        return self._call(GET_STREAM_KEY, broadcaster_id=broadcaster_id)
 
-        params = {
-            "broadcaster_id": broadcaster_id
-        }
-
-        response = requests.get(f"{self.base_url}/streams/key", headers=headers, params=params)
-        return response
-
-    @oauth_or_app_access_required
     def get_streams(self, after: str = None, before: str = None, first: int = 20, game_id: str = None,
                     language: str = None, user_id: str = None, user_login: str = None):
         """
@@ -36,33 +22,40 @@ class TwitchStreams(HelixApi):
         :param after: Cursor for forward pagination: tells the server where to start fetching the next set of results.
         :param before: Cursor for backward pagination: tells the server where to start fetching the next set of results.
         :param first: Maximum number of objects to return. Maximum:100 Default:20
+        :param game_id: Returns streams broadcasting a specified game ID. You can specify up to 100 idS.
+        :param language: Stream language. you can specify up to 100 languages.
+        :param user_id: Returns streams broadcast by one or more specified user IDs. More than 100 are requested in
+        parallel chunks.
+        :param user_login: Returns streams broadcast by on or more specified user login names. More than 100 are
+        requested in parallel chunks.
+        :return: Page of Stream records: game_id, id, language, pagination, started_at, tag_ids,thumbnail_url, title, type, user_id, user_name,
+        viewer_count
+        """
+        user_id, user_login = _lookup_values(user_id), _lookup_values(user_login)
+        if _exceeds_batch(user_id, user_login):
+            lookups = [("user_id", "user_id", user_id), ("user_login", "user_login", user_login)]
+            return self._fan_out(self.get_streams, lookups, first=100, game_id=game_id, language=language)
+
+        return self._call(GET_STREAMS, after=after, before=before, first=first, game_id=game_id, language=language,
+                          user_id=user_id, user_login=user_login)
+
+    def iter_streams(self, game_id: str = None, language: str = None, user_id: str = None, user_login: str = None,
+                     after: str = None, first: int = 100, max_items: int = None):
+        """
+        Walks every page of get_streams lazily.
+
         :param game_id: Returns streams broadcasting a specified game ID. You can specify up to 100 idS.
         :param language: Stream language. you can specify up to 100 languages.
         :param user_id: Returns streams broadcast by one or more specified user IDs. you can specify up to 100 ids.
         :param user_login: Returns streams broadcast by on or more specified user login names. You can specify up to 100 ids.
-        :return: game_id, id, language, pagination, started_at, tag_ids,thumbnail_url, title, type, user_id, user_name,
-        viewer_count
+        :param after: Cursor to start from. Default: the first page.
+        :param first: Page size. Maximum:100 Default:100
+        :param max_items: Stop after this many streams. Default: every stream.
+        :return: Generator of streams, most viewers first.
         """
-        headers = {
-            "Authorization": f"Bearer {self.token}",
-            "Client-Id": f"{self.client_id}"
-        }
-
-        params = {
-            "after": after,
-            "before": before,
-            "first": first,
-            "game_id": game_id,
-            "language": language,
-            "user_id": user_id,
-            "user_login": user_login
-        }
-
-        response = requests.get(f"{self.base_url}/streams", headers=headers, params=params)
-        return response
-
-    @oauth_required
-    @required_scope(USER_EDIT_BROADCAST, used_scopes)
+        return self._paginate(self.get_streams, max_items, game_id=game_id, language=language, user_id=user_id,
+                              user_login=user_login, after=after, first=first)
+
     def create_stream_marker(self, user_id: str, description: str = None):
         """
         Creates a marker in the stream of a user specified by the user ID. A marker is an arbitrary point in a stream
@@ -72,22 +65,8 @@ class TwitchStreams(HelixApi):
         :param description: Description of or comments on the marker. Max length is 140 characters.
         :return: created_at, description, id, position_seconds
         """
-        headers = {
-            "Authorization": f"Bearer {self.token}",
-            "Client-Id": f"{self.client_id}",
-            "Content-Type": "application/json",
-        }
-
-        data = {
-            "user_id": user_id,
-            "description": description
-        }
+        return self._call(CREATE_STREAM_MARKER, user_id=user_id, description=description)
 
-        response = requests.post(f"{self.base_url}/streams/markers", headers=headers, data=data)
-        return response
-
-    @oauth_required
-    @required_scope(USER_EDIT_BROADCAST, used_scopes)
     def get_stream_markers(self, user_id: str, video_id: str, after: str = None, before: str = None, first: int = 20):
         """
         Gets a list of markers for either a specified user's most recent stream or specified VOD/video (stream).
@@ -99,23 +78,24 @@ class TwitchStreams(HelixApi):
         :param first: Maximum number of objects to return. Maximum:100 Default:20
         :return: id, created_at, description, pagination, position_seconds, URL, user_id, user_name, video_id
         """
-        headers = {
-            "Authorization": f"Bearer {self.token}",
-            "Client-Id": f"{self.client_id}",
-        }
+        return self._call(GET_STREAM_MARKERS, user_id=user_id, video_id=video_id, after=after, before=before,
+                          first=first)
 
-        params = {
-            "user_id": user_id,
-            "video_id": video_id,
-            "after": after,
-            "before": before,
-            "first": first,
-        }
+    def iter_stream_markers(self, user_id: str, video_id: str, after: str = None, first: int = 100,
+                            max_items: int = None):
+        """
+        Walks every page of get_stream_markers lazily.
 
-        response = requests.get(f"{self.base_url}/streams/markers", headers=headers, params=params)
-        return response
+        :param user_id: ID of the broadcaster from whose stream markers are returned.
+        :param video_id: ID of the VOD/video show stream markers are returned.
+        :param after: Cursor to start from. Default: the first page.
+        :param first: Page size. Maximum:100 Default:100
+        :param max_items: Stop after this many videos. Default: every video.
+        :return: Generator of videos with their markers.
+        """
+        return self._paginate(self.get_stream_markers, max_items, user_id=user_id, video_id=video_id, after=after,
+                              first=first)
 
-    @app_access_required
     def get_all_stream_tags(self, after: str = None, first: int = 20, tag_id: str = None):
         """
         Gets the list of all stream tags defined by Twitch, optionally filtered by tag ID(s).
@@ -126,21 +106,20 @@ class TwitchStreams(HelixApi):
         specified tag(s) is(are) returned.
         :return: id, is_auto, localization_names, localization_descriptions, pagination
         """
-        headers = {
-            "Authorization": f"Bearer {self.token}",
-            "Client-Id": f"{self.client_id}",
-        }
+        return self._call(GET_ALL_STREAM_TAGS, after=after, first=first, tag_id=tag_id)
 
-        params = {
-            "after": after,
-            "first": first,
-            "tag_id": tag_id
-        }
+    def iter_all_stream_tags(self, tag_id: str = None, after: str = None, first: int = 100, max_items: int = None):
+        """
+        Walks every page of get_all_stream_tags lazily.
 
-        response = requests.get(f"{self.base_url}/tags/streams", headers=headers, params=params)
-        return response
+        :param tag_id: ID of a tag. If provided, only the specified tag(s) is(are) returned.
+        :param after: Cursor to start from. Default: the first page.
+        :param first: Page size. Maximum: 100 Default: 100
+        :param max_items: Stop after this many tags. Default: every tag.
+        :return: Generator of stream tags.
+        """
+        return self._paginate(self.get_all_stream_tags, max_items, tag_id=tag_id, after=after, first=first)
 
-    @app_access_required
     def get_stream_tags(self, broadcaster_id: str):
         """
         Gets the list of tags for specified stream (channel).
@@ -148,20 +127,8 @@ class TwitchStreams(HelixApi):
         :param broadcaster_id: ID of the stream that tags are going to be fetched.
         :return: is_auto, localization_names, localization_descriptions, tag_id
         """
-        headers = {
-            "Authorization": f"Bearer {self.token}",
-            "Client-Id": f"{self.client_id}",
-        }
-
-        params = {
-            "broadcaster_id": broadcaster_id
-        }
-
-        response = requests.get(f"{self.base_url}/streams/tags", headers=headers, params=params)
-        return response
+        return self._call(GET_STREAM_TAGS, broadcaster_id=broadcaster_id)
 
-    @oauth_required
-    @required_scope(USER_EDIT_BROADCAST, used_scopes)
     def replace_stream_tags(self, broadcaster_id: str, tag_ids: str = None):
         """
         Applies specified tags to a specified stream, overwriting any existing tags applied to that stream.
@@ -170,19 +137,4 @@ class TwitchStreams(HelixApi):
         :param tag_ids: IDs of tags to be applied to the stream. Maximum of 100 supported.
         :return: Nothing is returned.
         """
-        headers = {
-            "Authorization": f"Bearer {self.token}",
-            "Client-Id": f"{self.client_id}",
-            'Content-Type': 'application/json',
-        }
-
-        params = {
-            "broadcaster_id": broadcaster_id,
-        }
-
-        data = {
-            "tag_ids": tag_ids
-        }
-
-        response = requests.put(f"{self.base_url}/streams/tags", headers=headers, params=params, data=data)
-        return response
+        return self._call(REPLACE_STREAM_TAGS, broadcaster_id=broadcaster_id, tag_ids=tag_ids)
@@ -1,13 +1,9 @@
-from helix.api import HelixApi
-from helix.decorators import oauth_required, required_scope, oauth_or_app_access_required
-from helix.scopes import used_scopes, USER_EDIT_FOLLOWS, USER_READ_EMAIL, USER_EDIT, USER_READ_BROADCAST, \
-    USER_EDIT_BROADCAST
-import requests
+from helix.api import HelixApi, _exceeds_batch, _lookup_values
+from helix.endpoints import CREATE_USER_FOLLOWS, DELETE_USER_FOLLOWS, GET_USERS, GET_USERS_FOLLOWS, UPDATE_USER, \
+    GET_USER_EXTENSIONS, GET_USER_ACTIVE_EXTENSIONS, UPDATE_USER_EXTENSIONS
 
 
 class TwitchUsers(HelixApi):
-    @oauth_required
-    @required_scope(USER_EDIT_FOLLOWS, used_scopes)
     def create_user_follows(self, from_id: str, to_id: str, allow_notifications: bool = False):
         """
         Adds a specified user to the followers of a specified channel.
@@ -17,23 +13,8 @@ class TwitchUsers(HelixApi):
         :param allow_notifications: If true, the user gets email or push notifications when the channel goes live. Default: false
         :return: Codes 204/400/422
         """
-        headers = {
-            "Authorization": f"Bearer {self.token}",
-            "Client-Id": f"{self.client_id}",
-            "Content-Type": "application/json",
-        }
+        return self._call(CREATE_USER_FOLLOWS, from_id=from_id, to_id=to_id, allow_notifications=allow_notifications)
 
-        data = {
-            "from_id": from_id,
-            "to_id": to_id,
-            "allow_notifications": allow_notifications
-        }
-
-        response = requests.post(f"{self.base_url}/users/follows", headers=headers, data=data)
-        return response
-
-    @oauth_required
-    @required_scope(USER_EDIT_FOLLOWS, used_scopes)
     def delete_user_follows(self, from_id: str, to_id: str):
         """
         Deletes a specified user from the followers of a specified channel.
@@ -42,45 +23,25 @@ class TwitchUsers(HelixApi):
         :param to_id: Channel to be unfollowed by the user.
         :return: Codes 204/400/422
         """
-        headers = {
-            "Authorization": f"Bearer {self.token}",
-            "Client-Id": f"{self.client_id}",
-        }
-
-        params = {
-            "from_id": from_id,
-            "to_id": to_id,
-        }
+        return self._call(DELETE_USER_FOLLOWS, from_id=from_id, to_id=to_id)
 
-        response = requests.delete(f"{self.base_url}users/follows", headers=headers, params=params)
-        return response
-
-    @oauth_required
-    @required_scope(USER_READ_EMAIL, used_scopes)
     def get_users(self, user_id: str = None, login: str = None):
         """
         Gets information about one or more specified Twitch users. Users are identified by optional users IDs and/or
         login name. If neither a user ID nor a login name is specified, the user is looked up by Bearer Token.
 
-        :param user_id: User ID. Multiple user IDs can be specified. Limit: 100
-        :param login: User login name. Multiple login names can be specified. Limit: 100
-        :return: broadcaster_type, description, display_name, email, id, login, offline_image_url, profile_image_url,
+        :param user_id: User ID. Multiple user IDs can be specified. More than 100 are requested in parallel chunks.
+        :param login: User login name. Multiple login names can be specified. More than 100 are requested in parallel
+        chunks.
+        :return: Page of User records: broadcaster_type, description, display_name, email, id, login, offline_image_url, profile_image_url,
         type, view_count, created_at
         """
-        headers = {
-            "Authorization": f"Bearer {self.token}",
-            "Client-Id": f"{self.client_id}",
-        }
-
-        params = {
-            "id": user_id,
-            "login": login
-        }
+        user_id, login = _lookup_values(user_id), _lookup_values(login)
+        if _exceeds_batch(user_id, login):
+            return self._fan_out(self.get_users, [("user_id", "id", user_id), ("login", "login", login)])
 
-        response = requests.get(f"{self.base_url}/users", headers=headers, params=params)
-        return response
+        return self._call(GET_USERS, user_id=user_id, login=login)
 
-    @oauth_or_app_access_required
     def get_users_follows(self, after: str = None, first: int = 20, from_id: str = None, to_id: str = None):
         """
         Gets information on follow relationships between two Twitch Users. Information returned is sorted in order, most
@@ -90,25 +51,25 @@ class TwitchUsers(HelixApi):
         :param first: Maximum number of objects to return. maximum: 100 Default: 20
         :param from_id: User ID. The request returns information about users who are being followed by the from_id user.
         :param to_id: User ID. The request returns information about users who are following the to_id user.
-        :return: followed_at, from_id, from_name, pagination, to_id, to_name, total
+        :return: Page of Follow records: followed_at, from_id, from_name, pagination, to_id, to_name, total
         """
-        headers = {
-            "Authorization": f"Bearer {self.token}",
-            "Client-Id": f"{self.client_id}",
-        }
+        return self._call(GET_USERS_FOLLOWS, after=after, first=first, from_id=from_id, to_id=to_id)
 
-        params = {
-            "after": after,
-            "first": first,
-            "from_id": from_id,
-            "to_id": to_id,
-        }
+    def iter_users_follows(self, from_id: str = None, to_id: str = None, after: str = None, first: int = 100,
+                           max_items: int = None):
+        """
+        Walks every page of get_users_follows lazily.
 
-        response = requests.get(f"{self.base_url}/users/follows", headers=headers, params=params)
-        return response
+        :param from_id: User ID. Returns the users being followed by the from_id user.
+        :param to_id: User ID. Returns the users following the to_id user.
+        :param after: Cursor to start from. Default: the first page.
+        :param first: Page size. maximum: 100 Default: 100
+        :param max_items: Stop after this many follows. Default: every follow.
+        :return: Generator of follow relationships, most recent first.
+        """
+        return self._paginate(self.get_users_follows, max_items, from_id=from_id, to_id=to_id, after=after,
+                              first=first)
 
-    @oauth_required
-    @required_scope(USER_EDIT, used_scopes)
     def update_user(self, description: str = None):
         """
         Updates teh description of a user specified by a Bearer token.
@@ -116,36 +77,16 @@ class TwitchUsers(HelixApi):
         :param description: User's account description.
         :return: broadcaster_type, description, display_name, email, id, login, offline_image_url, profile_image_url, type, view_count, created_at
         """
-        headers = {
-            "Authorization": f"Bearer {self.token}",
-            "Client-Id": f"{self.client_id}",
-        }
-
-        params = {
-            "description": description,
-        }
-
-        response = requests.put(f"{self.base_url}/helix/users", headers=headers, params=params)
-        return response
+        return self._call(UPDATE_USER, description=description)
 
-    @oauth_required
-    @required_scope(USER_READ_BROADCAST, used_scopes)
     def get_user_extensions(self):
         """
         Gets a list of all extensions (both active and inactive) for a specified user, identified by a Bearer token.
 
         :return: can_activate, id, name, type, version
         """
-        headers = {
-            "Authorization": f"Bearer {self.token}",
-            "Client-Id": f"{self.client_id}",
-        }
+        return self._call(GET_USER_EXTENSIONS)
 
-        response = requests.get(f"{self.base_url}/users/extensions/list", headers=headers)
-        return response
-
-    @oauth_required
-    @required_scope(USER_EDIT_BROADCAST, used_scopes)
     def get_user_active_extensions(self, user_id: str = None):
         """
         Gets information about active extensions installed by a specified user, identified by a user ID or Bearer token.
@@ -153,28 +94,20 @@ class TwitchUsers(HelixApi):
         :param user_id: ID of the user whose installed extensions will be returned. Limit: 1
         :return: active, component, id, name, overlay, panel, version, x, y
         """
-        headers = {
-            "Authorization": f"Bearer {self.token}",
-            "Client-Id": f"{self.client_id}",
-        }
-
-        response = requests.get(f"{self.base_url}/users/extensions", headers=headers)
-        return response
+        return self._call(GET_USER_ACTIVE_EXTENSIONS, user_id=user_id)
 
-    @oauth_required
-    @required_scope(USER_EDIT_BROADCAST, used_scopes)
-    def update_user_extensions(self):
+    def update_user_extensions(self, panel: dict = None, overlay: dict = None, component: dict = None):
         """
         Updates the activation state, extension ID, and/or version number of installed extensions for a specified user,
-        identified by a Bearer token.
+        identified by a Bearer token. Each kind maps a slot number to its extension, e.g.
+        {"1": {"active": True, "id": "rh6jq1q334hqc2rr1qlzqbvwlfl3x0", "version": "1.1.0"}}; kinds left as None are
+        not changed.
 
+        :param panel: Panel extensions by slot.
+        :param overlay: Overlay extensions by slot.
+        :param component: Component extensions by slot, which may also give x and y.
         :return: active, component, id, name, overlay, panel, version, x, y
         """
-        headers = {
-            "Authorization": f"Bearer {self.token}",
-            "Client-Id": f"{self.client_id}",
-            "Content-Type": "application/json",
-        }
-
-        # response = requests.put(f"{self.base_url}/users/extensions", headers=headers,)
-        return "This API call is not supported right now."
+        data = {kind: slots for kind, slots in (("panel", panel), ("overlay", overlay), ("component", component))
+                if slots is not None}
+        return self._call(UPDATE_USER_EXTENSIONS, data=data)
@@ -1,10 +1,8 @@
 from helix.api import HelixApi
-from helix.decorators import oauth_or_app_access_required
-import requests
+from helix.endpoints import GET_VIDEOS
 
 
 class TwitchVideos(HelixApi):
-    @oauth_or_app_access_required
     def get_videos(self, video_id: str = None, user_id: str = None, game_id: str = None, after: str = None,
                    before: str = None, first: str = "20", language: str = None, period: str = None, sort: str = None,
                    video_type: str = None):
@@ -21,25 +19,29 @@ class TwitchVideos(HelixApi):
         :param period: Period during which the video was created. Valid values: all, day, week, month. Default: all
         :param sort: Sort order of the videos. Valid values: time, trending, view. Default:time
         :param video_type: Type of video. Valid values: all, upload, archive, highlight. Default: all
-        :return: created_at, description, duration, id, language, pagination, published_at, thumbnail_url, title, type, url, user_id, user_name, view_count, viewable
+        :return: Page of Video records: created_at, description, duration, id, language, pagination, published_at, thumbnail_url, title, type, url, user_id, user_name, view_count, viewable
         """
-        headers = {
-            "Authorization": f"Bearer {self.token}",
-            "Client-Id": f"{self.client_id}",
-        }
+        return self._call(GET_VIDEOS, video_id=video_id, user_id=user_id, game_id=game_id, after=after, before=before,
+                          first=first, language=language, period=period, sort=sort, video_type=video_type)
 
-        params = {
-            "id": video_id,
-            "user_id": user_id,
-            "game_id": game_id,
-            "after": after,
-            "before": before,
-            "first": first,
-            "language": language,
-            "period": period,
-            "sort": sort,
-            "video_type": video_type
-        }
+    def iter_videos(self, video_id: str = None, user_id: str = None, game_id: str = None, language: str = None,
+                    period: str = None, sort: str = None, video_type: str = None, after: str = None, first: int = 100,
+                    max_items: int = None):
+        """
+        Walks every page of get_videos lazily.
 
-        response = requests.get(f"{self.base_url}/videos", headers=headers, params=params)
-        return response
+        :param video_id: ID of the video being queried. Limit: 100.
+        :param user_id: ID of the user who owns the video. Limit: 1
+        :param game_id: ID of the game the video is of. Limit: 1
+        :param language: Language of the video being queried. Limit 1
+        :param period: Period during which the video was created. Valid values: all, day, week, month. Default: all
+        :param sort: Sort order of the videos. Valid values: time, trending, view. Default:time
+        :param video_type: Type of video. Valid values: all, upload, archive, highlight. Default: all
+        :param after: Cursor to start from. Default: the first page.
+        :param first: Page size. Limit: 100 Default: 100
+        :param max_items: Stop after this many videos. Default: every video.
+        :return: Generator of videos.
+        """
+        return self._paginate(self.get_videos, max_items, video_id=video_id, user_id=user_id, game_id=game_id,
+                              language=language, period=period, sort=sort, video_type=video_type, after=after,
+                              first=first)
@@ -1,10 +1,8 @@
 from helix.api import HelixApi
-from helix.decorators import app_access_required
-import requests
+from helix.endpoints import GET_WEBHOOK_SUBSCRIPTIONS
 
 
 class TwitchWebHooks(HelixApi):
-    @app_access_required
     def get_webhook_subscriptions(self, after: str = None, first: str = "20"):
         """
         Gets the webhook subscriptions of a user identified by a Bearer token, in order of expiration.
@@ -12,15 +10,15 @@ class TwitchWebHooks(HelixApi):
         :param first: Number of values to be returned per page. Limit: 100 Default: 20
         :return: callback, expires_at, pagination, topic, total.
         """
-        headers = {
-            "Authorization": f"Bearer {self.token}",
-            "Client-Id": f"{self.client_id}",
-        }
+        return self._call(GET_WEBHOOK_SUBSCRIPTIONS, after=after, first=first)
 
-        params = {
-            "first": first,
-            "after": after,
-        }
+    def iter_webhook_subscriptions(self, after: str = None, first: int = 100, max_items: int = None):
+        """
+        Walks every page of get_webhook_subscriptions lazily.
 
-        response = requests.get(f"{self.base_url}/webhooks/subscriptions", headers=headers, params=params)
-        return response
+        :param after: Cursor to start from. Default: the first page.
+        :param first: Page size. Limit: 100 Default: 100
+        :param max_items: Stop after this many subscriptions. Default: every subscription.
+        :return: Generator of webhook subscriptions.
+        """
+        return self._paginate(self.get_webhook_subscriptions, max_items, after=after, first=first)
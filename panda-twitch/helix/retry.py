@@ -0,0 +1,124 @@
+import random
+import time
+from email.utils import parsedate_to_datetime
+
+from helix.exceptions import TwitchAuthenticationException, TwitchBadRequestException, TwitchEntityException, \
+    TwitchInternalServerException, TwitchRateLimitException, TwitchServiceUnavailableException, PandaTwitchException
+
+# exception raised for each error status Twitch documents; other 4xx/5xx fall back to the nearest class.
+STATUS_EXCEPTIONS = {
+    400: TwitchBadRequestException,
+    401: TwitchAuthenticationException,
+    422: TwitchEntityException,
+    429: TwitchRateLimitException,
+    500: TwitchInternalServerException,
+    503: TwitchServiceUnavailableException,
+}
+
+# methods that can be sent twice without side effects.
+IDEMPOTENT_METHODS = frozenset(("GET", "HEAD", "OPTIONS", "PUT", "DELETE"))
+# statuses worth another attempt; 429 is safe for every method, Twitch did not process the request.
+RETRY_STATUSES = frozenset((429, 500, 502, 503, 504))
+
+
+def classify(response):
+    """
+    Maps an error response to the matching exception.
+
+    :param response: requests.Response
+    :return: PandaTwitchException instance with the response attached, or None if the response is a success.
+    """
+    status = response.status_code
+    if status < 400:
+        return None
+    exception_class = STATUS_EXCEPTIONS.get(status)
+    if exception_class is None:
+        exception_class = TwitchInternalServerException if status >= 500 else PandaTwitchException
+    error = exception_class(f"{status} {response.reason} for url: {response.url}")
+    error.response = response
+    return error
+
+
+def raise_for_response(response):
+    """
+    Raises the exception classify maps an error response to.
+
+    :param response: requests.Response
+    :return: None
+    """
+    error = classify(response)
+    if error is not None:
+        raise error
+
+
+def _retry_after(response):
+    """
+    :return: Seconds the response asks us to wait, from Retry-After or the rate limit reset of a 429, or None.
+    """
+    headers = response.headers
+    value = headers.get("Retry-After")
+    if value is not None:
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            try:
+                return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+            except (TypeError, ValueError):
+                pass
+    if response.status_code == 429 and headers.get("Ratelimit-Reset") is not None:
+        try:
+            return max(0.0, int(headers["Ratelimit-Reset"]) - time.time())
+        except ValueError:
+            pass
+    return None
+
+
+class RetryPolicy(object):
+    """
+    Decides whether and when a failed call is sent again: exponential backoff with full jitter, server requested waits
+    honoured, and every call bounded by a total time budget so retries cannot pile up.
+    """
+
+    def __init__(self, max_attempts: int = 5, base_delay: float = 0.5, max_delay: float = 30.0, budget: float = 60.0,
+                 methods=IDEMPOTENT_METHODS, statuses=RETRY_STATUSES):
+        """
+        :param max_attempts: Attempts per call, the first one included.
+        :param base_delay: Backoff of the first retry in seconds, doubled on every further one.
+        :param max_delay: Upper bound of a single backoff.
+        :param budget: Seconds after which a call is not retried any more, counted from its first attempt.
+        :param methods: HTTP methods retried after server errors and connection failures.
+        :param statuses: Response statuses that are retried.
+        """
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.budget = budget
+        self.methods = frozenset(methods)
+        self.statuses = frozenset(statuses)
+
+    def backoff(self, method: str, attempt: int, started: float, response=None):
+        """
+        :param method: HTTP method of the call.
+        :param attempt: Number of attempts made so far.
+        :param started: time.monotonic() of the first attempt.
+        :param response: requests.Response of the last attempt, or None if it failed with a connection error.
+        :return: Seconds to wait before the next attempt, or None if the call should not be retried.
+        """
+        if attempt >= self.max_attempts:
+            return None
+        if response is None:
+            if method not in self.methods:
+                return None
+        elif response.status_code not in self.statuses or (response.status_code != 429 and method not in self.methods):
+            return None
+
+        delay = _retry_after(response) if response is not None else None
+        if delay is None:
+            delay = random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+        if time.monotonic() + delay - started > self.budget:
+            return None
+        return delay
+
+
+# policy used by every HelixApi that was not given one.
+DEFAULT_RETRY = RetryPolicy()
@@ -0,0 +1,384 @@
+import json
+import mmap
+import os
+import threading
+import time
+from array import array
+from bisect import bisect_left
+
+from requests import RequestException
+
+from helix.exceptions import PandaTwitchException
+from helix.graph import IdTable
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+STORE_VERSION = 1
+
+GAME = "game"
+LANGUAGE = "language"
+
+# column files of the store and their array typecodes. Rows of one sweep are contiguous and sweeps are in time order.
+COLUMNS = {
+    "sweeps.time": "q",       # epoch seconds of each sweep
+    "sweeps.streams": "Q",    # end row of each sweep in the streams columns
+    "sweeps.top": "Q",        # end row of each sweep in top.game
+    "streams.user": "I",      # index into ids.users
+    "streams.game": "I",      # index into ids.games
+    "streams.language": "H",  # index into the languages of meta.json
+    "streams.viewers": "I",
+    "top.game": "I",          # index into ids.games, in rank order
+    "ids.users": "Q",
+    "ids.games": "Q",
+}
+
+
+def _field(record, name):
+    return record.get(name) if isinstance(record, dict) else getattr(record, name)
+
+
+def _read_meta(path):
+    with open(os.path.join(path, "meta.json")) as meta:
+        state = json.load(meta)
+    if state.get("version") != STORE_VERSION:
+        raise ValueError(f"Unsupported snapshot store version: {state.get('version')}")
+    return state
+
+
+class SnapshotStore(object):
+    """
+    Append-only columnar store of get_streams and get_top_games sweeps. Every column is a flat file of machine
+    integers, user and game ids are interned into dense indexes and languages into a small table, so a row costs 14
+    bytes. meta.json holds the row counts and is replaced atomically after every sweep; columns that run ahead of it
+    after a crash are cut back when the store is opened.
+    """
+
+    def __init__(self, path: str):
+        """
+        :param path: Directory of the store, created if missing.
+        """
+        self.path = path
+        os.makedirs(path, exist_ok=True)
+        self.users = IdTable()
+        self.games = IdTable()
+        self.languages = []
+        self._language_index = {}
+        self.counts = dict.fromkeys(COLUMNS, 0)
+        self._lock = threading.Lock()
+        if os.path.exists(os.path.join(path, "meta.json")):
+            self._load()
+
+    def _file(self, name):
+        return os.path.join(self.path, name)
+
+    def _load(self):
+        state = _read_meta(self.path)
+        self.counts.update(state["counts"])
+        for name, typecode in COLUMNS.items():
+            with open(self._file(name), "r+b") as column:
+                column.truncate(self.counts[name] * array(typecode).itemsize)
+        for table, name in ((self.users, "ids.users"), (self.games, "ids.games")):
+            with open(self._file(name), "rb") as ids:
+                table.ids.fromfile(ids, self.counts[name])
+            table._rebuild()
+        self.languages = state["languages"]
+        self._language_index = {language: index for index, language in enumerate(self.languages)}
+
+    def _language(self, language):
+        index = self._language_index.get(language)
+        if index is None:
+            index = self._language_index[language] = len(self.languages)
+            self.languages.append(language)
+        return index
+
+    def _append(self, columns):
+        for name, values in columns.items():
+            with open(self._file(name), "ab") as column:
+                values.tofile(column)
+            self.counts[name] += len(values)
+
+    def append(self, streams=(), top_games=(), timestamp: float = None):
+        """
+        Appends one sweep.
+
+        :param streams: Stream records or dicts of get_streams.
+        :param top_games: Game records or dicts of get_top_games, in rank order.
+        :param timestamp: Epoch seconds of the sweep. Default: now.
+        :return: None
+        """
+        timestamp = int(time.time() if timestamp is None else timestamp)
+        with self._lock:
+            if self.counts["sweeps.time"] and timestamp < self.last_sweep_time:
+                raise ValueError("Sweeps must be appended in time order.")
+            saved_users, saved_games = len(self.users), len(self.games)
+            columns = {"streams.user": array("I"), "streams.game": array("I"), "streams.language": array("H"),
+                       "streams.viewers": array("I")}
+            for stream in streams:
+                columns["streams.user"].append(self.users.intern(_field(stream, "user_id")))
+                # streams without a category have an empty game_id, stored as game 0.
+                columns["streams.game"].append(self.games.intern(_field(stream, "game_id") or 0))
+                columns["streams.language"].append(self._language(_field(stream, "language") or ""))
+                columns["streams.viewers"].append(_field(stream, "viewer_count") or 0)
+            columns["top.game"] = array("I", (self.games.intern(_field(game, "id")) for game in top_games))
+            columns["ids.users"] = self.users.ids[saved_users:]
+            columns["ids.games"] = self.games.ids[saved_games:]
+
+            rows = self.counts["streams.user"] + len(columns["streams.user"])
+            top_rows = self.counts["top.game"] + len(columns["top.game"])
+            columns["sweeps.time"] = array("q", [timestamp])
+            columns["sweeps.streams"] = array("Q", [rows])
+            columns["sweeps.top"] = array("Q", [top_rows])
+            self._append(columns)
+            self._save_meta()
+
+    def _save_meta(self):
+        state = {"version": STORE_VERSION, "counts": self.counts, "languages": self.languages}
+        with open(self._file("meta.json.tmp"), "w") as output:
+            json.dump(state, output)
+        os.replace(self._file("meta.json.tmp"), self._file("meta.json"))
+
+    @property
+    def last_sweep_time(self):
+        with open(self._file("sweeps.time"), "rb") as times:
+            times.seek((self.counts["sweeps.time"] - 1) * 8)
+            return array("q", times.read(8))[0]
+
+
+class SnapshotRecorder(object):
+    """
+    Records a sweep of every live stream and the top games into a SnapshotStore at a fixed interval.
+    """
+
+    def __init__(self, streams, games, store: SnapshotStore, interval: float = 60.0, top_games: int = 100,
+                 language: str = None):
+        """
+        :param streams: TwitchStreams used for the sweeps.
+        :param games: TwitchGames used for the sweeps.
+        :param store: SnapshotStore the sweeps are appended to.
+        :param interval: Seconds between the start of two sweeps.
+        :param top_games: Top games recorded per sweep.
+        :param language: Only record streams of this language. Default: every stream.
+        """
+        self.streams = streams
+        self.games = games
+        self.store = store
+        self.interval = interval
+        self.top_games = top_games
+        self.language = language
+        self.sweeps = 0
+        self._stop = threading.Event()
+        self._thread = None
+
+    def sweep(self):
+        """
+        Walks get_streams and get_top_games once and appends the result.
+
+        :return: Number of streams recorded, or None if the sweep failed and was skipped.
+        """
+        timestamp = time.time()
+        try:
+            streams = list(self.streams.iter_streams(language=self.language))
+            top_games = list(self.games.iter_top_games(max_items=self.top_games))
+        except (RequestException, PandaTwitchException):
+            return None
+        self.store.append(streams, top_games, timestamp)
+        self.sweeps += 1
+        return len(streams)
+
+    def run(self):
+        """
+        Sweeps until stop is called.
+
+        :return: None
+        """
+        while not self._stop.is_set():
+            started = time.monotonic()
+            self.sweep()
+            self._stop.wait(max(0.0, self.interval - (time.monotonic() - started)))
+
+    def start(self):
+        """
+        Runs the recorder in a background thread.
+
+        :return: None
+        """
+        self._stop.clear()
+        self._thread = threading.Thread(target=self.run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """
+        Stops the recorder after the current sweep.
+
+        :return: None
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+
+class SnapshotReader(object):
+    """
+    Reads a SnapshotStore through memory maps, so weeks of sweeps are scanned without loading them into RAM. Range
+    queries bisect the sweep times; aggregations use NumPy when it is installed.
+    """
+
+    def __init__(self, path: str, use_numpy: bool = None):
+        """
+        :param path: Directory of the store.
+        :param use_numpy: Aggregate with NumPy. Default: when NumPy is installed.
+        """
+        self.path = path
+        self.use_numpy = numpy is not None if use_numpy is None else use_numpy
+        if self.use_numpy and numpy is None:
+            raise ImportError("use_numpy needs NumPy to be installed.")
+        self._maps = {}
+        self.columns = {}
+        self.refresh()
+
+    def refresh(self):
+        """
+        Maps the sweeps appended since the reader was opened.
+
+        :return: None
+        """
+        self.close()
+        state = _read_meta(self.path)
+        self.languages = state["languages"]
+        for name, typecode in COLUMNS.items():
+            count = state["counts"][name]
+            if not count:
+                # an empty file cannot be mapped.
+                self.columns[name] = memoryview(array(typecode))
+                continue
+            with open(os.path.join(self.path, name), "rb") as column:
+                self._maps[name] = mmap.mmap(column.fileno(), 0, access=mmap.ACCESS_READ)
+            self.columns[name] = memoryview(self._maps[name]).cast(typecode)[:count]
+        self._user_ids = self.columns["ids.users"]
+        self._game_ids = self.columns["ids.games"]
+
+    def close(self):
+        for column in self.columns.values():
+            column.release()
+        for mapped in self._maps.values():
+            mapped.close()
+        self._maps = {}
+        self.columns = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _sweep_range(self, start, end):
+        times = self.columns["sweeps.time"]
+        first = 0 if start is None else bisect_left(times, int(start))
+        last = len(times) if end is None else bisect_left(times, int(end))
+        return first, max(first, last)
+
+    def _rows(self, sweep, column="sweeps.streams"):
+        ends = self.columns[column]
+        return (ends[sweep - 1] if sweep else 0), ends[sweep]
+
+    def sweep_times(self, start: float = None, end: float = None):
+        """
+        :param start: Epoch seconds, inclusive. Default: the first sweep.
+        :param end: Epoch seconds, exclusive. Default: the last sweep.
+        :return: Times of the sweeps in the range.
+        """
+        first, last = self._sweep_range(start, end)
+        return self.columns["sweeps.time"][first:last].tolist()
+
+    def streams(self, start: float = None, end: float = None):
+        """
+        :param start: Epoch seconds, inclusive. Default: the first sweep.
+        :param end: Epoch seconds, exclusive. Default: the last sweep.
+        :return: Generator of (timestamp, user_id, game_id, language, viewer_count) rows.
+        """
+        columns = self.columns
+        users, games, languages, viewers = (columns["streams.user"], columns["streams.game"],
+                                            columns["streams.language"], columns["streams.viewers"])
+        first, last = self._sweep_range(start, end)
+        for sweep in range(first, last):
+            timestamp = columns["sweeps.time"][sweep]
+            low, high = self._rows(sweep)
+            for row in range(low, high):
+                game_id = self._game_ids[games[row]]
+                yield (timestamp, str(self._user_ids[users[row]]), str(game_id) if game_id else "",
+                       self.languages[languages[row]], viewers[row])
+
+    def top_games(self, timestamp: float):
+        """
+        :param timestamp: Epoch seconds; the last sweep at or before it is used.
+        :return: Game ids in rank order.
+        """
+        sweep = bisect_left(self.columns["sweeps.time"], int(timestamp) + 1) - 1
+        if sweep < 0:
+            return []
+        low, high = self._rows(sweep, "sweeps.top")
+        return [str(self._game_ids[game]) for game in self.columns["top.game"][low:high]]
+
+    def _keys(self, by):
+        if by == GAME:
+            return self.columns["streams.game"], [str(game_id) if game_id else "" for game_id in self._game_ids]
+        if by == LANGUAGE:
+            return self.columns["streams.language"], self.languages
+        raise ValueError(f"Unknown aggregation key: {by}")
+
+    def _sweep_totals(self, by, first, last):
+        codes, names = self._keys(by)
+        viewers = self.columns["streams.viewers"]
+        for sweep in range(first, last):
+            low, high = self._rows(sweep)
+            if self.use_numpy:
+                sweep_codes = numpy.asarray(codes[low:high])
+                totals = numpy.bincount(sweep_codes, weights=numpy.asarray(viewers[low:high]), minlength=len(names))
+                present = numpy.flatnonzero(numpy.bincount(sweep_codes, minlength=len(names)))
+                yield sweep, zip(present.tolist(), totals[present].astype(numpy.int64).tolist())
+            else:
+                totals = {}
+                for code, count in zip(codes[low:high], viewers[low:high]):
+                    totals[code] = totals.get(code, 0) + count
+                yield sweep, totals.items()
+
+    def viewer_series(self, by: str = GAME, start: float = None, end: float = None):
+        """
+        Total viewers per game or language on every sweep of a range, e.g. to chart viewer trends.
+
+        :param by: GAME or LANGUAGE.
+        :param start: Epoch seconds, inclusive. Default: the first sweep.
+        :param end: Epoch seconds, exclusive. Default: the last sweep.
+        :return: (sweep times, {game id or language: array of per-sweep viewer totals aligned with the times})
+        """
+        _, names = self._keys(by)
+        first, last = self._sweep_range(start, end)
+        times = self.columns["sweeps.time"][first:last].tolist()
+        series = {}
+        for sweep, totals in self._sweep_totals(by, first, last):
+            for code, total in totals:
+                values = series.get(code)
+                if values is None:
+                    values = series[code] = array("Q", bytes(8 * len(times)))
+                values[sweep - first] = total
+        return times, {names[code]: values for code, values in series.items()}
+
+    def viewer_totals(self, by: str = GAME, start: float = None, end: float = None):
+        """
+        :param by: GAME or LANGUAGE.
+        :param start: Epoch seconds, inclusive. Default: the first sweep.
+        :param end: Epoch seconds, exclusive. Default: the last sweep.
+        :return: {game id or language: (sum of viewers over the sweeps, peak viewers of one sweep)}
+        """
+        _, names = self._keys(by)
+        sums, peaks = {}, {}
+        for _, totals in self._sweep_totals(by, *self._sweep_range(start, end)):
+            for code, total in totals:
+                sums[code] = sums.get(code, 0) + total
+                if total > peaks.get(code, 0):
+                    peaks[code] = total
+        return {names[code]: (total, peaks.get(code, 0)) for code, total in sums.items()}
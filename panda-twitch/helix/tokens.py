@@ -0,0 +1,201 @@
+import threading
+import time
+
+from helix.decoder import decode_response
+from helix.exceptions import TwitchAuthenticationException
+from helix.transport import HelixTransport
+
+TOKEN_URL = "https://id.twitch.tv/oauth2/token"
+VALIDATE_URL = "https://id.twitch.tv/oauth2/validate"
+REVOKE_URL = "https://id.twitch.tv/oauth2/revoke"
+
+
+class TokenManager(object):
+    """
+    Owns the lifecycle of one OAuth/App access token: records its expiry, refreshes it in the background before it
+    expires and caches /oauth2/validate results.
+    """
+
+    def __init__(self, client_id, secret_id, token=None, refresh_token=None, scope_list=None,
+                 transport: HelixTransport = None, refresh_margin: float = 300, validate_interval: float = 3600):
+        """
+        :param client_id: Application client id.
+        :param secret_id: Application client secret.
+        :param token: Existing token, if any. Its expiry is learned on the first validate().
+        :param refresh_token: Refresh token of a user token. Without one, only app access tokens are refreshed, by
+                              fetching a new one; an expired user token raises TwitchAuthenticationException.
+        :param scope_list: Scopes requested when fetching a new token.
+        :param transport: Transport used for the id.twitch.tv calls. Default: the shared HelixTransport.
+        :param refresh_margin: Seconds before expiry that the token is refreshed in the background.
+        :param validate_interval: Seconds a validate() result is reused before asking Twitch again.
+        """
+        self.client_id = client_id
+        self.secret_id = secret_id
+        self.refresh_token = refresh_token
+        self.scope_list = scope_list
+        self.transport = transport or HelixTransport.default()
+        self.refresh_margin = refresh_margin
+        self.validate_interval = validate_interval
+
+        self._token = token
+        self.expires_at = None
+        # True for app access tokens, False for user tokens, None while unknown. Learned from validate().
+        self.app_token = None
+        # ID of the user a user token belongs to, None for app tokens or while unknown. Learned from validate() and
+        # kept across refreshes, which renew the token of the same user.
+        self.user_id = None
+        self._validation = None
+        self._validated_at = None
+        # bumped on every new token so waiting refreshers can tell one already happened.
+        self._generation = 0
+        self._refresh_lock = threading.Lock()
+        self._timer = None
+
+    @property
+    def token(self):
+        """
+        The current token. A token that already expired is refreshed before it is returned.
+        """
+        if self.expired:
+            return self.refresh()
+        return self._token
+
+    @property
+    def expired(self):
+        return self.expires_at is not None and time.time() >= self.expires_at
+
+    @property
+    def current(self):
+        """
+        The current token as is, without refreshing it.
+        """
+        return self._token
+
+    def set_token(self, token, expires_in: float = None, refresh_token=None):
+        """
+        Stores a token and schedules its background refresh.
+
+        :param token: New token.
+        :param expires_in: Seconds until the token expires, as returned by Twitch. None if unknown.
+        :param refresh_token: New refresh token, if Twitch returned one.
+        :return: None
+        """
+        self._token = token
+        self.expires_at = time.time() + expires_in if expires_in else None
+        if refresh_token is not None:
+            self.refresh_token = refresh_token
+        self.app_token = None
+        self.user_id = None
+        self._validation = None
+        self._validated_at = None
+        self._generation += 1
+        self._schedule_refresh()
+
+    def _schedule_refresh(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self.expires_at is None:
+            return
+
+        self._timer = threading.Timer(max(0.0, self.expires_at - self.refresh_margin - time.time()),
+                                      self._background_refresh)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _background_refresh(self):
+        try:
+            self.refresh()
+        except Exception:
+            # the next access of an expired token retries in the foreground.
+            pass
+
+    def fetch(self):
+        """
+        Requests a new token from /oauth2/token, using the refresh token when there is one.
+
+        :return: New token.
+        """
+        if self.refresh_token is not None:
+            params = {
+                "client_id": self.client_id,
+                "client_secret": self.secret_id,
+                "grant_type": "refresh_token",
+                "refresh_token": self.refresh_token,
+            }
+        else:
+            params = {
+                "client_id": self.client_id,
+                "client_secret": self.secret_id,
+                "grant_type": "client_credentials",
+                "scope": self.scope_list,
+            }
+
+        response = self.transport.post(TOKEN_URL, data=params)
+        if response.status_code != 200:
+            raise TwitchAuthenticationException(f"Could not get a token: {response.status_code} {response.text}")
+
+        jd = decode_response(response)
+        user_id = self.user_id
+        self.set_token(jd["access_token"], jd.get("expires_in"), jd.get("refresh_token"))
+        self.app_token = params["grant_type"] == "client_credentials"
+        if not self.app_token:
+            self.user_id = user_id
+        return self._token
+
+    def refresh(self):
+        """
+        Refreshes the token. Concurrent callers share a single refresh instead of each requesting a token. A user token
+        without a refresh token cannot be renewed and raises TwitchAuthenticationException.
+
+        :return: New token.
+        """
+        generation = self._generation
+        with self._refresh_lock:
+            if self._generation != generation:
+                return self._token
+            # a client_credentials token would silently replace the user and break every user scoped endpoint.
+            if self.refresh_token is None and self.app_token is False:
+                raise TwitchAuthenticationException("The user token expired and there is no refresh token to renew "
+                                                    "it with.")
+            return self.fetch()
+
+    def validate(self, force: bool = False):
+        """
+        Validates the token with /oauth2/validate. The result is cached for validate_interval seconds.
+
+        :param force: Ask Twitch even if a cached result is still fresh.
+        :return: client_id, login, scopes, user_id, expires_in
+        """
+        if not force and self._validated_at is not None \
+                and time.monotonic() - self._validated_at < self.validate_interval:
+            return self._validation
+
+        token = self.token
+        response = self.transport.get(VALIDATE_URL, headers={"Authorization": f"OAuth {token}"})
+        if response.status_code == 401:
+            raise TwitchAuthenticationException("The token is invalid or has expired.")
+
+        self._validation = decode_response(response)
+        self._validated_at = time.monotonic()
+        # app access tokens are the only ones validated without a user_id.
+        self.app_token = not self._validation.get("user_id")
+        self.user_id = self._validation.get("user_id")
+        if self.expires_at is None and self._validation.get("expires_in"):
+            self.expires_at = time.time() + self._validation["expires_in"]
+            self._schedule_refresh()
+        return self._validation
+
+    def revoke(self):
+        """
+        Revokes the current token.
+
+        :return: None
+        """
+        params = {
+            "client_id": self.client_id,
+            "token": self._token
+        }
+
+        self.transport.post(REVOKE_URL, params=params)
+        self.set_token(None)
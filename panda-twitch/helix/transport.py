@@ -0,0 +1,88 @@
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+class HelixTransport(object):
+    """
+    Pooled, keep-alive HTTP transport shared by the Helix resource classes.
+
+    A single transport keeps its TCP/TLS connections open between calls, so only the first request to a host pays for
+    the handshake.
+    """
+    _default = None
+    _default_lock = threading.Lock()
+
+    def __init__(self, pool_connections: int = 10, pool_maxsize: int = 10, pool_block: bool = False,
+                 timeout: float = 10.0, connect_timeout: float = None):
+        """
+        :param pool_connections: Number of hosts to keep connection pools for.
+        :param pool_maxsize: Maximum number of keep-alive connections kept per host.
+        :param pool_block: If true, callers wait for a free connection instead of opening one past pool_maxsize.
+        :param timeout: Read timeout in seconds applied to every request that does not pass its own.
+        :param connect_timeout: Connect timeout in seconds. Defaults to the read timeout.
+        """
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.timeout = (connect_timeout or timeout, timeout)
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=pool_block)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    @classmethod
+    def default(cls):
+        """
+        Returns the process wide transport used by every HelixApi that was not given one explicitly.
+
+        :return: HelixTransport
+        """
+        if cls._default is None:
+            with cls._default_lock:
+                if cls._default is None:
+                    cls._default = cls()
+        return cls._default
+
+    def request(self, method: str, url: str, **kwargs):
+        """
+        Sends a request over the pooled session.
+
+        :param method: HTTP method.
+        :param url: Full URL of the request.
+        :param kwargs: Any keyword argument accepted by requests.Session.request
+        :return: requests.Response
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        return self.session.request(method, url, **kwargs)
+
+    def get(self, url: str, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs):
+        return self.request("POST", url, **kwargs)
+
+    def put(self, url: str, **kwargs):
+        return self.request("PUT", url, **kwargs)
+
+    def patch(self, url: str, **kwargs):
+        return self.request("PATCH", url, **kwargs)
+
+    def delete(self, url: str, **kwargs):
+        return self.request("DELETE", url, **kwargs)
+
+    def close(self):
+        """
+        Closes every pooled connection.
+
+        :return: None
+        """
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
@@ -0,0 +1,60 @@
+import json
+import threading
+
+import pytest
+import requests
+
+from helix.tokens import VALIDATE_URL
+
+
+class FakeTransport(object):
+    """
+    Records every request and answers with an empty data array, or with the result of a handler.
+    """
+
+    def __init__(self, handler=None):
+        self.handler = handler
+        self.requests = []
+
+    def request(self, method, url, **kwargs):
+        self.requests.append((method, url, kwargs))
+        status, body = self.handler(method, url, **kwargs) if self.handler else (200, {"data": []})
+        response = requests.Response()
+        response.status_code = status
+        response.url = url
+        response._content = json.dumps(body).encode()
+        return response
+
+    def close(self):
+        pass
+
+
+class TokenTransport(FakeTransport):
+    """
+    id.twitch.tv stand in: validate answers with the given user_id, token requests hand out new-token.
+    """
+
+    def __init__(self, user_id=None):
+        super().__init__(self.answer)
+        self.user_id = user_id
+        self.threads = []
+
+    def answer(self, method, url, **kwargs):
+        self.threads.append(threading.get_ident())
+        if url == VALIDATE_URL:
+            body = {"client_id": "client", "scopes": [], "expires_in": 3600}
+            if self.user_id is not None:
+                body.update(user_id=self.user_id, login="user")
+            return 200, body
+        return 200, {"access_token": "new-token", "expires_in": 3600, "token_type": "bearer"}
+
+    def get(self, url, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request("POST", url, **kwargs)
+
+
+@pytest.fixture
+def transport():
+    return FakeTransport()
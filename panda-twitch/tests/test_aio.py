@@ -0,0 +1,61 @@
+import asyncio
+import threading
+import warnings
+
+import pytest
+
+from benchmarks.mock_server import MockHelixServer
+from helix.aio import AsyncHelixTransport, AsyncTwitchStreams
+from helix.exceptions import TwitchAuthenticationException
+from helix.tokens import TokenManager
+from tests.conftest import FakeTransport, TokenTransport
+
+pytest.importorskip("aiohttp")
+
+
+def test_default_transport_survives_a_second_event_loop():
+    with MockHelixServer() as server:
+        async def fetch(close):
+            streams = AsyncTwitchStreams("client", "secret", token="token")
+            streams.base_url = server.base_url
+            page = await streams.get_streams(user_id="1")
+            if close:
+                await streams.transport.close()
+            return page.status_code
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            assert asyncio.run(fetch(close=True)) == 200
+            assert asyncio.run(fetch(close=True)) == 200
+        # a loop that ended without closing its session does not break the next one.
+        assert asyncio.run(fetch(close=False)) == 200
+        assert asyncio.run(fetch(close=True)) == 200
+    assert AsyncHelixTransport.default() is AsyncHelixTransport.default()
+
+
+class RejectingTransport(FakeTransport):
+    def __init__(self):
+        super().__init__(lambda method, url, **kwargs: (403, {"status": 403, "message": "invalid client secret"}))
+
+    def post(self, url, **kwargs):
+        return self.request("POST", url, **kwargs)
+
+
+def test_failed_oauth_token_request_raises():
+    streams = AsyncTwitchStreams("client", "secret",
+                                 token_manager=TokenManager("client", "secret", transport=RejectingTransport()))
+    with pytest.raises(TwitchAuthenticationException):
+        asyncio.run(streams.get_oauth_token())
+
+
+def test_oauth_token_is_fetched_off_the_loop_as_an_app_token():
+    transport = TokenTransport()
+    streams = AsyncTwitchStreams("client", "secret", token_manager=TokenManager("client", "secret", transport=transport))
+
+    async def fetch():
+        return threading.get_ident(), await streams.get_oauth_token()
+
+    loop_thread, token = asyncio.run(fetch())
+    assert token == "new-token"
+    assert streams.token_manager.app_token is True
+    assert loop_thread not in transport.threads
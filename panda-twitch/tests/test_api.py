@@ -0,0 +1,57 @@
+from helix.api import _lookup_values
+from helix.resources.streams import TwitchStreams
+from helix.resources.users import TwitchUsers
+from helix.scopes import USER_EDIT_BROADCAST
+
+
+def _sent(transport, name):
+    return [value for _, _, kwargs in transport.requests for key, value in kwargs.get("params") or () if key == name]
+
+
+def test_lookup_values_dedupes_in_order():
+    assert _lookup_values(["1", "1", "2", "Foo", "foo"]) == ["1", "2", "Foo"]
+    assert _lookup_values("1") == "1"
+    assert _lookup_values(None) is None
+
+
+def test_generator_ids_are_sent(transport):
+    streams = TwitchStreams("client", "secret", token="token", transport=transport)
+    streams.get_streams(user_id=(str(index) for index in range(5)))
+    assert _sent(transport, "user_id") == ["0", "1", "2", "3", "4"]
+
+
+def test_generator_ids_over_batch_are_sent(transport):
+    streams = TwitchStreams("client", "secret", token="token", transport=transport)
+    streams.get_streams(user_id=(str(index) for index in range(150)))
+    assert sorted(_sent(transport, "user_id"), key=int) == [str(index) for index in range(150)]
+
+
+def test_duplicate_ids_are_sent_once(transport):
+    streams = TwitchStreams("client", "secret", token="token", transport=transport)
+    streams.get_streams(user_id=["1", "1", "2"])
+    assert _sent(transport, "user_id") == ["1", "2"]
+
+
+def test_flight_key_separates_hosts_and_pools():
+    from helix.credentials import CredentialPool
+
+    twitch = TwitchStreams("client", "secret", token="token")
+    local = TwitchStreams("client", "secret", token="token")
+    local.base_url = "http://localhost:9999/helix"
+    params = {"params": [("user_id", "1")]}
+    assert twitch._flight_key(twitch.base_url + "/streams", params, "token") != \
+        local._flight_key(local.base_url + "/streams", params, "token")
+
+    first = TwitchStreams("client", "secret", credential_pool=CredentialPool([("a", "secret", "token-a")]))
+    second = TwitchStreams("client", "secret", credential_pool=CredentialPool([("b", "secret", "token-b")]))
+    assert first._flight_key(first.base_url + "/streams", params, None) != \
+        second._flight_key(second.base_url + "/streams", params, None)
+
+
+def test_update_user_extensions_sends_changed_kinds(transport):
+    users = TwitchUsers("client", "secret", token="token", transport=transport, scopes=[USER_EDIT_BROADCAST])
+    panel = {"1": {"active": True, "id": "extension", "version": "1.1.0"}}
+    users.update_user_extensions(panel=panel)
+    method, url, kwargs = transport.requests[-1]
+    assert (method, url) == ("PUT", users.base_url + "/users/extensions")
+    assert kwargs["json"] == {"data": {"panel": panel}}
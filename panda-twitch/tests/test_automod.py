@@ -0,0 +1,69 @@
+import json
+import threading
+
+import pytest
+import requests
+
+from helix.automod import AutoModChecker, MAX_AUTOMOD_BATCH
+
+
+class Moderation(object):
+    def __init__(self, gate=None):
+        self.batches = []
+        self.gate = gate
+
+    def check_automod_statuses(self, broadcaster_id, messages):
+        if self.gate is not None:
+            self.gate.wait()
+        self.batches.append(messages)
+        response = requests.Response()
+        response.status_code = 200
+        response._content = json.dumps(
+            {"data": [{"msg_id": msg_id, "is_permitted": True} for msg_id, _, _ in messages]}).encode()
+        return response
+
+
+def test_batch_size_is_capped():
+    with pytest.raises(ValueError):
+        AutoModChecker(Moderation(), "1", batch_size=MAX_AUTOMOD_BATCH + 1)
+
+
+def test_check_blocks_while_batches_are_in_flight():
+    gate = threading.Event()
+    checker = AutoModChecker(Moderation(gate), "1", batch_size=1, max_latency=0.001, max_workers=1, queue_size=2)
+    futures = [checker.check(f"msg-{index}", "hello", "2") for index in range(3)]
+    blocked = threading.Thread(target=lambda: futures.append(checker.check("msg-3", "hello", "2")))
+    blocked.start()
+    # one batch in flight and two messages queued behind it: the fourth check waits for a slot.
+    blocked.join(0.1)
+    assert blocked.is_alive()
+    gate.set()
+    blocked.join(1)
+    checker.close()
+    assert [future.result(timeout=1) for future in futures] == [True] * 4
+
+
+def test_check_racing_close_never_hangs():
+    for _ in range(20):
+        checker = AutoModChecker(Moderation(), "1", max_latency=0.001)
+        futures = []
+        errors = []
+        start = threading.Event()
+
+        def producer():
+            start.wait()
+            for index in range(200):
+                try:
+                    futures.append(checker.check(f"msg-{index}", "hello", "2"))
+                except RuntimeError as e:
+                    errors.append(e)
+                    return
+
+        thread = threading.Thread(target=producer)
+        thread.start()
+        start.set()
+        checker.close()
+        thread.join()
+        # every Future queued before close resolves; later checks are refused.
+        assert all(future.result(timeout=1) for future in futures)
+        assert len(futures) == 200 or errors
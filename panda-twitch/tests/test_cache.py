@@ -0,0 +1,18 @@
+from helix.cache import ResponseCache
+from helix.credentials import CredentialPool
+from helix.resources.games import TwitchGames
+
+
+def test_pooled_entries_are_not_shared_between_pools_or_hosts(transport):
+    cache = ResponseCache()
+    clients = []
+    for name in ("first", "second"):
+        pool = CredentialPool([(f"{name}-client", "secret", "token")], transport=transport)
+        clients.append(TwitchGames("client", "secret", transport=transport, cache=cache, credential_pool=pool))
+    other_host = TwitchGames("client", "secret", transport=transport, cache=cache, credential_pool=pool)
+    other_host.base_url = "http://127.0.0.1:8080/helix"
+
+    for games in clients + [other_host, clients[0]]:
+        games.get_games(game_id="33")
+    assert len(transport.requests) == 3
+    assert cache.stats["hits"] == 1
@@ -0,0 +1,11 @@
+from helix.client import TwitchClient
+from helix.coalesce import SingleFlight
+from helix.resources.streams import TwitchStreams
+
+
+def test_clients_of_one_app_share_limiter_and_coalescer(transport):
+    first = TwitchClient("shared-client", "secret", token="token", transport=transport)
+    second = TwitchClient("shared-client", "secret", token="token", transport=transport)
+    bare = TwitchStreams("shared-client", "secret", token="token", transport=transport)
+    assert first.streams.rate_limiter is second.users.rate_limiter is bare.rate_limiter is first.rate_limiter
+    assert first.single_flight is second.single_flight is SingleFlight.default()
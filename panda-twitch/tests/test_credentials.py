@@ -0,0 +1,33 @@
+import asyncio
+import threading
+
+from helix.aio import AsyncTwitchGames
+from helix.credentials import CredentialPool
+from tests.conftest import FakeTransport, TokenTransport
+
+
+class AsyncTransport(object):
+    def __init__(self, status=200):
+        self.status = status
+        self.sync = FakeTransport(lambda method, url, **kwargs: (self.status, {"data": []}))
+
+    async def request(self, method, url, **kwargs):
+        return self.sync.request(method, url, **kwargs)
+
+
+def test_async_pool_fetches_and_refreshes_tokens_off_the_event_loop():
+    tokens = TokenTransport()
+    pool = CredentialPool([("client", "secret")], transport=tokens)
+    transport = AsyncTransport(status=401)
+    games = AsyncTwitchGames("client", "secret", transport=transport, credential_pool=pool)
+
+    async def call():
+        await games.get_games(game_id="33")
+        return threading.get_ident()
+
+    loop_thread = asyncio.run(call())
+    # the first token fetch and the refresh after the 401.
+    assert len(tokens.threads) >= 2
+    assert loop_thread not in tokens.threads
+    assert pool.credentials[0].in_flight == 0
+    assert transport.sync.requests[0][2]["headers"]["Authorization"] == "Bearer new-token"
@@ -0,0 +1,18 @@
+import threading
+
+from helix.eventsub import EventSubReceiver
+
+
+def test_stop_before_start_returns():
+    receiver = EventSubReceiver("secret", port=0)
+    stopper = threading.Thread(target=receiver.stop, daemon=True)
+    stopper.start()
+    stopper.join(2)
+    assert not stopper.is_alive()
+
+
+def test_stop_after_start_and_again():
+    receiver = EventSubReceiver("secret", port=0)
+    receiver.start()
+    receiver.stop()
+    receiver.stop()
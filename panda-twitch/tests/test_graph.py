@@ -0,0 +1,48 @@
+import shutil
+
+from helix.graph import FollowCrawler, FOLLOWING
+from helix.resources.users import TwitchUsers
+from tests.conftest import FakeTransport
+
+
+def follows_handler(pages, on_page=None):
+    """
+    Serves user 1 following users 100.. over several pages, calling on_page before each one.
+    """
+    calls = []
+
+    def handler(method, url, params=(), **kwargs):
+        params = dict(params)
+        page = int(params.get("after") or 0)
+        calls.append(page)
+        if on_page is not None:
+            on_page(page)
+        data = [{"from_id": "1", "from_name": "one", "to_id": str(100 + page), "to_name": f"user_{page}",
+                 "followed_at": "2020-10-18T00:00:00Z"}]
+        pagination = {"cursor": str(page + 1)} if page + 1 < pages else {}
+        return 200, {"total": pages, "data": data, "pagination": pagination}
+
+    return handler, calls
+
+
+def test_checkpoint_keeps_walks_in_flight(tmp_path):
+    prefix = str(tmp_path / "crawl" / "follows")
+    (tmp_path / "crawl").mkdir()
+    snapshot = tmp_path / "snapshot"
+
+    def crash_copy(page):
+        # a copy of the checkpoint files taken mid-walk stands in for a process killed at this point.
+        if page == 2:
+            shutil.copytree(tmp_path / "crawl", snapshot)
+
+    handler, _ = follows_handler(4, crash_copy)
+    users = TwitchUsers("client", "secret", token="token", transport=FakeTransport(handler))
+    FollowCrawler(users, checkpoint=prefix, directions=(FOLLOWING,), checkpoint_every=1, max_workers=1).crawl(["1"])
+
+    handler, calls = follows_handler(4)
+    users = TwitchUsers("client", "secret", token="token", transport=FakeTransport(handler))
+    resumed = FollowCrawler(users, checkpoint=str(snapshot / "follows"), directions=(FOLLOWING,), max_workers=1)
+    graph = resumed.crawl(["1"])
+
+    assert calls == [2, 3]
+    assert sorted(graph.following("1")) == ["100", "101", "102", "103"]
@@ -0,0 +1,17 @@
+import pytest
+
+from helix.models import Clip, Stream, Video
+
+
+def test_only_low_cardinality_fields_are_interned():
+    assert "broadcaster_id" not in Clip._interned
+    assert "user_id" not in Video._interned
+    stream = Stream.from_json({"id": "1", "user_id": "2", "game_id": "33", "language": "en", "tag_ids": ["a"]})
+    assert stream.language is Stream.from_json({"language": "".join(["e", "n"])}).language
+
+
+def test_records_compare_by_value_but_are_not_hashable():
+    data = {"id": "1", "user_id": "2", "tag_ids": ["a"]}
+    assert Stream.from_json(data) == Stream.from_json(dict(data))
+    with pytest.raises(TypeError):
+        hash(Stream.from_json(data))
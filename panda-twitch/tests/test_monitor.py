@@ -0,0 +1,27 @@
+from helix.exceptions import TwitchRateLimitException
+from helix.models import Page, Stream
+from helix.monitor import LIVE, StreamMonitor
+from tests.conftest import FakeTransport
+
+
+class FlakyStreams(object):
+    def __init__(self, failures):
+        self.failures = failures
+        self.transport = FakeTransport(lambda method, url, **kwargs: (200, {"data": [{"user_id": "1", "title": "hi"}]}))
+
+    def get_streams(self, user_id=None, first=None):
+        if self.failures:
+            self.failures -= 1
+            raise TwitchRateLimitException("Rate limit budget exhausted.")
+        return Page(self.transport.request("GET", "streams"), Stream)
+
+
+def test_failed_batch_keeps_its_state():
+    monitor = StreamMonitor(FlakyStreams(failures=1), ["1"])
+    events = []
+    monitor.on(LIVE, events.append)
+    monitor.sweep()
+    assert monitor.live == frozenset()
+    monitor.sweep()
+    assert monitor.live == {1}
+    assert [event.user_id for event in events] == ["1"]
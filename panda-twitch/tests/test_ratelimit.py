@@ -0,0 +1,35 @@
+from helix.ratelimit import RateLimiter
+from helix.resources.streams import TwitchStreams
+from helix.tokens import TokenManager
+from tests.conftest import TokenTransport
+
+
+def test_shared_limiter_survives_token_refresh():
+    streams = TwitchStreams("refreshing-client", "secret", token="first-token")
+    limiter = streams.rate_limiter
+    limiter.reserve()
+    streams.token = "second-token"
+    assert streams.rate_limiter is limiter
+    # the point taken before the refresh still counts against the bucket.
+    assert streams.rate_limiter._pending == 1
+    assert "first-token" not in repr(list(RateLimiter._shared))
+
+
+def test_user_tokens_of_one_app_get_their_own_limiter():
+    first = TwitchStreams("multi-user-client", "secret", token="token-a",
+                          token_manager=TokenManager("multi-user-client", "secret", "token-a",
+                                                     transport=TokenTransport(user_id="1")))
+    second = TwitchStreams("multi-user-client", "secret", token="token-b",
+                           token_manager=TokenManager("multi-user-client", "secret", "token-b",
+                                                      transport=TokenTransport(user_id="2")))
+    app = TwitchStreams("multi-user-client", "secret", token="app-token")
+    first.validate_token()
+    second.validate_token()
+    assert first.rate_limiter is not second.rate_limiter
+    assert app.rate_limiter not in (first.rate_limiter, second.rate_limiter)
+    # a refresh renews the same user's token, so it keeps draining the same bucket.
+    limiter = first.rate_limiter
+    first.token_manager.refresh_token = "refresh"
+    first.token_manager.fetch()
+    assert first.token == "new-token"
+    assert first.rate_limiter is limiter
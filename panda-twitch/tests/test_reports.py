@@ -0,0 +1,33 @@
+import io
+
+from helix.reports import AnalyticsReports
+
+
+class FakeAnalytics(object):
+    def iter_game_analytics(self, **filters):
+        return iter([{"game_id": "493057", "URL": "https://example.com/report.csv"}])
+
+
+CSV = ("Date,Game Name,Game Id,Live Views\n"
+       "2020-10-01,PUBG,493057,10\n"
+       "2020-10-02,PUBG,493057,20\n"
+       "2020-10-03,PUBG,493057,n/a\n"
+       "2020-10-04,PUBG,493057,\n")
+
+
+def make_reports():
+    reports = AnalyticsReports(FakeAnalytics(), chunk_rows=2, use_numpy=False)
+    reports._download = lambda report: (report, io.BytesIO(CSV.encode()))
+    return reports
+
+
+def test_column_types_are_kept_across_chunks():
+    chunks = list(make_reports().chunks())
+    assert [chunk.rows for chunk in chunks] == [2, 2]
+    for chunk in chunks:
+        assert chunk.columns["Game Id"] == ["493057"] * 2
+        assert chunk.columns["Live Views"].typecode == "d"
+
+
+def test_sum_by_id_column_uses_str_keys():
+    assert make_reports().sum_by("Game Id", ["Live Views"]) == {"493057": {"Live Views": 30.0}}
@@ -0,0 +1,40 @@
+from helix.exceptions import TwitchInternalServerException
+from helix.snapshots import SnapshotReader, SnapshotRecorder, SnapshotStore
+
+
+class FlakyStreams(object):
+    def __init__(self, failures):
+        self.failures = failures
+
+    def iter_streams(self, language=None):
+        if self.failures:
+            self.failures -= 1
+            raise TwitchInternalServerException("Internal Server Error")
+        return iter([{"user_id": "1", "game_id": "33", "language": "en", "viewer_count": 10}])
+
+
+class Games(object):
+    def iter_top_games(self, max_items=None):
+        return iter([{"id": "33"}])
+
+
+def test_failed_sweep_is_skipped(tmp_path):
+    recorder = SnapshotRecorder(FlakyStreams(failures=1), Games(), SnapshotStore(str(tmp_path)))
+    assert recorder.sweep() is None
+    assert recorder.sweep() == 1
+
+
+def test_recorder_thread_survives_failed_sweep(tmp_path):
+    recorder = SnapshotRecorder(FlakyStreams(failures=2), Games(), SnapshotStore(str(tmp_path)), interval=0.01)
+    recorder.start()
+    try:
+        for _ in range(500):
+            if recorder.sweeps >= 2:
+                break
+            recorder._stop.wait(0.01)
+        assert recorder._thread.is_alive()
+    finally:
+        recorder.stop()
+    assert recorder.sweeps >= 2
+    with SnapshotReader(str(tmp_path)) as reader:
+        assert reader.viewer_totals()["33"][0] == 10 * len(reader.sweep_times())
@@ -0,0 +1,58 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from helix.aio import AsyncTwitchStreams
+from helix.exceptions import TwitchAuthenticationException
+from helix.tokens import TokenManager, TOKEN_URL
+from tests.conftest import FakeTransport, TokenTransport
+
+
+def expire(manager):
+    manager.expires_at = time.time() - 1
+
+
+def test_expired_user_token_without_refresh_token_is_not_replaced():
+    transport = TokenTransport(user_id="141981764")
+    manager = TokenManager("client", "secret", "user-token", transport=transport)
+    manager.validate()
+    assert manager.app_token is False
+    expire(manager)
+    with pytest.raises(TwitchAuthenticationException):
+        manager.token
+    assert not [url for _, url, _ in transport.requests if url == TOKEN_URL]
+    assert manager.current == "user-token"
+
+
+def test_expired_app_token_is_refreshed():
+    manager = TokenManager("client", "secret", "app-token", transport=TokenTransport())
+    manager.validate()
+    assert manager.app_token is True
+    expire(manager)
+    assert manager.token == "new-token"
+
+
+def test_async_client_refreshes_off_the_event_loop():
+    sent = FakeTransport()
+
+    class AsyncTransport(object):
+        async def request(self, method, url, **kwargs):
+            return sent.request(method, url, **kwargs)
+
+    transport = TokenTransport()
+    manager = TokenManager("client", "secret", "app-token", transport=transport)
+    manager.validate()
+    expire(manager)
+    streams = AsyncTwitchStreams("client", "secret", transport=AsyncTransport(), token_manager=manager)
+
+    async def call():
+        response = await streams.get_streams(user_id="1")
+        return threading.get_ident(), response
+
+    loop_thread, response = asyncio.run(call())
+    assert response.ok
+    assert manager.current == "new-token"
+    assert transport.threads[-1] != loop_thread
+    assert sent.requests[0][2]["headers"]["Authorization"] == "Bearer new-token"